@@ -0,0 +1,137 @@
+"""
+Asyncio execution benchmark
+
+Runs queries through :class:`~Pool` backed by an in-process fake driver
+answering after a fixed latency, with 1, 10 and 100 queries in flight, and
+compares separate round trips with a pipelined batch.
+
+Run as ``python -m query_builder.benchmarks.bench_async [--queries N]``
+"""
+import argparse
+import asyncio
+import time
+
+from .. import fields
+from ..executors import AsyncConnection
+from ..executors import Pool
+from ..models import Model
+
+
+CONCURRENCY = (1, 10, 100)
+QUERIES = 1000
+# simulated network round trip, seconds
+LATENCY = 0.001
+
+
+class User(Model):
+    id_ = fields.Integer('id')
+    name = fields.Varchar('name', max_length=64)
+
+
+class FakeConnection(AsyncConnection):
+    """Answers every query with one row after ``LATENCY``"""
+    paramstyle = 'dollar'
+
+    async def fetch(self, sql, params):
+        await asyncio.sleep(LATENCY)
+        return ['id', 'name'], [(params[0], 'name')]
+
+    async def batches(self, sql, params, batch_size):
+        yield await self.fetch(sql, params)
+
+    async def pipeline(self, statements):
+        # one round trip for the whole batch
+        await asyncio.sleep(LATENCY)
+        return [
+            (['id', 'name'], [(params[0], 'name')])
+            for _, params in statements
+        ]
+
+    async def close(self):
+        pass
+
+
+async def _connect():
+    return FakeConnection()
+
+
+def _query(user, number):
+    return user.select(user.id_, user.name).where(user.id_ == number)
+
+
+async def bench_concurrency(in_flight, queries=QUERIES):
+    """
+    Measures throughput with ``in_flight`` concurrent queries
+
+    Args:
+        in_flight (int): Amount of concurrent queries and connections
+            (**required**)
+        queries (int): Amount of queries (``QUERIES`` - default)
+
+    Returns:
+        float: Queries per second
+    """
+    user = User('users')
+    pool = Pool(_connect, max_size=in_flight)
+    numbers = iter(range(queries))
+
+    async def worker():
+        for number in numbers:
+            await _query(user, number).fetch(pool)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(in_flight)))
+    elapsed = time.perf_counter() - started
+    await pool.close()
+
+    return queries / elapsed
+
+
+async def bench_pipeline(batch_size, queries=QUERIES):
+    """
+    Measures throughput of pipelined batches over a single connection
+
+    Args:
+        batch_size (int): Queries per pipeline (**required**)
+        queries (int): Amount of queries (``QUERIES`` - default)
+
+    Returns:
+        float: Queries per second
+    """
+    user = User('users')
+    pool = Pool(_connect, max_size=1)
+
+    started = time.perf_counter()
+    for start in range(0, queries, batch_size):
+        await pool.pipeline(
+            _query(user, number)
+            for number in range(start, min(start + batch_size, queries))
+        )
+    elapsed = time.perf_counter() - started
+    await pool.close()
+
+    return queries / elapsed
+
+
+async def _main(queries):
+    print('{:>10} {:>18} {:>18}'.format(
+        'in flight',
+        'concurrent, q/s',
+        'pipelined, q/s',
+    ))
+    for in_flight in CONCURRENCY:
+        print('{:>10} {:>18.0f} {:>18.0f}'.format(
+            in_flight,
+            await bench_concurrency(in_flight, queries),
+            await bench_pipeline(in_flight, queries),
+        ))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--queries', type=int, default=QUERIES)
+    asyncio.run(_main(parser.parse_args(argv).queries))
+
+
+if __name__ == '__main__':
+    main()
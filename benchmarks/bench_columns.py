@@ -0,0 +1,115 @@
+"""
+Columnar bulk load benchmark
+
+Compares loading rows one by one with :meth:`Model.insert_many` and
+:meth:`Model.copy_from` against loading whole columns with
+:meth:`Model.insert_columns` and :meth:`Model.copy_columns`, both from
+lists and, when NumPy is installed, from arrays.
+
+Run as ``python -m query_builder.benchmarks.bench_columns [--rows N]``
+"""
+import argparse
+import time
+
+from .. import fields
+from ..models import Model
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+ROWS = 1000000
+
+
+class Measurement(Model):
+    id_ = fields.BigInt('id')
+    sensor = fields.Integer('sensor')
+    level = fields.SmallInt('level')
+    label = fields.Varchar('label', max_length=16)
+
+
+def _consume(chunks):
+    size = 0
+    for chunk in chunks:
+        size += len(chunk[0] if isinstance(chunk, tuple) else chunk)
+
+    return size
+
+
+def cases(rows):
+    """
+    Lists benchmarked loads
+
+    Args:
+        rows (int): Amount of rows (**required**)
+
+    Yields:
+        tuple: Case name and callable returning generated data size
+    """
+    model = Measurement('measurements')
+    columns = {
+        'id_': list(range(rows)),
+        'sensor': [number % 1000 for number in range(rows)],
+        'level': [number % 100 for number in range(rows)],
+        'label': ['label {}'.format(number % 1000) for number in range(rows)],
+    }
+    dicts = [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    yield 'insert_many', lambda: _consume(model.insert_many(dicts))
+    yield 'insert_columns', lambda: _consume(model.insert_columns(columns))
+    yield 'insert_many_params', lambda: _consume(
+        model.insert_many(dicts, params=True),
+    )
+    yield 'insert_columns_params', lambda: _consume(
+        model.insert_columns(columns, params=True),
+    )
+
+    numeric = {attr: columns[attr] for attr in ('id_', 'sensor', 'level')}
+    numeric_dicts = [
+        dict(zip(numeric, values)) for values in zip(*numeric.values())
+    ]
+    yield 'copy_from_binary', lambda: _consume(
+        model.copy_from(numeric_dicts, format='binary')[1],
+    )
+    yield 'copy_columns_binary', lambda: _consume(
+        model.copy_columns(numeric, format='binary')[1],
+    )
+
+    if numpy is None:
+        return
+
+    arrays = {
+        'id_': numpy.arange(rows, dtype=numpy.int64),
+        'sensor': numpy.arange(rows, dtype=numpy.int32) % 1000,
+        'level': (numpy.arange(rows) % 100).astype(numpy.int16),
+        'label': numpy.array(columns['label']),
+    }
+    numeric_arrays = {attr: arrays[attr] for attr in numeric}
+
+    yield 'insert_columns_numpy', lambda: _consume(model.insert_columns(arrays))
+    yield 'copy_columns_binary_numpy', lambda: _consume(
+        model.copy_columns(numeric_arrays, format='binary')[1],
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=ROWS)
+    rows = parser.parse_args(argv).rows
+
+    print('{:<28} {:>10} {:>14}'.format('case', 'total, s', 'ns/row'))
+    for name, func in cases(rows):
+        started = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - started
+        print('{:<28} {:>10.3f} {:>14.1f}'.format(
+            name,
+            seconds,
+            seconds / rows * 1e9,
+        ))
+
+
+if __name__ == '__main__':
+    main()
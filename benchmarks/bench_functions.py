@@ -0,0 +1,90 @@
+"""
+Nested functions benchmark
+
+Measures wrapping fields into nested calls like ``round(avg(sqrt(x)), 2)``
+repeated to the given depth, and rendering of the result.
+
+Run as ``python -m query_builder.benchmarks.bench_functions [--max-depth N]``
+"""
+import argparse
+import timeit
+
+from .. import fields
+
+
+DEPTHS = (1, 10, 100, 1000, 10000)
+
+
+def build_nested(depth):
+    """
+    Wraps field into ``round(avg(sqrt(...)), 2)`` ``depth`` times
+
+    Args:
+        depth (int): Amount of wrappings (**required**)
+
+    Returns:
+        Field: Wrapped field
+    """
+    field = fields.Decimal('x', table='points')
+    for _ in range(depth):
+        field = field.sqrt().avg().round(2)
+
+    return field
+
+
+def bench_build(depth, number=10):
+    """
+    Measures wrapping
+
+    Args:
+        depth (int): Amount of wrappings (**required**)
+        number (int): Amount of iterations (``10`` - default)
+
+    Returns:
+        float: Microseconds per function call node
+    """
+    seconds = timeit.timeit(lambda: build_nested(depth), number=number)
+
+    return seconds / number / (depth * 3) * 1e6
+
+
+def bench_render(depth, number=10):
+    """
+    Measures rendering of wrapped field
+
+    Args:
+        depth (int): Amount of wrappings (**required**)
+        number (int): Amount of iterations (``10`` - default)
+
+    Returns:
+        float: Microseconds per function call node
+    """
+    field = build_nested(depth)
+    seconds = timeit.timeit(lambda: str(field), number=number)
+
+    return seconds / number / (depth * 3) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-depth', type=int, default=DEPTHS[-1])
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print('{:>8} {:>16} {:>16}'.format(
+        'depth',
+        'build, us/call',
+        'render, us/call',
+    ))
+    for depth in DEPTHS:
+        if depth > args.max_depth:
+            break
+        print('{:>8} {:>16.3f} {:>16.3f}'.format(
+            depth,
+            bench_build(depth, args.number),
+            bench_render(depth, args.number),
+        ))
+
+
+if __name__ == '__main__':
+    main()
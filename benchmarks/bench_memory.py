@@ -0,0 +1,83 @@
+"""
+Expression memory benchmark
+
+Measures bytes retained per predicate by large generated filters, e.g.
+``Clause(f0 == 0) & Clause(f1 > 1) & ...``.
+
+Run as ``python -m query_builder.benchmarks.bench_memory [--max-size N]``
+"""
+import argparse
+import functools
+import operator
+import tracemalloc
+
+from .. import fields
+from ..expressions import Clause
+
+
+SIZES = (100, 1000, 10000)
+
+
+def build_filter(size):
+    """
+    Builds AND filter of ``size`` predicates over a few columns
+
+    Args:
+        size (int): Amount of predicates (**required**)
+
+    Returns:
+        Clause: Combined filter
+    """
+    columns = (
+        fields.Integer('id', table='users'),
+        fields.Decimal('balance', table='users'),
+        fields.Varchar('name', table='users', max_length=64),
+    )
+    predicates = []
+    for number in range(size):
+        column = columns[number % len(columns)]
+        if isinstance(column, fields.Varchar):
+            predicates.append(Clause(column == 'name {}'.format(number)))
+        else:
+            predicates.append(Clause(column * 2 + number > number))
+
+    return functools.reduce(operator.and_, predicates)
+
+
+def bench_filter(size):
+    """
+    Measures memory retained by filter of ``size`` predicates
+
+    Args:
+        size (int): Amount of predicates (**required**)
+
+    Returns:
+        float: Bytes per predicate
+    """
+    tracemalloc.start()
+    try:
+        snapshot = tracemalloc.get_traced_memory()[0]
+        clause = build_filter(size)
+        retained = tracemalloc.get_traced_memory()[0] - snapshot
+    finally:
+        tracemalloc.stop()
+
+    del clause
+
+    return retained / size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-size', type=int, default=SIZES[-1])
+    max_size = parser.parse_args(argv).max_size
+
+    print('{:>10} {:>20}'.format('predicates', 'bytes per predicate'))
+    for size in SIZES:
+        if size > max_size:
+            break
+        print('{:>10} {:>20.1f}'.format(size, bench_filter(size)))
+
+
+if __name__ == '__main__':
+    main()
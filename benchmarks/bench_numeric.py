@@ -0,0 +1,102 @@
+"""
+Numeric fields benchmark
+
+Measures construction of numeric fields, of ``price * 1.2 > 100``-like
+expressions, which build a new field instance per operator, and batch
+validation of values.
+
+Run as ``python -m query_builder.benchmarks.bench_numeric [--number N] [--size N]``
+"""
+import argparse
+import decimal
+import timeit
+
+from .. import fields
+
+
+NUMERIC_TYPES = (
+    fields.Decimal, fields.Double, fields.Real, fields.BigInt, fields.Integer,
+)
+
+
+def bench_construction(field_class, number=10000):
+    """
+    Measures field instantiation
+
+    Args:
+        field_class (type): Numeric field class (**required**)
+        number (int): Amount of iterations (``10000`` - default)
+
+    Returns:
+        float: Microseconds per instance
+    """
+    seconds = timeit.timeit(lambda: field_class('price'), number=number)
+
+    return seconds / number * 1e6
+
+
+def bench_expression(field_class, number=10000):
+    """
+    Measures building of ``field * 1.2 > 100`` expression
+
+    Args:
+        field_class (type): Numeric field class (**required**)
+        number (int): Amount of iterations (``10000`` - default)
+
+    Returns:
+        float: Microseconds per expression
+    """
+    field = field_class('price')
+    seconds = timeit.timeit(lambda: field * 1.2 > 100, number=number)
+
+    return seconds / number * 1e6
+
+
+def bench_validation(field_class, size=100000):
+    """
+    Measures :meth:`~Field.validate_many` of integers, floats and decimals
+
+    Args:
+        field_class (type): Numeric field class (**required**)
+        size (int): Amount of values of each type (``100000`` - default)
+
+    Returns:
+        float: Microseconds per value
+    """
+    field = field_class('price')
+    columns = (
+        list(range(size)),
+        [number / 4 for number in range(size)],
+        [decimal.Decimal(number).scaleb(-2) for number in range(size)],
+    )
+    seconds = sum(
+        timeit.timeit(lambda values=values: field.validate_many(values), number=1)
+        for values in columns
+    )
+
+    return seconds / (size * len(columns)) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=10000)
+    parser.add_argument('--size', type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    print('{:<10} {:>16} {:>16} {:>16}'.format(
+        'type',
+        'init, us',
+        'expression, us',
+        'validate, us',
+    ))
+    for field_class in NUMERIC_TYPES:
+        print('{:<10} {:>16.2f} {:>16.2f} {:>16.3f}'.format(
+            field_class.__name__,
+            bench_construction(field_class, args.number),
+            bench_expression(field_class, args.number),
+            bench_validation(field_class, args.size),
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Clause state machine benchmark
+
+Measures a 6-clause ``select().where().group_by().order_by().limit()
+.offset()`` chain: transitions guarded by the state machine alone, on nodes
+doing nothing else, and full query nodes building their clauses.
+
+Run as ``python -m query_builder.benchmarks.bench_states [--number N]``
+"""
+import argparse
+import time
+
+from .. import fields
+from ..models import Model
+from ..states import State, state_aware, transition
+
+
+NUMBER = 1000000
+
+
+class User(Model):
+    id_ = fields.Integer('id')
+    name = fields.Varchar('name', max_length=64)
+    age = fields.Integer('age')
+
+
+class Node:
+    """
+    Node only switching states, isolates state machine cost
+    """
+    __slots__ = ('_state',)
+
+    def __init__(self, state):
+        self._state = state
+
+    @classmethod
+    def select(cls):
+        return cls(transition(State.INITIAL, State.SELECT))
+
+    @state_aware(State.WHERE)
+    def where(self):
+        return self.__class__(State.WHERE)
+
+    @state_aware(State.GROUP_BY)
+    def group_by(self):
+        return self.__class__(State.GROUP_BY)
+
+    @state_aware(State.ORDER_BY)
+    def order_by(self):
+        return self.__class__(State.ORDER_BY)
+
+    @state_aware(State.LIMIT)
+    def limit(self):
+        return self.__class__(State.LIMIT)
+
+    @state_aware(State.OFFSET)
+    def offset(self):
+        return self.__class__(State.OFFSET)
+
+
+def _transitions():
+    return Node.select().where().group_by().order_by().limit().offset()
+
+
+def _query(user=User('users')):
+    return user.select(user.name).where(user.age > 18).group_by(
+        user.name,
+    ).order_by(user.name).limit(10).offset(20)
+
+
+def bench(func, number=NUMBER):
+    """
+    Measures chain
+
+    Args:
+        func (callable): Chain builder (**required**)
+        number (int): Amount of iterations (``NUMBER`` - default)
+
+    Returns:
+        tuple: Total seconds and nanoseconds per clause
+    """
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    seconds = time.perf_counter() - started
+
+    return seconds, seconds / number / 6 * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=NUMBER)
+    number = parser.parse_args(argv).number
+
+    print('{:>12} {:>12} {:>16}'.format('chain', 'total, s', 'ns/clause'))
+    for name, func in (('transitions', _transitions), ('query', _query)):
+        seconds, per_clause = bench(func, number)
+        print('{:>12} {:>12.3f} {:>16.1f}'.format(name, seconds, per_clause))
+
+
+if __name__ == '__main__':
+    main()
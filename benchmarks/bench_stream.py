@@ -0,0 +1,89 @@
+"""
+Streaming execution benchmark
+
+Scans a generated SQLite view of N rows through ``Model.stream`` and
+reports rows per second and peak traced memory, which has to stay flat
+as N grows.
+
+Run as ``python -m query_builder.benchmarks.bench_stream [--max-size N]``
+"""
+import argparse
+import sqlite3
+import time
+import tracemalloc
+
+from .. import fields
+from ..models import Model
+
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+class Number(Model):
+    id_ = fields.BigInt('id')
+    square = fields.BigInt('square')
+    label = fields.Text('label')
+
+
+def connect(size):
+    """
+    Opens in-memory database with ``numbers`` view of ``size`` rows
+
+    Args:
+        size (int): Amount of rows (**required**)
+
+    Returns:
+        sqlite3.Connection: Connection
+    """
+    connection = sqlite3.connect(':memory:')
+    connection.execute(
+        'CREATE VIEW numbers AS WITH RECURSIVE seq(id) AS ('
+        'SELECT 1 UNION ALL SELECT id + 1 FROM seq WHERE id < {}'
+        ') SELECT id, id * id AS square, \'number \' || id AS label '
+        'FROM seq'.format(int(size)),
+    )
+
+    return connection
+
+
+def bench_stream(size, batch_size=1000):
+    """
+    Measures scan of ``size`` rows
+
+    Args:
+        size (int): Amount of rows (**required**)
+        batch_size (int): Rows per fetch (``1000`` - default)
+
+    Returns:
+        tuple: Rows per second and peak traced memory in KiB
+    """
+    connection = connect(size)
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        count = sum(1 for _ in Number('numbers').stream(connection, batch_size))
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        connection.close()
+
+    assert count == size
+
+    return size / elapsed, peak / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-size', type=float, default=10 ** 6)
+    max_size = int(parser.parse_args(argv).max_size)
+
+    print('{:>10} {:>14} {:>14}'.format('rows', 'rows/s', 'peak, KiB'))
+    for size in SIZES:
+        if size > max_size:
+            break
+        print('{:>10} {:>14.0f} {:>14.1f}'.format(size, *bench_stream(size)))
+
+
+if __name__ == '__main__':
+    main()
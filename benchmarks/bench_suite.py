@@ -0,0 +1,258 @@
+"""
+Query builder benchmark suite
+
+Measures hot paths of query construction and rendering: model
+instantiation, field construction, operators, function wrapping, long
+``Clause`` chains and full ``select().where().order_by().limit()``
+evaluation. Workloads built of predicates are scaled from 10 to 10^5.
+
+Results are written as JSON, so runs on different commits can be compared::
+
+    python -m query_builder.benchmarks.bench_suite -o before.json
+    python -m query_builder.benchmarks.bench_suite -o after.json --compare before.json
+"""
+import argparse
+import functools
+import json
+import operator
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+from .. import fields
+from ..expressions import Clause
+from ..models import Model
+
+
+SIZES = (10, 100, 1000, 10000, 100000)
+REPEAT = 5
+# slowdown reported as regression by ``--compare``
+TOLERANCE = 1.1
+
+
+class User(Model):
+    id_ = fields.Integer('id')
+    name = fields.Varchar('name', max_length=64)
+    balance = fields.Decimal('balance', precision=12, scale=2)
+    age = fields.Integer('age')
+
+
+def build_clause(model, size):
+    """
+    Builds filter of ``size`` predicates, ANDed groups of three ORed ones
+
+    Args:
+        model (Model): Model instance (**required**)
+        size (int): Amount of predicates (**required**)
+
+    Returns:
+        Clause: Combined filter
+    """
+    groups = []
+    for start in range(0, size, 3):
+        predicates = [
+            Clause(model.age > number) if number % 3 == 0 else
+            Clause(model.balance * 2 < number) if number % 3 == 1 else
+            Clause(model.name == 'name {}'.format(number))
+            for number in range(start, min(start + 3, size))
+        ]
+        groups.append(functools.reduce(operator.or_, predicates))
+
+    return functools.reduce(operator.and_, groups)
+
+
+def _model_init():
+    user = User('users', schema='public')
+    return user.name
+
+
+def _decimal_init():
+    return fields.Decimal('balance', precision=12, scale=2)
+
+
+def _general_operation(field=fields.Decimal('balance')):
+    return field * 1.2 > 100
+
+
+def _wrap_function(field=fields.Decimal('balance')):
+    return field.round(2).max()
+
+
+def _chain(size):
+    user = User('users')
+    return lambda: build_clause(user, size)
+
+
+def _select(size, params):
+    user = User('users')
+    clause = build_clause(user, size)
+
+    return lambda: user.select(user.id_, user.name).where(
+        clause,
+    ).order_by(user.name).limit(10).evaluate(params=params)
+
+
+def cases(sizes=SIZES):
+    """
+    Lists benchmarked callables
+
+    Args:
+        sizes (tuple): Amounts of predicates of scaled workloads
+            (``SIZES`` - default)
+
+    Yields:
+        tuple: Case name, workload size and callable
+    """
+    yield 'model_init', 1, _model_init
+    yield 'decimal_init', 1, _decimal_init
+    yield 'general_operation', 1, _general_operation
+    yield 'wrap_function', 1, _wrap_function
+
+    for size in sizes:
+        yield 'clause_chain', size, _chain(size)
+        yield 'select_evaluate', size, _select(size, False)
+        yield 'select_evaluate_params', size, _select(size, True)
+
+
+def measure(func, repeat=REPEAT):
+    """
+    Times callable, picking amount of calls to run at least 0.2 seconds
+
+    Args:
+        func (callable): Measured callable (**required**)
+        repeat (int): Amount of measurements (``REPEAT`` - default)
+
+    Returns:
+        dict: Best and median seconds per call and amount of calls
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = sorted(seconds / number for seconds in timer.repeat(repeat, number))
+
+    return {
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def _revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes=SIZES, repeat=REPEAT, only=None):
+    """
+    Runs benchmark cases
+
+    Args:
+        sizes (tuple): Amounts of predicates of scaled workloads
+            (``SIZES`` - default)
+        repeat (int): Amount of measurements per case (``REPEAT`` - default)
+        only (str): Runs only cases with the name prefix (``None`` - default)
+
+    Returns:
+        dict: Environment description and results
+    """
+    results = []
+    for name, size, func in cases(sizes):
+        if only is not None and not name.startswith(only):
+            continue
+
+        result = {'name': name, 'size': size, **measure(func, repeat)}
+        results.append(result)
+        print('{:<24} {:>8} {:>14.2f} us'.format(
+            name,
+            size,
+            result['best'] * 1e6,
+        ), file=sys.stderr)
+
+    return {
+        'revision': _revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'results': results,
+    }
+
+
+def compare(baseline, report, tolerance=TOLERANCE):
+    """
+    Compares run with a baseline one
+
+    Args:
+        baseline (dict): Previous :func:`run` report (**required**)
+        report (dict): Current :func:`run` report (**required**)
+        tolerance (float): Slowdown ratio reported as regression
+            (``TOLERANCE`` - default)
+
+    Returns:
+        list: Tuples of case name, size and slowdown ratio of regressions
+    """
+    previous = {
+        (result['name'], result['size']): result['best']
+        for result in baseline['results']
+    }
+
+    regressions = []
+    for result in report['results']:
+        best = previous.get((result['name'], result['size']))
+        if best is None:
+            continue
+
+        ratio = result['best'] / best
+        print('{:<24} {:>8} {:>8.2f}x'.format(
+            result['name'],
+            result['size'],
+            ratio,
+        ), file=sys.stderr)
+        if ratio > tolerance:
+            regressions.append((result['name'], result['size'], ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', help='JSON report path, stdout if missing')
+    parser.add_argument('--compare', help='baseline JSON report path')
+    parser.add_argument('--max-size', type=int, default=SIZES[-1])
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--only', help='runs only cases with the name prefix')
+    args = parser.parse_args(argv)
+
+    report = run(
+        tuple(size for size in SIZES if size <= args.max_size),
+        args.repeat,
+        args.only,
+    )
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as baseline:
+            regressions = compare(json.load(baseline), report)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
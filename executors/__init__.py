@@ -0,0 +1,13 @@
+"""Query execution package"""
+from ._async import AsyncConnection
+from ._async import Pool
+from ._async import SqliteConnection
+
+from ._dialect import Dialect
+from ._dialect import SqliteDialect
+from ._dialect import dialect_for
+
+from ._prepared import PreparedStatements
+from ._prepared import statement_name
+
+from ._stream import stream
@@ -0,0 +1,320 @@
+"""Asyncio execution module"""
+import asyncio
+import contextlib
+import functools
+import sqlite3
+
+from ._dialect import SqliteDialect
+from ._stream import row_names
+
+
+async def _in_thread(func, *args, **kwargs):
+    """Runs blocking call in the default executor of the running loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        None,
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+class AsyncConnection:
+    """
+    Protocol of asyncio driver connections used by :class:`~Pool`
+
+    Implementations wrap a driver connection, e.g. asyncpg or aiosqlite one.
+    Results are pairs of column names and rows as tuples.
+    ``connection_errors`` lists exceptions leaving connection unusable, only
+    connections failed with them are dropped from :class:`~Pool`.
+    """
+    paramstyle = 'dollar'
+    connection_errors = (OSError, asyncio.CancelledError, asyncio.TimeoutError)
+
+    async def fetch(self, sql, params):
+        """
+        Runs query fetching the whole result
+
+        Args:
+            sql (str): SQL query (**required**)
+            params (tuple): Bind parameters (**required**)
+
+        Returns:
+            tuple: Column names and rows
+        """
+        raise NotImplementedError
+
+    def batches(self, sql, params, batch_size):
+        """
+        Runs query fetching result by batches
+
+        Args:
+            sql (str): SQL query (**required**)
+            params (tuple): Bind parameters (**required**)
+            batch_size (int): Rows per batch (**required**)
+
+        Returns:
+            AsyncIterator: Column names and rows of each batch
+        """
+        raise NotImplementedError
+
+    async def pipeline(self, statements):
+        """
+        Runs queries in order, drivers supporting pipelining send them
+        without waiting for each result
+
+        Args:
+            statements (list): Pairs of SQL query and bind parameters
+                (**required**)
+
+        Returns:
+            list: Column names and rows of each query
+        """
+        return [await self.fetch(sql, params) for sql, params in statements]
+
+    async def close(self):
+        """Closes connection"""
+        raise NotImplementedError
+
+
+class SqliteConnection(AsyncConnection):
+    """
+    :mod:`sqlite3` connection running queries in a worker thread
+
+    Args:
+        connection (sqlite3.Connection): Connection opened with
+            ``check_same_thread=False`` (**required**)
+    """
+    paramstyle = 'qmark'
+
+    _dialect = SqliteDialect()
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    @classmethod
+    async def connect(cls, database, **kwargs):
+        """
+        Opens connection
+
+        Args:
+            database (str): Database path or URI (**required**)
+            **kwargs: :func:`sqlite3.connect` arguments
+
+        Returns:
+            SqliteConnection: Connection
+        """
+        return cls(await _in_thread(
+            sqlite3.connect,
+            database,
+            check_same_thread=False,
+            **kwargs,
+        ))
+
+    def _execute(self, sql, params):
+        cursor = self._connection.execute(sql, self._dialect.adapt(params))
+        return cursor, [column[0] for column in cursor.description or ()]
+
+    def _fetch(self, sql, params):
+        cursor, columns = self._execute(sql, params)
+        try:
+            return columns, cursor.fetchall()
+        finally:
+            cursor.close()
+
+    async def fetch(self, sql, params):
+        return await _in_thread(self._fetch, sql, params)
+
+    async def batches(self, sql, params, batch_size):
+        cursor, columns = await _in_thread(self._execute, sql, params)
+        try:
+            while True:
+                rows = await _in_thread(cursor.fetchmany, batch_size)
+                if not rows:
+                    return
+                yield columns, rows
+        finally:
+            cursor.close()
+
+    async def pipeline(self, statements):
+        # a single hop to the worker thread for the whole batch
+        return await _in_thread(
+            lambda: [self._fetch(sql, params) for sql, params in statements],
+        )
+
+    async def close(self):
+        await _in_thread(self._connection.close)
+
+
+class Pool:
+    """
+    Bounded pool of asyncio connections
+
+    Connections are opened on demand up to ``max_size``, waiting callers are
+    served as connections return to the pool. Closed pool closes connections
+    returned to it and refuses to lend new ones.
+
+    Args:
+        connect (callable): Coroutine function opening :class:`~AsyncConnection`
+            (**required**)
+        max_size (int): Max amount of connections (``10`` - default)
+        acquire_timeout (float): Seconds to wait for a connection, ``None``
+            waits forever (``None`` - default)
+    """
+    def __init__(self, connect, max_size=10, acquire_timeout=None):
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+
+        self._connect = connect
+        self._idle = []
+        # created in the running loop, Python < 3.10 binds it on creation
+        self._slots = None
+        self._size = 0
+        self._closed = False
+
+    @property
+    def size(self):
+        """
+        Amount of open connections
+
+        Returns:
+            int: Open connections
+        """
+        return self._size
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, timeout=None):
+        """
+        Borrows connection, connection failed within the block with one of
+        its ``connection_errors`` is closed
+
+        Args:
+            timeout (float): Overrides ``acquire_timeout`` (``None`` - default)
+
+        Raises:
+            asyncio.TimeoutError: in case no connection got free in time
+            ValueError: in case pool is closed
+        """
+        if timeout is None:
+            timeout = self.acquire_timeout
+
+        self._check_open()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        await asyncio.wait_for(self._slots.acquire(), timeout)
+
+        try:
+            self._check_open()
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                connection = await self._connect()
+                self._size += 1
+
+            try:
+                yield connection
+            except connection.connection_errors:
+                await self._discard(connection)
+                raise
+            except BaseException:
+                await self._release(connection)
+                raise
+
+            await self._release(connection)
+        finally:
+            self._slots.release()
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError('pool is closed')
+
+    async def _release(self, connection):
+        if self._closed:
+            await self._discard(connection)
+        else:
+            self._idle.append(connection)
+
+    async def _discard(self, connection):
+        self._size -= 1
+        await connection.close()
+
+    async def close(self):
+        """
+        Closes idle connections, borrowed ones are closed when returned
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        self._size -= len(idle)
+        for connection in idle:
+            await connection.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+    async def fetch(self, query):
+        """
+        Runs query fetching the whole result
+
+        Args:
+            query (Query): Executed query (**required**)
+
+        Returns:
+            list: Rows as dicts keyed by field attribute names
+        """
+        async with self.acquire() as connection:
+            columns, rows = await connection.fetch(
+                *query.evaluate(params=True, paramstyle=connection.paramstyle),
+            )
+
+        names = row_names(query, columns)
+
+        return [dict(zip(names, row)) for row in rows]
+
+    async def stream(self, query, batch_size=1000):
+        """
+        Runs query yielding rows lazily, holds connection until exhausted
+
+        Args:
+            query (Query): Executed query (**required**)
+            batch_size (int): Rows per round trip (``1000`` - default)
+
+        Yields:
+            dict: Row keyed by field attribute names
+        """
+        async with self.acquire() as connection:
+            sql, params = query.evaluate(
+                params=True,
+                paramstyle=connection.paramstyle,
+            )
+            names = None
+            async for columns, rows in connection.batches(sql, params, batch_size):
+                if names is None:
+                    names = row_names(query, columns)
+                for row in rows:
+                    yield dict(zip(names, row))
+
+    async def pipeline(self, queries):
+        """
+        Sends many queries through one connection without waiting for
+        each result where driver supports it
+
+        Args:
+            queries (iterable): Executed queries (**required**)
+
+        Returns:
+            list: Result of each query, look at :meth:`~Pool.fetch`
+        """
+        queries = list(queries)
+        async with self.acquire() as connection:
+            results = await connection.pipeline([
+                query.evaluate(params=True, paramstyle=connection.paramstyle)
+                for query in queries
+            ])
+
+        return [
+            [dict(zip(names, row)) for row in rows]
+            for names, rows in (
+                (row_names(query, columns), rows)
+                for query, (columns, rows) in zip(queries, results)
+            )
+        ]
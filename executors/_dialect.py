@@ -0,0 +1,132 @@
+"""DB-API dialects module"""
+import datetime
+import decimal
+import itertools
+import sys
+
+
+# DB-API ``paramstyle`` mapped to placeholders style of rendered queries
+_PARAMSTYLES = {
+    'qmark': 'qmark',
+    'numeric': 'numeric',
+    'format': 'format',
+    'pyformat': 'format',
+}
+
+_cursor_ids = itertools.count(1)
+
+
+class Dialect:
+    """
+    Describes how to run rendered queries through a DB-API driver
+
+    Args:
+        name (str): Dialect name (**required**)
+        paramstyle (str): Placeholders style of rendered queries (**required**)
+        named_cursors (bool): Driver keeps results on the server behind
+            ``connection.cursor(name=...)`` (``False`` - default)
+    """
+    __slots__ = ('name', 'paramstyle', 'named_cursors')
+
+    def __init__(self, name, paramstyle, named_cursors=False):
+        self.name = name
+        self.paramstyle = paramstyle
+        self.named_cursors = named_cursors
+
+    def __repr__(self):
+        return '<Dialect {}>'.format(self.name)
+
+    def cursor(self, connection, batch_size):
+        """
+        Opens cursor fetching results by batches
+
+        Args:
+            connection (object): DB-API connection (**required**)
+            batch_size (int): Rows per round trip (**required**)
+
+        Returns:
+            object: DB-API cursor
+        """
+        if not self.named_cursors:
+            cursor = connection.cursor()
+        else:
+            cursor = connection.cursor(name='query_builder_{}'.format(
+                next(_cursor_ids),
+            ))
+            cursor.itersize = batch_size
+        cursor.arraysize = batch_size
+
+        return cursor
+
+    def adapt(self, params):
+        """
+        Converts bind parameters into types supported by the driver
+
+        Args:
+            params (tuple): Bind parameters (**required**)
+
+        Returns:
+            tuple: Bind parameters
+        """
+        return params
+
+
+class SqliteDialect(Dialect):
+    """
+    :mod:`sqlite3` dialect, handy to run queries offline
+
+    SQLite has no decimal, date or time types, values are bound as text the
+    way SQLite date and time functions expect them.
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        super(SqliteDialect, self).__init__('sqlite', 'qmark')
+
+    def adapt(self, params):
+        return tuple(map(self._adapt_value, params))
+
+    @staticmethod
+    def _adapt_value(value):
+        if isinstance(value, decimal.Decimal):
+            return str(value)
+
+        if isinstance(value, datetime.datetime):
+            return value.isoformat(' ')
+
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+
+        return value
+
+
+_DIALECTS = {
+    'sqlite3': SqliteDialect(),
+    'psycopg2': Dialect('psycopg2', 'format', named_cursors=True),
+    'psycopg': Dialect('psycopg', 'format', named_cursors=True),
+}
+
+
+def dialect_for(connection):
+    """
+    Picks dialect of DB-API connection by its driver module
+
+    Args:
+        connection (object): DB-API connection (**required**)
+
+    Raises:
+        ValueError: in case driver paramstyle is unknown
+
+    Returns:
+        Dialect: Known dialect or generic one following driver paramstyle
+    """
+    module = type(connection).__module__.split('.')[0]
+    dialect = _DIALECTS.get(module)
+    if dialect is not None:
+        return dialect
+
+    paramstyle = getattr(sys.modules.get(module), 'paramstyle', 'format')
+    if paramstyle not in _PARAMSTYLES:
+        raise ValueError('unsupported paramstyle: {}'.format(paramstyle))
+
+    return Dialect(module, _PARAMSTYLES[paramstyle])
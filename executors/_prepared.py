@@ -0,0 +1,155 @@
+"""Prepared statements module"""
+import collections
+import functools
+import hashlib
+import threading
+import weakref
+
+from .. import helpers
+from ._dialect import dialect_for
+
+
+@functools.lru_cache(maxsize=1024)
+def statement_name(sql):
+    """
+    Names prepared statement after its SQL text
+
+    Args:
+        sql (str): Query template with ``$n`` placeholders (**required**)
+
+    Returns:
+        str: Name, the same for the same template in any process
+    """
+    return 'qb_{}'.format(hashlib.sha1(sql.encode()).hexdigest()[:20])
+
+
+class PreparedStatements:
+    """
+    Registry of statements prepared on each connection
+
+    The first run of a query template on a connection emits
+    ``PREPARE name AS ...``, every run emits ``EXECUTE name(...)``, so the
+    database parses and plans hot queries once per session. Each connection
+    keeps at most ``maxsize`` statements, the least recently used one is
+    deallocated to make room.
+
+    Args:
+        maxsize (int): Max amount of statements per connection
+            (``128`` - default)
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+
+        self._prepared = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def prepared(self, connection):
+        """
+        Lists statements prepared on connection
+
+        Args:
+            connection (object): DB connection (**required**)
+
+        Returns:
+            list: Statement names, the least recently used first
+        """
+        with self._lock:
+            return list(self._prepared.get(connection, ()))
+
+    def forget(self, connection):
+        """
+        Drops records of connection, e.g. after ``DISCARD ALL`` or reconnect
+
+        Args:
+            connection (object): DB connection (**required**)
+        """
+        with self._lock:
+            self._prepared.pop(connection, None)
+
+    def statements(self, connection, query, paramstyle=None):
+        """
+        Builds statements running query on connection
+
+        Args:
+            connection (object): DB connection, has to support weak
+                references (**required**)
+            query (Query): Executed query (**required**)
+            paramstyle (str): Bind parameters style of ``EXECUTE`` arguments,
+                ``None`` inlines them (``None`` - default)
+
+        Returns:
+            list: Pairs of SQL statement and parameters, ``None`` parameters
+                mean statement has to run without them. ``EXECUTE`` is the
+                last one
+        """
+        # pylint: disable=protected-access
+        segments, literals = query._model._cache.compile(query._root, 'dollar')
+        sql = segments[0]
+        name = statement_name(sql)
+
+        statements = []
+        with self._lock:
+            prepared = self._prepared.get(connection)
+            if prepared is None:
+                prepared = self._prepared[connection] = collections.OrderedDict()
+
+            if name in prepared:
+                prepared.move_to_end(name)
+            else:
+                while len(prepared) >= self.maxsize:
+                    evicted, _ = prepared.popitem(last=False)
+                    statements.append(('DEALLOCATE {}'.format(evicted), None))
+                statements.append(('PREPARE {} AS {}'.format(name, sql), None))
+                prepared[name] = True
+
+        if not literals:
+            statements.append(('EXECUTE {}'.format(name), None))
+        elif paramstyle is None:
+            # quoted from literals, adapted values lose their SQL form
+            statements.append(('EXECUTE {}({})'.format(
+                name,
+                ', '.join(literal.sql for literal in literals),
+            ), None))
+        else:
+            statements.append(('EXECUTE {}({})'.format(
+                name,
+                ', '.join(helpers.placeholders(paramstyle, len(literals))),
+            ), tuple(literal.param for literal in literals)))
+
+        return statements
+
+    def execute(self, connection, query, dialect=None):
+        """
+        Runs query on DB-API connection through prepared statement
+
+        Args:
+            connection (object): DB-API connection (**required**)
+            query (Query): Executed query (**required**)
+            dialect (Dialect): Driver dialect, picked by connection if missing
+                (``None`` - default)
+
+        Returns:
+            object: DB-API cursor holding ``EXECUTE`` result
+        """
+        if dialect is None:
+            dialect = dialect_for(connection)
+
+        cursor = connection.cursor()
+        for sql, params in self.statements(connection, query, dialect.paramstyle):
+            try:
+                if params is None:
+                    cursor.execute(sql)
+                else:
+                    cursor.execute(sql, dialect.adapt(params))
+            except BaseException:
+                if sql.startswith('PREPARE '):
+                    # let the next run prepare it again
+                    self._discard(connection, sql.split(' ', 2)[1])
+                cursor.close()
+                raise
+
+        return cursor
+
+    def _discard(self, connection, name):
+        with self._lock:
+            self._prepared.get(connection, {}).pop(name, None)
@@ -0,0 +1,56 @@
+"""Streaming execution module"""
+from ._dialect import dialect_for
+
+
+def row_names(query, columns):
+    """
+    Maps result columns to model field attribute names
+
+    Args:
+        query (Query): Executed query (**required**)
+        columns (list): Column names reported by driver (**required**)
+
+    Returns:
+        list: Field attribute names, other columns keep their names
+    """
+    attrs = query._model._attrs_by_name  # pylint: disable=protected-access
+
+    return [attrs.get(column, column) for column in columns]
+
+
+def stream(connection, query, batch_size=1000, dialect=None):
+    """
+    Runs query yielding rows lazily
+
+    Rows are fetched by ``batch_size`` with ``fetchmany``, so memory usage
+    does not depend on the size of the result.
+
+    Args:
+        connection (object): DB-API connection (**required**)
+        query (Query): Executed query (**required**)
+        batch_size (int): Rows per round trip (``1000`` - default)
+        dialect (Dialect): Driver dialect, picked by connection if missing
+            (``None`` - default)
+
+    Yields:
+        dict: Row keyed by field attribute names, other columns keep names
+            reported by the driver
+    """
+    if dialect is None:
+        dialect = dialect_for(connection)
+
+    sql, params = query.evaluate(params=True, paramstyle=dialect.paramstyle)
+
+    cursor = dialect.cursor(connection, batch_size)
+    try:
+        cursor.execute(sql, dialect.adapt(params))
+
+        rows = cursor.fetchmany(batch_size)
+        # named cursors describe results after the first fetch only
+        names = row_names(query, [column[0] for column in cursor.description])
+        while rows:
+            for row in rows:
+                yield dict(zip(names, row))
+            rows = cursor.fetchmany(batch_size)
+    finally:
+        cursor.close()
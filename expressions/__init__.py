@@ -1,4 +1,27 @@
 """Expressions package"""
 from ._clause import Clause
 
+from ._compiler import collect_literals
+from ._compiler import compile_sql
+
 from ._expression import Expression
+
+from ._interval import Interval
+
+from ._literal import Array
+from ._literal import Literal
+from ._literal import Placeholder
+
+from ._nodes import Alias
+from ._nodes import Cast
+from ._nodes import Column
+from ._nodes import Function
+from ._nodes import In
+from ._nodes import Junction
+from ._nodes import Node
+from ._nodes import Operation
+from ._nodes import Values
+
+from ._shape import intern_shape
+from ._shape import key_of
+from ._shape import to_node
@@ -1,7 +1,9 @@
 """Clause module"""
 import json
 
-from ._expression import Expression
+from ._compiler import compile_sql
+from ._nodes import Junction
+from ._shape import to_node
 
 
 class Clause:
@@ -11,14 +13,16 @@ class Clause:
     Args:
         field (Field): Field with comparison conditions
     """
+    __slots__ = ('_node',)
+
     def __init__(self, field):
-        self._field = field
+        self._node = to_node(field)
 
     def __join(self, other, operand='AND'):
         if isinstance(other, bool):
             value = json.dumps(other)
         elif isinstance(other, self.__class__):
-            value = getattr(other, '_field')
+            value = getattr(other, '_node')
         else:
             raise TypeError(
                 "unsupported operand type(s) for and: '{}' and '{}'".format(
@@ -27,12 +31,7 @@ class Clause:
                 ),
             )
 
-        if operand == 'AND':
-            expression = '{} AND {}'.format(self._field, value)
-        else:
-            expression = '({} OR {})'.format(self._field, value)
-
-        return self.__class__(Expression(expression))
+        return self.__class__(Junction.combine(operand, self._node, value))
 
     def __and__(self, other):
         return self.__join(other)
@@ -46,8 +45,11 @@ class Clause:
     def __ror__(self, other):
         return self.__or__(other)
 
+    def _to_node(self):
+        return self._node
+
     def __repr__(self):
         return "<Clause '{}'>".format(self)
 
     def __str__(self):
-        return str(self._field)
+        return compile_sql(self._node)
@@ -0,0 +1,52 @@
+"""SQL compiler module"""
+from ._literal import Literal
+
+
+def compile_sql(root, bind=None):
+    """
+    Renders node tree into SQL in a single iterative pass
+
+    Args:
+        root (object): Node or raw SQL string (**required**)
+        bind (callable): Renders :class:`~Literal` instead of inlining its
+            value (``None`` - default)
+
+    Returns:
+        str: SQL text
+    """
+    buffer = []
+    stack = [root]
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            buffer.append(item)
+        elif isinstance(item, Literal):
+            buffer.append(item.sql if bind is None else bind(item))
+        else:
+            stack.extend(reversed(item._tokens()))  # pylint: disable=protected-access
+
+    return ''.join(buffer)
+
+
+def collect_literals(root):
+    """
+    Collects literals of node tree in render order
+
+    Args:
+        root (object): Node or raw SQL string (**required**)
+
+    Returns:
+        list: Literals
+    """
+    literals = []
+    stack = [root]
+
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Literal):
+            literals.append(item)
+        elif not isinstance(item, str):
+            stack.extend(item._children[::-1])  # pylint: disable=protected-access
+
+    return literals
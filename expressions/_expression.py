@@ -1,4 +1,13 @@
 """Expressions module"""
+import string
+
+from ._compiler import compile_sql
+from ._shape import intern_shape
+from ._shape import key_of
+from ._shape import to_node
+
+
+_formatter = string.Formatter()
 
 
 # TODO: probably implement | and & operations
@@ -7,13 +16,66 @@ class Expression:
     Expression class helps write raw SQL queries
 
     Args:
-        expression (str): Raw SQL query
+        expression (str): Raw SQL query, may contain ``{}`` for parts
+        *parts (object): Objects rendered into ``expression`` placeholders
     """
-    def __init__(self, expression):
+    __slots__ = ('_expression', '_segments', '_parts', '_key')
+
+    def __init__(self, expression, *parts):
         self._expression = expression
 
+        if not parts:
+            self._segments = (expression,)
+            self._parts = ()
+        else:
+            self._segments, self._parts = self._parse(expression, parts)
+
+        self._key = intern_shape((
+            'expression',
+            self._segments,
+            tuple(map(key_of, self._parts)),
+        ))
+
+    @staticmethod
+    def _parse(expression, parts):
+        segments = []
+        ordered_parts = []
+        segment = []
+        position = 0
+
+        for text, field_name, _, _ in _formatter.parse(expression):
+            segment.append(text)
+            if field_name is None:
+                continue
+
+            if field_name:
+                index = int(field_name)
+            else:
+                index = position
+                position += 1
+
+            segments.append(''.join(segment))
+            segment = []
+            ordered_parts.append(to_node(parts[index]))
+
+        segments.append(''.join(segment))
+
+        return tuple(segments), tuple(ordered_parts)
+
+    @property
+    def _children(self):
+        return self._parts
+
+    def _tokens(self):
+        tokens = [self._segments[0]]
+        for part, segment in zip(self._parts, self._segments[1:]):
+            tokens.append(part)
+            tokens.append(segment)
+
+        return tokens
+
     def __repr__(self):
         return "<Expression '{}'>".format(self)
 
     def __str__(self):
-        return self._expression
+        return compile_sql(self)
@@ -14,6 +14,10 @@ class Interval:
         months (int): Months (``None`` - default)
         years (int): Years (``None`` - default)
     """
+    __slots__ = (
+        'seconds', 'minutes', 'hours', 'days', 'weeks', 'months', 'years',
+    )
+
     def __init__(
             self, seconds=None, minutes=None, hours=None, days=None, weeks=None,
             months=None, years=None,
@@ -26,7 +30,14 @@ class Interval:
         self.months = months
         self.years = years
 
-    def __str__(self):
+    @property
+    def value(self):
+        """
+        Interval value without SQL decoration
+
+        Returns:
+            str: Interval value, e.g. ``'1 days 2 hours'``
+        """
         storage = []
 
         if self.seconds is not None:
@@ -54,7 +65,10 @@ class Interval:
             # default value
             storage.append('1 seconds')
 
-        return "interval '{}'".format(' '.join(storage))
+        return ' '.join(storage)
+
+    def __str__(self):
+        return "interval '{}'".format(self.value)
 
     def __repr__(self):
         return '<{}>'.format(self.__str__().capitalize())
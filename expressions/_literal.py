@@ -0,0 +1,219 @@
+"""Literal value module"""
+import datetime
+import decimal
+import json
+
+from .. import helpers
+from ._interval import Interval
+from ._shape import intern_shape
+
+
+_TYPES = (
+    list, tuple, set, dict, bool, int, float, decimal.Decimal, str, bytes,
+    bytearray, datetime.datetime, datetime.date, datetime.time, Interval,
+)
+
+_KEY = intern_shape(('literal', ''))
+_INTERVAL_KEY = intern_shape(('literal', '::interval'))
+_ARRAY_KEY = intern_shape(('array',))
+
+
+class Literal:
+    """
+    Literal class keeps a value apart from the SQL structure around it
+
+    Args:
+        value (object): Python value (**required**)
+
+    Raises:
+        TypeError: in case value type can not be represented in SQL
+    """
+    __slots__ = ('value', '_key')
+
+    def __init__(self, value):
+        if value is not None and not isinstance(value, _TYPES):
+            raise TypeError(
+                "unsupported literal type: '{}'".format(type(value).__name__),
+            )
+
+        self.value = value
+        self._key = _INTERVAL_KEY if isinstance(value, Interval) else _KEY
+
+    @staticmethod
+    def quote(value):
+        """
+        Renders value inline
+
+        Args:
+            value (object): Python value (**required**)
+
+        Raises:
+            TypeError: in case value type can not be represented in SQL
+
+        Returns:
+            str: Quoted value
+        """
+        if value is None:
+            return 'NULL'
+
+        if isinstance(value, (bytes, bytearray)):
+            return "'\\x{}'".format(value.hex())
+
+        if isinstance(value, (list, tuple, set, dict, bool)):
+            return helpers.quote_ident(json.dumps(value))
+
+        if isinstance(value, (int, float, decimal.Decimal, Interval)):
+            return str(value)
+
+        if isinstance(value, _TYPES):
+            return helpers.quote_ident(value)
+
+        raise TypeError(
+            "unsupported literal type: '{}'".format(type(value).__name__),
+        )
+
+    @staticmethod
+    def adapt(value):
+        """
+        Converts value into bind parameter
+
+        Args:
+            value (object): Python value (**required**)
+
+        Returns:
+            object: Value to pass to DB driver
+        """
+        if isinstance(value, (list, tuple, set, dict)):
+            return json.dumps(value)
+
+        if isinstance(value, Interval):
+            return value.value
+
+        if isinstance(value, bytearray):
+            return bytes(value)
+
+        return value
+
+    @property
+    def sql(self):
+        """
+        Inline SQL representation of the value
+
+        Returns:
+            str: Quoted value
+        """
+        return self.quote(self.value)
+
+    @property
+    def param(self):
+        """
+        Bind parameter representation of the value
+
+        Returns:
+            object: Value to pass to DB driver
+        """
+        return self.adapt(self.value)
+
+    @property
+    def cast(self):
+        """
+        Cast following bind parameter placeholder
+
+        Returns:
+            str: Type cast or empty string
+        """
+        if isinstance(self.value, Interval):
+            return '::interval'
+
+        return ''
+
+    def __repr__(self):
+        return '<Literal {}>'.format(self.sql)
+
+    def __str__(self):
+        return self.sql
+
+
+class Array(Literal):
+    """
+    Array literal, bound as a single parameter whatever its length is
+
+    Args:
+        values (iterable): Python values (**required**)
+
+    Raises:
+        TypeError: in case value type can not be represented in SQL
+    """
+    __slots__ = ()
+
+    def __init__(self, values):
+        values = tuple(values)
+        for value in values:
+            if value is not None and not isinstance(value, _TYPES):
+                raise TypeError(
+                    "unsupported literal type: '{}'".format(type(value).__name__),
+                )
+
+        self.value = values
+        self._key = _ARRAY_KEY
+
+    @property
+    def sql(self):
+        return 'ARRAY[{}]'.format(', '.join(map(self.quote, self.value)))
+
+    @property
+    def param(self):
+        return [self.adapt(value) for value in self.value]
+
+    @property
+    def cast(self):
+        return ''
+
+    def __repr__(self):
+        return '<Array {}>'.format(self.sql)
+
+
+class Placeholder(Literal):
+    """
+    Named value slot filled when compiled query template is rendered
+
+    Args:
+        name (str): Placeholder name (**required**)
+        field (Field): Field adapting and checking rendered values, set when
+            placeholder is compared with the field (``None`` - default)
+    """
+    __slots__ = ('field',)
+
+    def __init__(self, name, field=None):
+        self.value = name
+        self.field = field
+        self._key = _KEY
+
+    @property
+    def name(self):
+        """
+        Placeholder name
+
+        Returns:
+            str: Name
+        """
+        return self.value
+
+    @property
+    def sql(self):
+        return ':{}'.format(self.value)
+
+    @property
+    def param(self):
+        raise ValueError(
+            "placeholder '{}' has no value, compile query into template".format(
+                self.value,
+            ),
+        )
+
+    @property
+    def cast(self):
+        return ''
+
+    def __repr__(self):
+        return '<Placeholder {}>'.format(self.value)
@@ -0,0 +1,347 @@
+"""Expression nodes module"""
+from .. import helpers
+from ._compiler import compile_sql
+from ._shape import intern_shape
+from ._shape import key_of
+
+
+class Node:
+    """Base class of immutable expression tree nodes"""
+    __slots__ = ('_key',)
+
+    @property
+    def _children(self):
+        """
+        Child nodes in render order
+
+        Returns:
+            tuple: Child nodes
+        """
+        return ()
+
+    def _tokens(self):
+        """
+        Describes node rendering
+
+        Returns:
+            tuple: Raw SQL strings and child nodes in render order
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, self)
+
+    def __str__(self):
+        return compile_sql(self)
+
+
+class Column(Node):
+    """
+    Column reference node
+
+    Args:
+        name (str): Column name (**required**)
+        table (str): Table name or alias (``None`` - default)
+        schema (str): Table schema (``None`` - default)
+    """
+    __slots__ = ('name', 'table', 'schema', 'sql')
+
+    def __init__(self, name, table=None, schema=None):
+        self.name = name
+        self.table = table
+        self.schema = schema
+        self._key = intern_shape(('column', name, table, schema))
+
+        if table is None:
+            self.sql = helpers.quote_identifier(name)
+        else:
+            self.sql = helpers.quote_identifier(schema, table, name)
+
+    def _tokens(self):
+        return self.sql,
+
+
+class Operation(Node):
+    """
+    Binary operator node
+
+    Args:
+        operator (str): SQL operator (**required**)
+        left (object): Left operand node (**required**)
+        right (object): Right operand node (**required**)
+        parenthesis (bool): Wrap nested operations into parenthesis
+            (``False`` - default)
+    """
+    __slots__ = ('operator', 'left', 'right', 'parenthesis')
+
+    def __init__(self, operator, left, right, parenthesis=False):
+        self.operator = operator
+        self.left = left
+        self.right = right
+        self.parenthesis = parenthesis
+        self._key = intern_shape((
+            'operation',
+            operator,
+            parenthesis,
+            key_of(left),
+            key_of(right),
+        ))
+
+    @property
+    def _children(self):
+        return self.left, self.right
+
+    def _tokens(self):
+        operator = ' {} '.format(self.operator)
+        if not self.parenthesis:
+            return self.left, operator, self.right
+
+        tokens = []
+        for operand in (self.left, operator, self.right):
+            if isinstance(operand, Operation):
+                tokens.extend(('(', operand, ')'))
+            else:
+                tokens.append(operand)
+
+        return tokens
+
+
+class Function(Node):
+    """
+    Function call node
+
+    Args:
+        name (str): Function name (**required**)
+        args (tuple): Argument nodes (**required**)
+    """
+    __slots__ = ('name', 'args')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self._key = intern_shape((
+            'function',
+            name,
+            tuple(map(key_of, args)),
+        ))
+
+    @property
+    def _children(self):
+        return self.args
+
+    def _tokens(self):
+        tokens = ['{}('.format(self.name)]
+        for arg in self.args:
+            tokens.append(arg)
+            tokens.append(', ')
+        if self.args:
+            tokens.pop()
+        tokens.append(')')
+
+        return tokens
+
+
+class Cast(Node):
+    """
+    Type cast node
+
+    Args:
+        operand (object): Casted node (**required**)
+        as_type (str): SQL type (**required**)
+    """
+    __slots__ = ('operand', 'as_type')
+
+    def __init__(self, operand, as_type):
+        self.operand = operand
+        self.as_type = as_type
+        self._key = intern_shape(('cast', key_of(operand), as_type))
+
+    @property
+    def _children(self):
+        return self.operand,
+
+    def _tokens(self):
+        return 'cast(', self.operand, ' as {})'.format(self.as_type)
+
+
+class Alias(Node):
+    """
+    Aliased expression node
+
+    Args:
+        operand (object): Aliased node (**required**)
+        alias (str): Alias name (**required**)
+    """
+    __slots__ = ('operand', 'alias', 'sql')
+
+    def __init__(self, operand, alias):
+        self.operand = operand
+        self.alias = alias
+        self.sql = ' AS ' + helpers.quote_identifier(alias)
+        self._key = intern_shape(('alias', key_of(operand), alias))
+
+    @property
+    def _children(self):
+        return self.operand,
+
+    def _tokens(self):
+        return self.operand, self.sql
+
+
+class Junction(Node):
+    """
+    N-ary ``AND``/``OR`` node
+
+    Nested junctions of the same operator are merged into one, so a chain of
+    ``&`` or ``|`` renders as a flat list of operands.
+
+    Args:
+        operator (str): ``'AND'`` or ``'OR'`` (**required**)
+        operands (iterable): Operand nodes (**required**)
+    """
+    __slots__ = ('operator', '_operands', '_size')
+
+    def __init__(self, operator, operands):
+        self.operator = operator
+        self._operands = []
+        for operand in operands:
+            self._operands.extend(self._flatten(operand))
+        self._size = len(self._operands)
+        self._key = intern_shape((
+            'junction',
+            operator,
+            tuple(map(key_of, self._operands)),
+        ))
+
+    @classmethod
+    def combine(cls, operator, left, right):
+        """
+        Joins two nodes with ``operator``
+
+        Extending a junction shares its operands storage, so building a chain
+        of N operands costs O(N) in total.
+
+        Args:
+            operator (str): ``'AND'`` or ``'OR'`` (**required**)
+            left (object): Left operand node (**required**)
+            right (object): Right operand node (**required**)
+
+        Returns:
+            Junction: Combined node
+        """
+        if not isinstance(left, cls) or left.operator != operator:
+            return cls(operator, (left, right))
+
+        # pylint: disable=protected-access
+        appended = left._flatten(right)
+        operands = left._operands
+        size = left._size
+        if len(operands) == size:
+            # the storage is shared only if this append landed right after
+            # ``left`` operands, another node could have extended it first
+            operands.extend(appended)
+            if any(
+                    operand is not own
+                    for operand, own in zip(operands[size:], appended)
+            ):
+                operands = operands[:size] + appended
+        else:
+            operands = operands[:size] + appended
+
+        instance = cls.__new__(cls)
+        instance.operator = operator
+        instance._operands = operands
+        instance._size = size + len(appended)
+        instance._key = intern_shape((
+            'junction',
+            operator,
+            left._key,
+            key_of(right),
+        ))
+
+        return instance
+
+    def _flatten(self, operand):
+        if isinstance(operand, Junction) and operand.operator == self.operator:
+            return operand._operands[:operand._size]  # pylint: disable=protected-access
+
+        return [operand]
+
+    @property
+    def _children(self):
+        return tuple(self._operands[:self._size])
+
+    def _tokens(self):
+        separator = ' {} '.format(self.operator)
+        tokens = ['('] if self.operator == 'OR' else []
+        for index in range(self._size):
+            tokens.append(self._operands[index])
+            tokens.append(separator)
+        tokens.pop()
+        if self.operator == 'OR':
+            tokens.append(')')
+
+        return tokens
+
+
+class In(Node):
+    """
+    ``IN`` list node
+
+    Args:
+        operand (object): Tested node (**required**)
+        values (tuple): Value nodes (**required**)
+        negated (bool): Render ``NOT IN`` (``False`` - default)
+    """
+    __slots__ = ('operand', 'values', 'negated')
+
+    def __init__(self, operand, values, negated=False):
+        self.operand = operand
+        self.values = values
+        self.negated = negated
+        self._key = intern_shape((
+            'in',
+            negated,
+            key_of(operand),
+            tuple(map(key_of, values)),
+        ))
+
+    @property
+    def _children(self):
+        return (self.operand, *self.values)
+
+    def _tokens(self):
+        tokens = [self.operand, ' NOT IN (' if self.negated else ' IN (']
+        for value in self.values:
+            tokens.append(value)
+            tokens.append(', ')
+        tokens[-1] = ')'
+
+        return tokens
+
+
+class Values(Node):
+    """
+    Single column ``VALUES`` list node
+
+    Args:
+        values (tuple): Value nodes (**required**)
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        self.values = values
+        self._key = intern_shape(('values', tuple(map(key_of, values))))
+
+    @property
+    def _children(self):
+        return self.values
+
+    def _tokens(self):
+        tokens = ['VALUES (']
+        for value in self.values:
+            tokens.append(value)
+            tokens.append('), (')
+        tokens[-1] = ')'
+
+        return tokens
@@ -0,0 +1,65 @@
+"""Node shape module"""
+import itertools
+
+
+# Shapes are interned into small integers, so node keys stay flat no matter
+# how deep the tree is. Ids are never reused: dropping the table only costs
+# cache misses for shapes built afterwards.
+_SHAPES_LIMIT = 1 << 16
+_shapes = {}
+_ids = itertools.count(1)
+
+
+def intern_shape(shape):
+    """
+    Interns node shape
+
+    Args:
+        shape (tuple): Node tag, its structure and keys of its children (**required**)
+
+    Returns:
+        int: Shape key
+    """
+    key = _shapes.get(shape)
+    if key is None:
+        if len(_shapes) >= _SHAPES_LIMIT:
+            _shapes.clear()
+        key = _shapes.setdefault(shape, next(_ids))
+
+    return key
+
+
+def to_node(part):
+    """
+    Converts query part into node
+
+    Args:
+        part (object): Node, raw SQL string or object able to become node (**required**)
+
+    Returns:
+        object: Node or raw SQL string
+    """
+    if isinstance(part, str) or hasattr(part, '_key'):
+        return part
+
+    convert = getattr(part, '_to_node', None)
+    if convert is None:
+        return str(part)
+
+    return convert()
+
+
+def key_of(node):
+    """
+    Gets shape key of node
+
+    Args:
+        node (object): Node or raw SQL string (**required**)
+
+    Returns:
+        int: Shape key
+    """
+    if isinstance(node, str):
+        return intern_shape(('raw', node))
+
+    return node._key  # pylint: disable=protected-access
@@ -4,4 +4,6 @@ from ._field import Field
 
 class Bytea(Field):
     """Byte field type"""
+    __slots__ = ()
+
     _type = 'bytea'
@@ -4,6 +4,8 @@ from ._field import Field
 
 class Text(Field):
     """Text field type"""
+    __slots__ = ()
+
     _type = 'text'
 
     def __add__(self, other):
@@ -18,7 +20,7 @@ class Text(Field):
         Wraps field into upper(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('upper')
 
@@ -27,13 +29,15 @@ class Text(Field):
         Wraps field into lower(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('lower')
 
 
 class Varchar(Text):
     """Varchar field type"""
+    __slots__ = ('max_length',)
+
     _type = 'varchar'
     _has_constraints = True
 
@@ -42,16 +46,32 @@ class Varchar(Text):
 
         super(Varchar, self).__init__(name, alias, table, max_length=max_length)
 
+    @property
+    def _sql_type(self):
+        return '{}({})'.format(self._type, self.max_length)
+
     def _check_constraints(self, value):
-        if isinstance(value, Field):
-            return True
+        if not self._conforms(value):
+            raise ValueError('value does not conform constraints')
+
+        return True
 
-        if isinstance(value, str) and len(value) <= self.max_length:
-            return True
+    def _conforms(self, value):
+        if isinstance(value, str):
+            return len(value) <= self.max_length
 
-        raise ValueError('value does not conform constraints')
+        return isinstance(value, Field)
+
+    def _all_conform(self, values):
+        present = [value for value in values if value is not None]
+        if set(map(type, present)) - {str}:
+            return False
+
+        return max(map(len, present), default=0) <= self.max_length
 
 
 class Char(Varchar):
     """Char field type"""
+    __slots__ = ()
+
     _type = 'char'
@@ -7,6 +7,8 @@ POSSIBLE_PRECISION = [0, 1, 2, 3, 4, 5, 6]
 
 class Date(Field):
     """Date field type. Look at :class:`~Field`"""
+    __slots__ = ()
+
     _type = 'date'
 
 
@@ -21,17 +23,16 @@ class Time(Field):
         precision (int): Seconds precision (``None`` - default)
         with_tz (bool): Defines field type 'time' or 'timetz' (``False`` - default)
     """
-    _type = 'time'
+    __slots__ = ('precision', 'with_tz')
 
-    def __init__(self, name, alias=None, table=None, precision=None, with_tz=False):
-        if with_tz:
-            self._type = '{}tz'.format(self._type)
+    _base_type = 'time'
 
-        if precision is not None:
-            if precision not in POSSIBLE_PRECISION:
-                raise ValueError('precision must be in [0, 6]')
+    def __init__(self, name, alias=None, table=None, precision=None, with_tz=False):
+        self.with_tz = with_tz
 
-            self.precision = precision
+        if precision is not None and precision not in POSSIBLE_PRECISION:
+            raise ValueError('precision must be in [0, 6]')
+        self.precision = precision
 
         super(Time, self).__init__(
             name,
@@ -41,7 +42,16 @@ class Time(Field):
             with_tz=with_tz,
         )
 
+    @property
+    def _type(self):
+        if self.with_tz:
+            return '{}tz'.format(self._base_type)
+
+        return self._base_type
+
 
 class Timestamp(Time):
     """Timestamp field type. Look at :class:`~Time`"""
-    _type = 'timestamp'
+    __slots__ = ()
+
+    _base_type = 'timestamp'
@@ -1,14 +1,23 @@
 """Field class module"""
-import copy
+import array
 import datetime
 import decimal
-import inspect
-import json
 
-from .. import helpers
+from ..expressions import Alias
+from ..expressions import Array
+from ..expressions import Cast
+from ..expressions import Column
+from ..expressions import Expression
+from ..expressions import Function
+from ..expressions import In
+from ..expressions import Interval
+from ..expressions import Literal
+from ..expressions import Operation
+from ..expressions import Placeholder
+from ..expressions import Values
+from ..expressions import compile_sql
 
 
-# TODO: fix interaction with operations and functions
 class Field:
     """
     General field class. Exists as an abstract
@@ -26,15 +35,37 @@ class Field:
     _unsupported_operand = "unsupported operand type(s) for {}: '{}' and '{}'"
     _unsupported_unary_operand = "bad operand type for unary {}: '{}'"
 
+    __slots__ = (
+        'name',
+        '_alias',
+        '_table',
+        '_schema',
+        '_node',
+        '_column',
+        'kwargs',
+    )
+    _slots = __slots__
+
     _has_constraints = False
-    _functions = None
-    _operations = None
+    _operand_handlers = {}
+    _adapters = {}
+    _in_list_limit = 100
+    _in_strategies = ('inline', 'any', 'values')
+
+    def __init_subclass__(cls, **kwargs):
+        super(Field, cls).__init_subclass__(**kwargs)
+
+        cls._operand_handlers = dict(cls._operand_handlers)
+        cls._adapters = dict(cls._adapters)
+        cls._slots = cls._slots + tuple(vars(cls).get('__slots__', ()))
 
     def __init__(self, name, alias=None, table=None, schema=None, **kwargs):
         self.name = name
         self._alias = alias
         self._table = table
         self._schema = schema
+        self._node = None
+        self._column = None
 
         self.kwargs = kwargs
 
@@ -121,7 +152,12 @@ class Field:
         ))
 
     def __eq__(self, other):
-        self._check_constraints(other)
+        other = self._adapt(other)
+        if isinstance(other, Placeholder):
+            # values are checked when template is rendered
+            other = Placeholder(other.name, self)
+        else:
+            self._check_constraints(other)
 
         return self._general_operation(other, '=')
 
@@ -143,75 +179,84 @@ class Field:
     def __repr__(self):
         return "<{} '{}'>".format(type(self).__name__, self.name)
 
-    def __operation_actions(self, operations):
-        operand, need_parenthesis, value, other_value = operations
-        operand = ' {} '.format(operand)
-
-        if isinstance(value, list):
-            value = self.__operation_actions(value)
-            if need_parenthesis:
-                value = '({})'.format(value)
-        elif isinstance(value, Field):
-            value = self._format_field(value)
-
-        if isinstance(other_value, list):
-            other_value = self.__operation_actions(other_value)
-            if need_parenthesis:
-                other_value = '({})'.format(other_value)
-        elif isinstance(other_value, Field):
-            other_value = self._format_field(other_value)
+    def _as_node(self):
+        if self._node is not None:
+            return self._node
 
-        result = operand.join((value, other_value))
+        # quoted once, until table prefix changes
+        if self._column is None:
+            self._column = Column(self.name, self._table, self._schema)
 
-        if self._functions:
-            result = self._unwrap_functions(self._functions)
+        return self._column
 
+    def _to_node(self):
         if self._alias is None:
-            return result
-
-        return '{} AS {}'.format(result, helpers.quote_literal(self._alias))
-
-    def _format_field(self, value=None):
-        if value is None:
-            value = self
-
-        name = helpers.quote_literal(value.name)
-        if getattr(value, '_table', None) is not None:
-            name = helpers.quote_literal(
-                '.'.join(
-                    filter(None, [
-                        getattr(value, '_schema', None),
-                        getattr(value, '_table', None),
-                        value.name,
-                    ])
-                )
-            )
-
-        if getattr(value, '_functions', None) is not None:
-            name = getattr(
-                value,
-                '_unwrap_functions',
-                self._unwrap_functions,
-            )(getattr(value, '_functions'))
-
-        if getattr(value, '_alias', None) is not None:
-            return '{} AS {}'.format(
-                name,
-                getattr(value, '_alias'),
-            )
+            return self._as_node()
 
-        return name
+        return Alias(self._as_node(), self._alias)
 
     def __str__(self):
-        if self._operations is None:
-            return self._format_field()
+        return compile_sql(self._to_node())
 
-        return self.__operation_actions(self._operations)
+    @property
+    def _sql_type(self):
+        """
+        Type name valid in SQL casts, ``None`` if field has no type
+
+        Returns:
+            str: Type name
+        """
+        return getattr(self, '_type', None)
 
     def _check_constraints(self, _):
         if self._has_constraints:
             raise NotImplementedError('implement in child class')
 
+    def _conforms(self, value):
+        try:
+            self._check_constraints(value)
+        except ValueError:
+            return False
+
+        return True
+
+    def _all_conform(self, values):
+        """
+        Checks values at once, without looking at them one by one if possible
+
+        Args:
+            values (list): Values, ``None`` included (**required**)
+
+        Returns:
+            bool: ``True`` if all values conform, ``False`` if some may not
+        """
+        return not self._has_constraints
+
+    def validate_many(self, values):
+        """
+        Validates values against field constraints in one pass
+
+        Unlike comparisons raising on the first bad value, reports all of
+        them, e.g. to point at bad rows of a bulk load. ``None`` values are
+        left for the DB to check.
+
+        Args:
+            values (iterable): Validated values (**required**)
+
+        Returns:
+            array.array: Indexes of values not conforming constraints
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+
+        if self._all_conform(values):
+            return array.array('q')
+
+        return array.array('q', [
+            index for index, value in enumerate(values)
+            if value is not None and not self._conforms(value)
+        ])
+
     def _general_operation(
         self,
         other,
@@ -219,78 +264,200 @@ class Field:
         need_parenthesis=False,
         inverse=False,
     ):
-        name = None
-        other_value = None
-        value = str(self)
-        if self._operations is not None:
-            value = self._operations
-
-        if isinstance(other, Field):
-            name = '_'.join((self.name, other.name))
-            other_value = other
-            if getattr(other, '_operations') is not None:
-                other_value = getattr(other, '_operations')
-        elif isinstance(other, (list, tuple, set, dict, bool)):
-            name = self.name
-            other_value = helpers.quote_ident(json.dumps(other))
-        elif isinstance(other, (int, float, decimal.Decimal)):
-            name = self.name
-            other_value = str(other)
-        elif isinstance(other, (str, datetime.datetime, datetime.date, datetime.time)):
-            name = self.name
-            other_value = helpers.quote_ident(other)
-        else:
-            func_name = str(inspect.stack()[1].function)
-            getattr(Field(...), func_name)(other)
-
-        instance = self.__class__(name, **self.kwargs)
-        # TODO: test this behavior out (not sure if it's correct)
-        # instance._functions = self._functions
-        setattr(
-            instance,
-            '_operations',
-            [
-                operand,
-                need_parenthesis,
-                *[value, other_value][::-1 if inverse else 1],
-            ],
+        name, other_value = self._coerce_operand(other, operand)
+
+        value = self._as_node()
+        if inverse:
+            value, other_value = other_value, value
+
+        return self._derive(
+            name,
+            Operation(operand, value, other_value, need_parenthesis),
         )
 
+    def _copy(self):
+        instance = object.__new__(self.__class__)
+        for slot in self._slots:
+            setattr(instance, slot, getattr(self, slot))
+        if hasattr(self, '__dict__'):
+            instance.__dict__.update(self.__dict__)
+
+        return instance
+
+    def _derive(self, name, node):
+        instance = self._copy()
+        instance.name = name
+        instance._alias = None
+        instance._table = None
+        instance._schema = None
+        instance._node = node
+        instance._column = None
+
         return instance
 
+    def _coerce_operand(self, other, operand):
+        handlers = self._operand_handlers
+        handler = handlers.get(type(other))
+        if handler is None:
+            for value_type in type(other).__mro__[1:]:
+                handler = handlers.get(value_type)
+                if handler is not None:
+                    break
+            else:
+                raise TypeError(self._unsupported_operand.format(
+                    operand,
+                    type(self).__name__,
+                    type(other).__name__,
+                ))
+
+        return handler(self, other, operand)
+
+    def _adapt(self, value):
+        adapters = self._adapters
+        if adapters:
+            for value_type in type(value).__mro__:
+                adapter = adapters.get(value_type)
+                if adapter is not None:
+                    return adapter(value)
+
+        return value
+
+    def _field_operand(self, other, _):
+        return '_'.join((self.name, other.name)), other._as_node()
+
+    def _literal_operand(self, other, _):
+        return self.name, Literal(other)
+
+    def _expression_operand(self, other, _):
+        return self.name, other
+
+    @classmethod
+    def register_adapter(cls, value_type, adapter):
+        """
+        Registers operand adapter for the class and its subclasses
+
+        Args:
+            value_type (type): Operand type (**required**)
+            adapter (callable): Converts operand of ``value_type`` into
+                supported one (**required**)
+        """
+        def handler(self, other, operand):
+            return self._coerce_operand(adapter(other), operand)
+
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            klass._adapters[value_type] = adapter
+            klass._operand_handlers[value_type] = handler
+            classes.extend(klass.__subclasses__())
+
     def _wrap_function(self, func_name, *args, inverse=False):
-        instance = self.__class__(
-            self.name,
-            self._alias,
-            self._table,
-            self._schema,
-            **self.kwargs,
-        )
-        setattr(instance, '_operations', self._operations)
-        self._alias = None
-
-        functions = copy.deepcopy(self._functions) or self
-        setattr(
-            instance,
-            '_functions',
-            {func_name: (*args, functions) if inverse else (functions, *args)}
+        args = tuple(
+            arg._as_node() if isinstance(arg, Field) else
+            arg if isinstance(arg, Expression) else Literal(arg)
+            for arg in args
         )
+        operand = self._as_node()
+
+        # the call node only references the operand node, so wrapping costs
+        # the same at any depth and leaves this field untouched
+        instance = self._derive(self.name, Function(
+            func_name,
+            (*args, operand) if inverse else (operand, *args),
+        ))
+        instance._alias = self._alias
 
         return instance
 
-    def _unwrap_functions(self, functions):
-        func_name = list(functions.keys())[0]
-        new_args = []
+    def in_(self, values, strategy=None):
+        """
+        Checks field is in values
+
+        Values are deduplicated and sorted, so equal sets render the same
+        query. ``None`` values are dropped, as ``NULL`` never matches.
+        Short lists are inlined as ``IN (...)``, longer ones are bound as
+        one array in ``= ANY(...)`` keeping the query text and its cache
+        entry independent of the amount of values.
 
-        for arg in functions[func_name]:
-            if isinstance(arg, dict):
-                arg = self._unwrap_functions(arg)
-            new_args.append(arg)
+        Args:
+            values (iterable): Compared values (**required**)
+            strategy (str): ``'inline'``, ``'any'`` or ``'values'`` for
+                ``IN (VALUES ...)`` hashed by planner, picked by amount of
+                values if missing (``None`` - default)
 
-        return '{}({})'.format(
-            func_name,
-            ', '.join(['{}'] * len(new_args)).format(*new_args),
-        )
+        Raises:
+            ValueError: in case of unknown strategy or values not conforming
+                to constraints
+
+        Returns:
+            Field: Object with changed inner state
+        """
+        return self._membership(values, strategy, False)
+
+    def not_in(self, values, strategy=None):
+        """
+        Checks field is not in values. Look at :meth:`~Field.in_`
+
+        Args:
+            values (iterable): Compared values (**required**)
+            strategy (str): ``'inline'``, ``'any'`` or ``'values'``, picked
+                by amount of values if missing (``None`` - default)
+
+        Raises:
+            ValueError: in case of unknown strategy or values not conforming
+                to constraints
+
+        Returns:
+            Field: Object with changed inner state
+        """
+        return self._membership(values, strategy, True)
+
+    def _membership(self, values, strategy, negated):
+        if strategy is not None and strategy not in self._in_strategies:
+            raise ValueError('unknown IN strategy: {}'.format(strategy))
+
+        values = self._distinct([
+            self._adapt(value) for value in values if value is not None
+        ])
+        for value in values:
+            self._check_constraints(value)
+
+        if not values:
+            return self._derive(self.name, 'true' if negated else 'false')
+
+        if strategy is None:
+            strategy = 'inline' if len(values) <= self._in_list_limit else 'any'
+
+        operand = self._as_node()
+        if strategy == 'any':
+            array = Array(values)
+            if self._sql_type is not None:
+                array = Cast(array, '{}[]'.format(self._sql_type))
+
+            node = Operation(
+                '<>' if negated else '=',
+                operand,
+                Function('ALL' if negated else 'ANY', (array,)),
+            )
+        else:
+            node = tuple(Literal(value) for value in values)
+            if strategy == 'values':
+                node = Values(node),
+            node = In(operand, node, negated)
+
+        return self._derive(self.name, node)
+
+    @staticmethod
+    def _distinct(values):
+        try:
+            unique = set(values)
+        except TypeError:
+            return values
+
+        try:
+            return sorted(unique)
+        except TypeError:
+            return list(dict.fromkeys(values))
 
     def set_alias(self, alias):
         """
@@ -300,11 +467,12 @@ class Field:
             alias (str): Alias name (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Copy of the field with the alias
         """
-        self._alias = alias
+        instance = self._copy()
+        instance._alias = alias
 
-        return self
+        return instance
 
     def set_table_prefix(self, table, schema):
         """
@@ -315,12 +483,14 @@ class Field:
             schema (str): Schema name (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Copy of the field with the table prefix
         """
-        self._table = table
-        self._schema = schema
+        instance = self._copy()
+        instance._table = table
+        instance._schema = schema
+        instance._column = None
 
-        return self
+        return instance
 
     def cast(self, as_type):
         """
@@ -332,21 +502,10 @@ class Field:
         Returns:
             Field: Object with changed inner state
         """
-        operation = 'cast({} as {})'.format(self, as_type)
-
-        if self._operations is None:
-            return self.__class__(
-                operation,
-                self._alias,
-                self._table,
-                self._schema,
-                **self.kwargs,
-            )
-
-        # TODO: the worst implementation ever
-        self._operations[2] = operation
+        instance = self._derive(self.name, Cast(self._as_node(), as_type))
+        instance._alias = self._alias
 
-        return self
+        return instance
 
     def count(self):
         """
@@ -377,3 +536,19 @@ class Field:
             return self._alias
 
         return str(self)
+
+
+# pylint: disable=protected-access
+Field._operand_handlers.update({
+    Field: Field._field_operand,
+    Expression: Field._expression_operand,
+    Placeholder: Field._expression_operand,
+    **dict.fromkeys(
+        (
+            list, tuple, set, dict, bool, int, float, decimal.Decimal, str,
+            bytes, bytearray, datetime.datetime, datetime.date, datetime.time,
+            Interval,
+        ),
+        Field._literal_operand,
+    ),
+})
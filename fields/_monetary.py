@@ -4,7 +4,10 @@ from ._field import Field
 
 class Monetary(Field):
     """Monetary field type. Look at :class:`~Field`"""
+    __slots__ = ()
+
     _type = 'monetary'
+    _sql_type = 'money'
     _min = -92233720368547758.08
     _max = 92233720368547758.07
     _max_scale = 2
@@ -4,6 +4,10 @@ import decimal
 from ._field import Field
 
 
+# values of no numeric type, rendered as JSON or bytes
+_CONTAINERS = (list, tuple, set, dict, bytes, bytearray)
+
+
 class Decimal(Field):
     """
     Decimal field type
@@ -18,17 +22,39 @@ class Decimal(Field):
     Raises:
         ValueError: When precision or/and scale is/are bigger than allowed
     """
+    __slots__ = ('precision', 'scale')
+
     _type = 'decimal'
+    _has_constraints = True
     _max_magnitude = 131072
     _max_scale = 16383
 
-    def __init__(self, name, alias=None, table=None, precision=None, scale=None):
-        self._max = float('{}.{}'.format(
-            '9' * self._max_magnitude,
-            '9' * self._max_scale,
-        )) if getattr(self, '_max', None) is None else self._max
-        self._min = -self._max if getattr(self, '_min', None) is None else self._min
+    def __init_subclass__(cls, **kwargs):
+        super(Decimal, cls).__init_subclass__(**kwargs)
+
+        cls._set_bounds()
+
+    @classmethod
+    def _set_bounds(cls):
+        """Computes value bounds once per class from magnitude and scale"""
+        own = vars(cls)
+        if '_max_magnitude' in own:
+            # integer part of conforming values is below the limit
+            cls._magnitude_limit = 10 ** cls._max_magnitude
+
+        if '_max' in own or (
+                '_max_magnitude' not in own and '_max_scale' not in own
+        ):
+            return
 
+        cls._max = float('{}.{}'.format(
+            '9' * cls._max_magnitude,
+            '9' * cls._max_scale,
+        ))
+        if '_min' not in own:
+            cls._min = -cls._max
+
+    def __init__(self, name, alias=None, table=None, precision=None, scale=None):
         if precision is not None and self._max_scale + self._max_magnitude < precision:
             raise ValueError('Precision is bigger than allowed')
         self.precision = precision
@@ -96,31 +122,56 @@ class Decimal(Field):
         return self._wrap_function('abs')
 
     def _check_constraints(self, value):
-        if isinstance(value, Field):
+        if not self._conforms(value):
+            raise ValueError('value does not conform constraints')
+
+        return True
+
+    def _conforms(self, value):
+        if isinstance(value, int):
+            return self._min <= value <= self._max and \
+                -self._magnitude_limit < value < self._magnitude_limit
+
+        if isinstance(value, float):
+            # the shortest repr of a float has at most N decimal digits if
+            # rounding to N digits keeps it
+            return self._min <= value <= self._max and \
+                abs(value) < self._magnitude_limit and \
+                round(value, self._max_scale) == value
+
+        if isinstance(value, str):
+            try:
+                value = decimal.Decimal(value)
+            except decimal.InvalidOperation:
+                return False
+        elif isinstance(value, _CONTAINERS):
+            return False
+        elif not isinstance(value, decimal.Decimal):
             return True
 
-        if isinstance(value, (float, decimal.Decimal)):
-            if not self._min <= value <= self._max:
-                raise ValueError('value does not conform constraints')
-            value = str(value)
+        if not value.is_finite() or not self._min <= value <= self._max:
+            return False
 
-        magnitude, *scale = map(len, value.split('.', 1))
-        if scale:
-            scale = scale[0]
-        else:
-            scale = 0
+        _, digits, exponent = value.as_tuple()
+        return len(digits) + exponent <= self._max_magnitude and \
+            -exponent <= self._max_scale
 
-        if magnitude > self._max_magnitude or scale > self._max_scale:
-            raise ValueError('value does not conform constraints')
+    def _all_conform(self, values):
+        present = [value for value in values if value is not None]
+        if not present:
+            return True
+        if set(map(type, present)) - {int}:
+            return False
 
-        return True
+        # conforming integers make a range, its ends are enough to check
+        return self._conforms(min(present)) and self._conforms(max(present))
 
     def max(self):
         """
         Wraps field into max(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('max')
 
@@ -129,7 +180,7 @@ class Decimal(Field):
         Wraps field into min(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('min')
 
@@ -138,7 +189,7 @@ class Decimal(Field):
         Wraps field into avg(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('avg')
 
@@ -147,7 +198,7 @@ class Decimal(Field):
         Wraps field into ceil(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('ceil')
 
@@ -156,7 +207,7 @@ class Decimal(Field):
         Wraps field into degrees(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('degrees')
 
@@ -165,7 +216,7 @@ class Decimal(Field):
         Wraps field into exp(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('exp')
 
@@ -174,7 +225,7 @@ class Decimal(Field):
         Wraps field into floor(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('floor')
 
@@ -183,7 +234,7 @@ class Decimal(Field):
         Wraps field into ln(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('ln')
 
@@ -192,7 +243,7 @@ class Decimal(Field):
         Wraps field into radians(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('radians')
 
@@ -201,7 +252,7 @@ class Decimal(Field):
         Wraps field into sign(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('sign')
 
@@ -210,7 +261,7 @@ class Decimal(Field):
         Wraps field into sqrt(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('sqrt')
 
@@ -219,7 +270,7 @@ class Decimal(Field):
         Wraps field into qbrt(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('cbrt')
 
@@ -228,7 +279,7 @@ class Decimal(Field):
         Wraps field into sin(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('sin')
 
@@ -237,7 +288,7 @@ class Decimal(Field):
         Wraps field into cos(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('cos')
 
@@ -246,7 +297,7 @@ class Decimal(Field):
         Wraps field into asin(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('asin')
 
@@ -255,7 +306,7 @@ class Decimal(Field):
         Wraps field into acos(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('acos')
 
@@ -264,7 +315,7 @@ class Decimal(Field):
         Wraps field into tan(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('tan')
 
@@ -273,7 +324,7 @@ class Decimal(Field):
         Wraps field into cot(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('cot')
 
@@ -282,7 +333,7 @@ class Decimal(Field):
         Wraps field into atan(field)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('atan')
 
@@ -294,7 +345,7 @@ class Decimal(Field):
             value (object): atan2 function argument (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('atan2', value)
 
@@ -308,7 +359,7 @@ class Decimal(Field):
             count (object): width_bucket function argument (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('width_bucket', left_bound, right_bound, count)
 
@@ -320,7 +371,7 @@ class Decimal(Field):
             value (object): mod function argument (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('mod', value)
 
@@ -332,7 +383,7 @@ class Decimal(Field):
             value (object): div function argument (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('div', value)
 
@@ -344,7 +395,7 @@ class Decimal(Field):
             value (object): power function argument (**required**)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('power', value)
 
@@ -356,7 +407,7 @@ class Decimal(Field):
             places (object): round function argument (``0`` - default)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('round', places)
 
@@ -368,7 +419,7 @@ class Decimal(Field):
             places (object): trunc function argument (``0`` - default)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('trunc', places)
 
@@ -380,18 +431,25 @@ class Decimal(Field):
             base (object): log function argument (``10`` - default)
 
         Returns:
-            Field: Same object with changed inner state
+            Field: Object with changed inner state
         """
         return self._wrap_function('log', base, inverse=True)
 
 
+Decimal._set_bounds()  # pylint: disable=protected-access
+
+
 class Double(Decimal):
+    __slots__ = ()
+
     _type = 'double precision'
     _max_magnitude = 15
     _max_scale = 14
 
 
 class BigInt(Decimal):
+    __slots__ = ()
+
     _type = 'bigint'
     _min = -9223372036854775808
     _max = 9223372036854775807
@@ -415,11 +473,16 @@ class BigInt(Decimal):
 
 
 class BigSerial(BigInt):
+    __slots__ = ()
+
     _type = 'bigserial'
+    _sql_type = 'bigint'
     _min = 1
 
 
 class Integer(BigInt):
+    __slots__ = ()
+
     _type = 'integer'
     _min = -2147483648
     _max = 2147483647
@@ -427,17 +490,24 @@ class Integer(BigInt):
 
 
 class Real(Double):
+    __slots__ = ()
+
     _type = 'real'
     _max_magnitude = 6
     _max_scale = 5
 
 
 class Serial(Integer):
+    __slots__ = ()
+
     _type = 'serial'
+    _sql_type = 'integer'
     _min = 1
 
 
 class SmallInt(Integer):
+    __slots__ = ()
+
     _type = 'smallint'
     _min = -32768
     _max = 32767
@@ -445,5 +515,8 @@ class SmallInt(Integer):
 
 
 class SmallSerial(SmallInt):
+    __slots__ = ()
+
     _type = 'smallserial'
+    _sql_type = 'smallint'
     _min = 1
@@ -1,3 +1,8 @@
 """Helpers package"""
+from ._paramstyle import PARAMSTYLES
+from ._paramstyle import escape_text
+from ._paramstyle import placeholders
+
 from ._quotation import quote_ident
+from ._quotation import quote_identifier
 from ._quotation import quote_literal
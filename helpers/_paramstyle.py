@@ -0,0 +1,48 @@
+"""Bind parameters style module"""
+
+
+PARAMSTYLES = {
+    'dollar': '${}',
+    'numeric': ':{}',
+    'format': '%s',
+    'qmark': '?',
+}
+
+
+def placeholders(paramstyle, count, start=1):
+    """Generates bind parameter placeholders
+
+    Args:
+        paramstyle (str): One of ``PARAMSTYLES`` keys (**required**)
+        count (int): Amount of placeholders (**required**)
+        start (int): Position of the first placeholder (``1`` - default)
+
+    Raises:
+        ValueError: in case of unknown paramstyle
+
+    Returns:
+        list: Placeholders in positional order
+    """
+    if paramstyle not in PARAMSTYLES:
+        raise ValueError('unknown paramstyle: {}'.format(paramstyle))
+
+    return [
+        PARAMSTYLES[paramstyle].format(position)
+        for position in range(start, start + count)
+    ]
+
+
+def escape_text(paramstyle, text):
+    """Escapes SQL text for drivers treating percent sign specially
+
+    Args:
+        paramstyle (str): One of ``PARAMSTYLES`` keys (**required**)
+        text (str): SQL text without placeholders (**required**)
+
+    Returns:
+        str: Escaped SQL text
+    """
+    if paramstyle == 'format':
+        return text.replace('%', '%%')
+
+    return text
@@ -1,5 +1,7 @@
 """Quotation module"""
+import functools
 import json
+import sys
 
 
 def quote_ident(ident):
@@ -31,9 +33,25 @@ def quote_literal(literal):
     if literal is None:
         return None
 
-    if '.' in literal:
-        parts = literal.split('.')
+    return quote_identifier(*literal.split('.'))
 
-        return '.'.join('"{}"'.format(part) for part in parts)
 
-    return '"{}"'.format(literal)
+@functools.lru_cache(maxsize=4096)
+def quote_identifier(*parts):
+    """Quotes qualified identifier
+
+    Every part is quoted as a whole, so dots and double quotes inside names
+    are kept as they are.
+
+    Args:
+        *parts (str): Identifier parts, e.g. schema, table and column,
+            empty ones and ``None`` are skipped
+
+    Returns:
+        str: Interned quoted identifier
+    """
+    return sys.intern('.'.join(
+        '"{}"'.format(part.replace('"', '""'))
+        for part in parts
+        if part
+    ))
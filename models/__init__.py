@@ -1,2 +1,8 @@
 """General model module"""
+from ._cache import QueryCache
+from ._cursor import Cursor
+from ._insert import DEFAULT
+from ._join import Join
 from ._model import Model
+from ._query import Query
+from ._template import Template
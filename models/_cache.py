@@ -0,0 +1,147 @@
+"""Compiled query cache module"""
+import collections
+import threading
+
+from .. import helpers
+from ..expressions import collect_literals
+from ..expressions import compile_sql
+from ..expressions import key_of
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'evictions', 'maxsize', 'currsize'],
+)
+
+# NUL can not appear in PostgreSQL query text, so it safely marks value slots
+_SLOT = '\x00'
+
+
+def splice(segments, values):
+    """
+    Interleaves template segments with rendered values
+
+    Args:
+        segments (tuple): SQL text between value slots (**required**)
+        values (iterable): Rendered values, one per slot (**required**)
+
+    Returns:
+        str: SQL query
+    """
+    result = [segments[0]]
+    for value, segment in zip(values, segments[1:]):
+        result.append(value)
+        result.append(segment)
+
+    return ''.join(result)
+
+
+class QueryCache:
+    """
+    Bounded LRU storage of compiled SQL templates keyed on query shape
+
+    Query shape is everything that ends up in SQL text except literal values,
+    so queries differing only in values share one template.
+
+    Args:
+        maxsize (int): Max amount of stored templates (``512`` - default)
+    """
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._templates = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def info(self):
+        """
+        Reports cache statistics
+
+        Returns:
+            CacheInfo: Hits, misses, evictions, max and current size
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._templates),
+        )
+
+    def clear(self):
+        """Drops stored templates and statistics"""
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def compile(self, root, paramstyle=None):
+        """
+        Gets template of the query, compiling it on the first occurrence
+
+        Args:
+            root (object): Query node (**required**)
+            paramstyle (str): Bind parameters style, ``None`` keeps value
+                slots open for inlining (``None`` - default)
+
+        Returns:
+            tuple: Template segments and literal values in slots order
+        """
+        key = paramstyle, key_of(root)
+        values = collect_literals(root)
+
+        with self._lock:
+            segments = self._templates.get(key)
+            if segments is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+
+                return segments, values
+
+            self.misses += 1
+
+        if paramstyle is None:
+            segments = tuple(compile_sql(root, lambda _: _SLOT).split(_SLOT))
+        else:
+            segments = compile_sql(
+                root,
+                lambda literal: _SLOT + literal.cast,
+            ).split(_SLOT)
+            segments = (splice(
+                [helpers.escape_text(paramstyle, segment) for segment in segments],
+                helpers.placeholders(paramstyle, len(segments) - 1),
+            ),)
+
+        with self._lock:
+            self._templates[key] = segments
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+        return segments, values
+
+    def render(self, root, paramstyle=None):
+        """
+        Renders query with values inlined or as bind parameters
+
+        Args:
+            root (object): Query node (**required**)
+            paramstyle (str): Bind parameters style, ``None`` inlines values
+                (``None`` - default)
+
+        Returns:
+            str|tuple: SQL query or SQL query with parameters tuple
+        """
+        segments, values = self.compile(root, paramstyle)
+
+        if paramstyle is None:
+            return splice(segments, (value.sql for value in values))
+
+        return segments[0], tuple(value.param for value in values)
@@ -0,0 +1,258 @@
+"""Columnar bulk load module"""
+from .. import helpers
+from ..expressions import Literal
+from ..fields import Date
+from ..fields import Decimal
+from ..fields import Timestamp
+from ..fields import Varchar
+from ._copy import _BINARY_HEADER
+from ._copy import _BINARY_TRAILER
+from ._copy import copy_payload
+from ._insert import insert_statements
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+# big-endian NumPy types of fixed size binary COPY values
+_BINARY_DTYPES = {
+    'smallint': '>i2',
+    'smallserial': '>i2',
+    'integer': '>i4',
+    'serial': '>i4',
+    'bigint': '>i8',
+    'bigserial': '>i8',
+    'real': '>f4',
+    'double precision': '>f8',
+}
+
+
+# types passed to drivers as they are
+_PLAIN_TYPES = {int, float, str, bool, type(None)}
+
+
+def _is_array(values):
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _converted(attr, field, values):
+    """
+    Converts NumPy array of dates into Python objects
+
+    ``tolist()`` turns ``datetime64`` values of precision finer than
+    microseconds into integers, so they are converted to dates or
+    datetimes at the field precision first.
+
+    Args:
+        attr (str): Field attribute name (**required**)
+        field (Field): Column field (**required**)
+        values (object): NumPy array or list of values (**required**)
+
+    Raises:
+        TypeError: in case array of dates or durations does not match field
+
+    Returns:
+        object: NumPy array or list of values
+    """
+    if not _is_array(values) or values.dtype.kind not in 'mM':
+        return values
+
+    if values.dtype.kind == 'M' and isinstance(field, (Date, Timestamp)):
+        unit = 'D' if isinstance(field, Date) else 'us'
+        return values.astype('datetime64[{}]'.format(unit)).astype(object)
+
+    raise TypeError('{} field {} does not take {} values'.format(
+        type(field).__name__,
+        attr,
+        values.dtype,
+    ))
+
+
+def _violations(field, values):
+    """
+    Finds values not conforming field constraints
+
+    NumPy arrays of integers checked by numeric fields and of strings
+    checked by character fields are validated by array operations, other
+    columns by :meth:`~Field.validate_many`.
+
+    Args:
+        field (Field): Column field (**required**)
+        values (object): NumPy array or list of values (**required**)
+
+    Returns:
+        list: Indexes of violating values
+    """
+    if _is_array(values):
+        kind = values.dtype.kind
+        if kind in 'iu' and isinstance(field, Decimal) and len(values):
+            # conforming integers make a range, its ends are enough to check
+            if not field.validate_many([int(values.min()), int(values.max())]):
+                return []
+        elif kind == 'U' and isinstance(field, Varchar):
+            return numpy.flatnonzero(
+                numpy.char.str_len(values) > field.max_length,
+            ).tolist()
+
+        values = values.tolist()
+
+    return field.validate_many(values).tolist()
+
+
+def column_values(columns, data):
+    """
+    Validates columns of values
+
+    Args:
+        columns (list): Pairs of field attribute name and field (**required**)
+        data (list): NumPy arrays or sequences of values in columns order
+            (**required**)
+
+    Raises:
+        ValueError: in case columns differ in length or values do not
+            conform field constraints
+        TypeError: in case NumPy array of dates does not match field
+
+    Returns:
+        list: NumPy arrays or lists of values
+    """
+    data = [
+        _converted(attr, field, values) if _is_array(values) else list(values)
+        for (attr, field), values in zip(columns, data)
+    ]
+    if len({len(values) for values in data}) > 1:
+        raise ValueError('columns differ in length: {}'.format(', '.join(
+            '{}={}'.format(attr, len(values))
+            for (attr, _), values in zip(columns, data)
+        )))
+
+    for (attr, field), values in zip(columns, data):
+        violations = _violations(field, values)
+        if violations:
+            raise ValueError(
+                '{} values do not conform constraints in rows: {}{}'.format(
+                    attr,
+                    ', '.join(map(str, violations[:10])),
+                    ', ...' if len(violations) > 10 else '',
+                ),
+            )
+
+    return data
+
+
+def _quoted(values):
+    if _is_array(values):
+        if values.dtype.kind in 'iu':
+            return values.astype(str).tolist()
+        values = values.tolist()
+
+    # columns of a single type skip per value type dispatch
+    types = set(map(type, values))
+    if types == {int}:
+        return list(map(str, values))
+    if types == {str}:
+        return list(map(helpers.quote_ident, values))
+
+    return list(map(Literal.quote, values))
+
+
+def _adapted(values):
+    if _is_array(values):
+        values = values.tolist()
+
+    if set(map(type, values)) <= _PLAIN_TYPES:
+        return values
+
+    return list(map(Literal.adapt, values))
+
+
+def columns_statements(table, columns, data, paramstyle=None, **kwargs):
+    """
+    Generates multi-row INSERT statements of columns. Look at
+    :func:`insert_statements`
+
+    Whole columns are quoted or adapted before rows are assembled, integer
+    NumPy arrays are rendered by a single conversion.
+
+    Args:
+        table (str): Quoted table name (**required**)
+        columns (list): Pairs of field attribute name and field (**required**)
+        data (list): Columns returned by :func:`column_values` (**required**)
+        paramstyle (str): Bind parameters style, ``None`` inlines values
+            (``None`` - default)
+        **kwargs: :func:`insert_statements` arguments
+
+    Returns:
+        generator: SQL statements or SQL statements with parameters tuples
+    """
+    encode = _quoted if paramstyle is None else _adapted
+
+    return insert_statements(
+        table,
+        columns,
+        zip(*map(encode, data)),
+        paramstyle=paramstyle,
+        prepared=True,
+        **kwargs,
+    )
+
+
+def columns_payload(  # pylint: disable=redefined-builtin
+        columns,
+        data,
+        format='text',
+        chunk_size=1 << 16,
+):
+    """
+    Generates ``COPY ... FROM STDIN`` data of columns. Look at
+    :func:`copy_payload`
+
+    Binary data of NumPy arrays of fixed size numeric fields is packed by a
+    single structured array conversion.
+
+    Args:
+        columns (list): Pairs of field attribute name and field (**required**)
+        data (list): Columns returned by :func:`column_values` (**required**)
+        format (str): One of ``FORMATS`` (``'text'`` - default)
+        chunk_size (int): Min size of yielded chunk, the last one may be
+            smaller (``65536`` - default)
+
+    Returns:
+        generator: Chunks of bytes
+    """
+    if format == 'binary' and data and all(
+            _is_array(values) and values.dtype.kind in 'iuf' and
+            getattr(field, '_type', None) in _BINARY_DTYPES
+            for (_, field), values in zip(columns, data)
+    ):
+        return _binary_arrays(columns, data, chunk_size)
+
+    rows = zip(*(
+        values.tolist() if _is_array(values) else values
+        for values in data
+    ))
+
+    return copy_payload(columns, rows, format, chunk_size, prepared=True)
+
+
+def _binary_arrays(columns, data, chunk_size):
+    layout = [('count', '>i2')]
+    for index, (_, field) in enumerate(columns):
+        layout.append(('length{}'.format(index), '>i4'))
+        dtype = _BINARY_DTYPES[field._type]  # pylint: disable=protected-access
+        layout.append(('value{}'.format(index), dtype))
+
+    tuples = numpy.empty(len(data[0]), dtype=layout)
+    tuples['count'] = len(columns)
+    for index, values in enumerate(data):
+        value = 'value{}'.format(index)
+        tuples['length{}'.format(index)] = tuples.dtype[value].itemsize
+        tuples[value] = values
+
+    step = max(chunk_size // tuples.dtype.itemsize, 1)
+    yield _BINARY_HEADER + tuples[:step].tobytes()
+    for start in range(step, len(tuples), step):
+        yield tuples[start:start + step].tobytes()
+    yield _BINARY_TRAILER
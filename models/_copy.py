@@ -0,0 +1,461 @@
+"""COPY FROM STDIN payload module"""
+import datetime
+import decimal
+import re
+import struct
+
+from .. import helpers
+from ..expressions import Literal
+from ._insert import row_values
+
+
+FORMATS = ('text', 'csv', 'binary')
+
+_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_BINARY_TRAILER = struct.pack('!h', -1)
+
+_TUPLE = struct.Struct('!h')
+_LENGTH = struct.Struct('!i')
+
+_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+_CSV_QUOTING = re.compile(r'[,"\r\n]|^$|^\\\.$')
+
+_EPOCH_ORDINAL = datetime.date(2000, 1, 1).toordinal()
+_EPOCH = datetime.datetime(2000, 1, 1)
+_EPOCH_TZ = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+# errors of values the binary encoders cannot convert
+_ENCODING_ERRORS = (
+    ArithmeticError,
+    AttributeError,
+    TypeError,
+    ValueError,
+    struct.error,
+)
+
+_NUMERIC_NEGATIVE = 0x4000
+_NUMERIC_NAN = 0xC000
+
+
+def copy_statement(table, columns, format='text'):  # pylint: disable=redefined-builtin
+    """
+    Builds ``COPY ... FROM STDIN`` statement
+
+    Args:
+        table (str): Quoted table name (**required**)
+        columns (list): Pairs of field attribute name and field (**required**)
+        format (str): One of ``FORMATS`` (``'text'`` - default)
+
+    Raises:
+        ValueError: in case of unknown format
+
+    Returns:
+        str: SQL statement
+    """
+    if format not in FORMATS:
+        raise ValueError('unknown COPY format: {}'.format(format))
+
+    statement = 'COPY {} ({}) FROM STDIN'.format(
+        table,
+        ', '.join(helpers.quote_identifier(field.name) for _, field in columns),
+    )
+    if format == 'text':
+        return statement
+
+    return '{} WITH (FORMAT {})'.format(statement, format)
+
+
+def copy_payload(  # pylint: disable=redefined-builtin
+        columns,
+        rows,
+        format='text',
+        chunk_size=1 << 16,
+        prepared=False,
+):
+    """
+    Generates ``COPY ... FROM STDIN`` data
+
+    Args:
+        columns (list): Pairs of field attribute name and field (**required**)
+        rows (iterable): Dicts or tuples of values (**required**)
+        format (str): One of ``FORMATS`` (``'text'`` - default)
+        chunk_size (int): Min size of yielded chunk, the last one may be
+            smaller (``65536`` - default)
+        prepared (bool): Rows are validated values in columns order
+            (``False`` - default)
+
+    Raises:
+        ValueError: in case of unknown format, rows not matching columns,
+            values not conforming field constraints or not convertible to
+            binary format of the field
+        TypeError: in case binary format does not support column type
+
+    Returns:
+        generator: Chunks of bytes
+    """
+    if format not in FORMATS:
+        raise ValueError('unknown COPY format: {}'.format(format))
+
+    if format == 'binary':
+        encoders = [_binary_encoder(field) for _, field in columns]
+        return _binary_payload(columns, encoders, rows, chunk_size, prepared)
+
+    if format == 'csv':
+        return _text_payload(
+            columns, rows, chunk_size, ',', _csv_value, prepared,
+        )
+
+    return _text_payload(
+        columns, rows, chunk_size, '\t', _text_value, prepared,
+    )
+
+
+def _plain_text(value):
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(' ')
+
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (bytes, bytearray)):
+        return '\\x' + value.hex()
+
+    return str(Literal.adapt(value))
+
+
+def _text_value(value):
+    if value is None:
+        return '\\N'
+
+    return _plain_text(value).translate(_TEXT_ESCAPES)
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+
+    value = _plain_text(value)
+    if _CSV_QUOTING.search(value):
+        return '"{}"'.format(value.replace('"', '""'))
+
+    return value
+
+
+def _text_payload(columns, rows, chunk_size, delimiter, render, prepared):
+    lines = []
+    size = 0
+    for row in rows:
+        values = row if prepared else row_values(row, columns, False)
+        line = delimiter.join(map(render, values))
+        line = (line + '\n').encode()
+        lines.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield b''.join(lines)
+            lines = []
+            size = 0
+
+    if lines:
+        yield b''.join(lines)
+
+
+def _integer(value):
+    if isinstance(value, int):
+        return value,
+    if isinstance(value, str):
+        return int(value),
+
+    integral = int(value)
+    if integral != value:
+        raise ValueError('{!r} is not integral'.format(value))
+
+    return integral,
+
+
+def _decimal(value):
+    if isinstance(value, decimal.Decimal):
+        return value
+    if isinstance(value, float):
+        return decimal.Decimal(repr(value))
+
+    return decimal.Decimal(str(value))
+
+
+def _date(value):
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value)
+
+    return value.toordinal() - _EPOCH_ORDINAL,
+
+
+def _time(value):
+    if isinstance(value, str):
+        value = datetime.time.fromisoformat(value)
+
+    return _time_micros(value),
+
+
+def _datetime(value):
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+
+    return value
+
+
+def _micros(delta):
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _time_micros(value):
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1000000 + value.microsecond
+
+
+def _timestamp(value):
+    value = _datetime(value)
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+
+    return _micros(value - _EPOCH),
+
+
+def _timestamptz(value):
+    value = _datetime(value)
+    if value.tzinfo is None:
+        return _micros(value - _EPOCH),
+
+    return _micros(value - _EPOCH_TZ),
+
+
+def _timetz(value):
+    if isinstance(value, str):
+        value = datetime.time.fromisoformat(value)
+
+    offset = value.utcoffset() or datetime.timedelta()
+    # PostgreSQL keeps time zone as seconds west of UTC
+    return _time_micros(value), -int(offset.total_seconds())
+
+
+def _numeric(value):
+    if isinstance(value, int):
+        sign, coefficient, exponent = value < 0, abs(value), 0
+    else:
+        value = _decimal(value)
+        if value.is_nan():
+            return struct.pack('!hhHH', 0, 0, _NUMERIC_NAN, 0)
+        if value.is_infinite():
+            raise ValueError('numeric does not support infinity')
+
+        sign, digits, exponent = value.as_tuple()
+        coefficient = 0
+        for digit in digits:
+            coefficient = coefficient * 10 + digit
+
+    scale = max(-exponent, 0)
+    if exponent > 0:
+        coefficient *= 10 ** exponent
+        exponent = 0
+
+    # numeric keeps base 10000 digits, so scale is aligned to 4 decimal digits
+    padding = exponent % 4
+    coefficient *= 10 ** padding
+    fractional = (-exponent + padding) // 4
+
+    groups = []
+    while coefficient:
+        coefficient, group = divmod(coefficient, 10000)
+        groups.append(group)
+    weight = len(groups) - fractional - 1
+
+    groups.reverse()
+    while groups and not groups[-1]:
+        groups.pop()
+    if not groups:
+        weight = 0
+        sign = False
+
+    return struct.pack(
+        '!hhHH{}H'.format(len(groups)),
+        len(groups),
+        weight,
+        _NUMERIC_NEGATIVE if sign else 0,
+        scale,
+        *groups,
+    )
+
+
+def _monetary(scale):
+    factor = 10 ** scale
+
+    def convert(value):
+        if isinstance(value, int):
+            return value * factor,
+
+        return int(_decimal(value).scaleb(scale).to_integral_value()),
+
+    return convert
+
+
+def _text_bytes(value):
+    if not isinstance(value, str):
+        value = _plain_text(value)
+
+    return value.encode()
+
+
+def _binary_encoder(field):
+    """
+    Picks binary encoding of the field type
+
+    Args:
+        field (Field): Column field (**required**)
+
+    Raises:
+        TypeError: in case field type has no binary encoding
+
+    Returns:
+        tuple: ``struct.Struct`` of length prefix and fixed size value with
+            converter returning struct values, or ``None`` with converter
+            returning bytes of variable size value
+    """
+    field_type = getattr(field, '_type', None)
+
+    if field_type in ('smallint', 'smallserial'):
+        return struct.Struct('!ih'), _integer
+    if field_type in ('integer', 'serial'):
+        return struct.Struct('!ii'), _integer
+    if field_type in ('bigint', 'bigserial'):
+        return struct.Struct('!iq'), _integer
+    if field_type == 'real':
+        return struct.Struct('!if'), lambda value: (float(value),)
+    if field_type == 'double precision':
+        return struct.Struct('!id'), lambda value: (float(value),)
+    if field_type == 'decimal':
+        return None, _numeric
+    if field_type == 'monetary':
+        # pylint: disable=protected-access
+        return struct.Struct('!iq'), _monetary(field._max_scale)
+    if field_type in ('text', 'varchar', 'char'):
+        return None, _text_bytes
+    if field_type == 'bytea':
+        return None, bytes
+    if field_type == 'date':
+        return struct.Struct('!ii'), _date
+    if field_type == 'time':
+        return struct.Struct('!iq'), _time
+    if field_type == 'timetz':
+        return struct.Struct('!iqi'), _timetz
+    if field_type == 'timestamp':
+        return struct.Struct('!iq'), _timestamp
+    if field_type == 'timestamptz':
+        return struct.Struct('!iq'), _timestamptz
+
+    raise TypeError('binary COPY does not support {} field {}'.format(
+        type(field).__name__,
+        field.name,
+    ))
+
+
+def _raise_unencodable(columns, encoders, values):
+    """
+    Finds value failing binary encoding of its column
+
+    Args:
+        columns (list): Pairs of field attribute name and field (**required**)
+        encoders (list): Encoders returned by :func:`_binary_encoder`
+            (**required**)
+        values (tuple): Row values in columns order (**required**)
+
+    Raises:
+        ValueError: naming column of the value
+    """
+    for (attr, field), (packer, convert), value in zip(
+            columns,
+            encoders,
+            values,
+    ):
+        if value is None:
+            continue
+
+        try:
+            if packer is None:
+                convert(value)
+            else:
+                packer.pack(0, *convert(value))
+        except _ENCODING_ERRORS as error:
+            raise ValueError(
+                '{} value {!r} is not convertible to binary {}: {}'.format(
+                    attr,
+                    value,
+                    field._type,  # pylint: disable=protected-access
+                    error,
+                ),
+            ) from error
+
+
+def _reserve(buffer, offset, size):
+    shortage = offset + size - len(buffer)
+    if shortage > 0:
+        buffer.extend(bytes(max(shortage, len(buffer))))
+
+
+def _binary_payload(columns, encoders, rows, chunk_size, prepared):
+    count = len(columns)
+    buffer = bytearray(chunk_size + len(_BINARY_HEADER))
+    buffer[:len(_BINARY_HEADER)] = _BINARY_HEADER
+    offset = len(_BINARY_HEADER)
+
+    for row in rows:
+        values = row if prepared else row_values(row, columns, False)
+
+        _reserve(buffer, offset, _TUPLE.size)
+        _TUPLE.pack_into(buffer, offset, count)
+        offset += _TUPLE.size
+
+        try:
+            for value, (packer, convert) in zip(values, encoders):
+                if value is None:
+                    _reserve(buffer, offset, _LENGTH.size)
+                    _LENGTH.pack_into(buffer, offset, -1)
+                    offset += _LENGTH.size
+                elif packer is not None:
+                    _reserve(buffer, offset, packer.size)
+                    packer.pack_into(
+                        buffer,
+                        offset,
+                        packer.size - _LENGTH.size,
+                        *convert(value),
+                    )
+                    offset += packer.size
+                else:
+                    data = convert(value)
+                    end = offset + _LENGTH.size + len(data)
+                    _reserve(buffer, offset, end - offset)
+                    _LENGTH.pack_into(buffer, offset, len(data))
+                    buffer[offset + _LENGTH.size:end] = data
+                    offset = end
+        except _ENCODING_ERRORS:
+            _raise_unencodable(columns, encoders, values)
+
+        if offset >= chunk_size:
+            with memoryview(buffer) as view:
+                chunk = bytes(view[:offset])
+            offset = 0
+            yield chunk
+
+    _reserve(buffer, offset, len(_BINARY_TRAILER))
+    buffer[offset:offset + len(_BINARY_TRAILER)] = _BINARY_TRAILER
+    offset += len(_BINARY_TRAILER)
+
+    with memoryview(buffer) as view:
+        chunk = bytes(view[:offset])
+    yield chunk
@@ -0,0 +1,115 @@
+"""Keyset pagination cursor module"""
+import base64
+import binascii
+import datetime
+import decimal
+import json
+
+
+_ENCODERS = (
+    (datetime.datetime, 'datetime', datetime.datetime.isoformat),
+    (datetime.date, 'date', datetime.date.isoformat),
+    (datetime.time, 'time', datetime.time.isoformat),
+    (decimal.Decimal, 'decimal', str),
+    ((bytes, bytearray), 'bytes', lambda value: value.hex()),
+)
+
+_DECODERS = {
+    'datetime': datetime.datetime.fromisoformat,
+    'date': datetime.date.fromisoformat,
+    'time': datetime.time.fromisoformat,
+    'decimal': decimal.Decimal,
+    'bytes': bytes.fromhex,
+}
+
+
+def _tag(value):
+    for value_type, tag, encode in _ENCODERS:
+        if isinstance(value, value_type):
+            return [tag, encode(value)]
+
+    return value
+
+
+class Cursor:
+    """
+    Opaque keyset pagination cursor codec
+
+    Cursor keeps values of order fields from the last row of a page, so the
+    next page seeks right after it instead of skipping rows with ``OFFSET``.
+
+    Args:
+        fields (list): Pairs of field attribute name and field in order by
+            sequence (**required**)
+    """
+    __slots__ = ('fields',)
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def encode(self, row):
+        """
+        Builds cursor pointing right after the row
+
+        Args:
+            row (dict|tuple): Row keyed by field attribute names or column
+                names, or order fields values in order (**required**)
+
+        Raises:
+            ValueError: in case row misses order fields values
+
+        Returns:
+            str: URL safe cursor
+        """
+        if isinstance(row, dict):
+            try:
+                values = [
+                    row[attr] if attr in row else row[field.name]
+                    for attr, field in self.fields
+                ]
+            except KeyError as error:
+                raise ValueError('row misses value of {}'.format(error)) from None
+        else:
+            values = list(row)
+            if len(values) != len(self.fields):
+                raise ValueError('row has {} values, expected {}'.format(
+                    len(values),
+                    len(self.fields),
+                ))
+
+        payload = json.dumps(
+            [_tag(value) for value in values],
+            separators=(',', ':'),
+        )
+
+        return base64.urlsafe_b64encode(payload.encode()).rstrip(b'=').decode()
+
+    def decode(self, cursor):
+        """
+        Extracts order fields values from cursor
+
+        Args:
+            cursor (str): Cursor built by :meth:`~Cursor.encode` (**required**)
+
+        Raises:
+            ValueError: in case cursor is malformed or built for other fields
+
+        Returns:
+            tuple: Order fields values
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(payload)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError('malformed cursor') from None
+
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise ValueError('cursor does not match order fields')
+
+        try:
+            return tuple(
+                _DECODERS[value[0]](value[1]) if isinstance(value, list) else value
+                for value in values
+            )
+        except (IndexError, KeyError, TypeError, ValueError, decimal.InvalidOperation):
+            raise ValueError('malformed cursor') from None
@@ -0,0 +1,236 @@
+"""Bulk insert module"""
+import itertools
+
+from .. import helpers
+from ..expressions import Literal
+
+
+# PostgreSQL protocol counts bind parameters with a 16-bit integer
+MAX_PARAMS = 65535
+
+
+class _Default:
+    """Marks value missing in a row, rendered as ``DEFAULT``"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'DEFAULT'
+
+
+DEFAULT = _Default()
+
+
+def row_values(row, columns, defaults=True):
+    """
+    Extracts and validates row values in columns order
+
+    Args:
+        row (dict|tuple): Values keyed by field attribute names or
+            positional values (**required**)
+        columns (list): Pairs of field attribute name and field (**required**)
+        defaults (bool): Allow dict row to miss keys (``True`` - default)
+
+    Raises:
+        ValueError: in case row does not match columns or values do not
+            conform field constraints
+
+    Returns:
+        list: Row values, :data:`DEFAULT` for keys missing in dict row
+    """
+    if isinstance(row, dict):
+        values = [row.get(attr, DEFAULT) for attr, _ in columns]
+        missing = values.count(DEFAULT)
+        if len(row) > len(values) - missing:
+            raise ValueError('unknown fields: {}'.format(
+                ', '.join(sorted(set(row) - {attr for attr, _ in columns})),
+            ))
+        if missing and not defaults:
+            raise ValueError('row misses values for: {}'.format(', '.join(
+                attr for value, (attr, _) in zip(values, columns)
+                if value is DEFAULT
+            )))
+    else:
+        values = list(row)
+        if len(values) != len(columns):
+            raise ValueError('row has {} values, expected {}'.format(
+                len(values),
+                len(columns),
+            ))
+
+    for value, (_, field) in zip(values, columns):
+        if value is not None and value is not DEFAULT:
+            field._check_constraints(value)  # pylint: disable=protected-access
+
+    return values
+
+
+def _conflict_clause(on_conflict, update):
+    if on_conflict is None:
+        return ''
+
+    target = ', '.join(helpers.quote_identifier(field.name) for _, field in on_conflict)
+    if not update:
+        return ' ON CONFLICT ({}) DO NOTHING'.format(target)
+
+    return ' ON CONFLICT ({}) DO UPDATE SET {}'.format(
+        target,
+        ', '.join(
+            '{column} = EXCLUDED.{column}'.format(
+                column=helpers.quote_identifier(field.name),
+            )
+            for _, field in update
+        ),
+    )
+
+
+def insert_statements(
+        table,
+        columns,
+        rows,
+        batch_size=1000,
+        max_bytes=1 << 20,
+        on_conflict=None,
+        update=None,
+        paramstyle=None,
+        prepared=False,
+):
+    """
+    Generates multi-row INSERT statements. Look at :func:`values_statements`
+
+    Args:
+        table (str): Quoted table name (**required**)
+        columns (list): Pairs of field attribute name and field (**required**)
+        rows (iterable): Dicts or tuples of values (**required**)
+        batch_size (int): Max rows per statement (``1000`` - default)
+        max_bytes (int): Max UTF-8 size of inlined statement
+            (``1048576`` - default)
+        on_conflict (list): Conflict target columns (``None`` - default)
+        update (list): Columns updated on conflict, ``DO NOTHING`` if empty
+            (``None`` - default)
+        paramstyle (str): Bind parameters style, ``None`` inlines values
+            (``None`` - default)
+        prepared (bool): Rows are validated values in columns order, quoted
+            unless ``paramstyle`` is set (``False`` - default)
+
+    Returns:
+        generator: SQL statements or SQL statements with parameters tuples
+    """
+    return values_statements(
+        'INSERT INTO {} ({}) VALUES '.format(
+            table,
+            ', '.join(helpers.quote_identifier(field.name) for _, field in columns),
+        ),
+        _conflict_clause(on_conflict, update),
+        columns,
+        rows,
+        batch_size,
+        max_bytes,
+        paramstyle,
+        prepared=prepared,
+    )
+
+
+def values_statements(
+        header,
+        footer,
+        columns,
+        rows,
+        batch_size=1000,
+        max_bytes=1 << 20,
+        paramstyle=None,
+        casts=None,
+        defaults=True,
+        prepared=False,
+):
+    """
+    Generates statements around VALUES lists of rows
+
+    A statement is flushed as soon as it holds ``batch_size`` rows or its
+    text would outgrow ``max_bytes``; with bind parameters the statement is
+    also kept under PostgreSQL's parameters limit. Rows are consumed lazily,
+    so memory usage does not depend on the amount of rows.
+
+    Args:
+        header (str): SQL preceding VALUES rows (**required**)
+        footer (str): SQL following VALUES rows (**required**)
+        columns (list): Pairs of field attribute name and field (**required**)
+        rows (iterable): Dicts or tuples of values (**required**)
+        batch_size (int): Max rows per statement (``1000`` - default)
+        max_bytes (int): Max UTF-8 size of inlined statement
+            (``1048576`` - default)
+        paramstyle (str): Bind parameters style, ``None`` inlines values
+            (``None`` - default)
+        casts (list): Type casts of the first row values fixing VALUES
+            column types (``None`` - default)
+        defaults (bool): Render values missing in dict rows as ``DEFAULT``
+            (``True`` - default)
+        prepared (bool): Rows are validated values in columns order, quoted
+            unless ``paramstyle`` is set (``False`` - default)
+
+    Yields:
+        str|tuple: SQL statement or SQL statement with parameters tuple
+    """
+    if casts is None:
+        casts = [''] * len(columns)
+    if paramstyle is not None:
+        header = helpers.escape_text(paramstyle, header)
+        footer = helpers.escape_text(paramstyle, footer)
+        batch_size = min(batch_size, MAX_PARAMS // len(columns))
+
+    base_size = len(header.encode()) + len(footer.encode())
+    batch = []
+    params = []
+    size = base_size
+
+    for row in rows:
+        values = row if prepared else row_values(row, columns, defaults)
+
+        if paramstyle is not None:
+            if len(batch) >= batch_size:
+                yield header + ', '.join(batch) + footer, tuple(params)
+                batch = []
+                params = []
+
+            bound = [value for value in values if value is not DEFAULT]
+            slots = iter(helpers.placeholders(
+                paramstyle,
+                len(bound),
+                len(params) + 1,
+            ))
+            row_casts = itertools.repeat('') if batch else casts
+            batch.append('({})'.format(', '.join(
+                'DEFAULT' if value is DEFAULT else next(slots) + cast
+                for value, cast in zip(values, row_casts)
+            )))
+            params.extend(bound if prepared else map(Literal.adapt, bound))
+            continue
+
+        if prepared:
+            quoted = values
+        else:
+            quoted = [
+                'DEFAULT' if value is DEFAULT else Literal.quote(value)
+                for value in values
+            ]
+        row_size = len(', '.join(quoted).encode()) + 4
+        if batch and (len(batch) >= batch_size or size + row_size > max_bytes):
+            yield header + ', '.join(batch) + footer
+            batch = []
+            size = base_size
+
+        if not batch:
+            quoted = [
+                text if value is DEFAULT else text + cast
+                for text, value, cast in zip(quoted, values, casts)
+            ]
+            row_size = len(', '.join(quoted).encode()) + 4
+        batch.append('({})'.format(', '.join(quoted)))
+        size += row_size
+
+    if not batch:
+        return
+
+    if paramstyle is None:
+        yield header + ', '.join(batch) + footer
+    else:
+        yield header + ', '.join(batch) + footer, tuple(params)
@@ -0,0 +1,273 @@
+"""Joined models module"""
+from .. import helpers
+from ..expressions import Column
+from ..expressions import Expression
+from ..expressions import Literal
+from ..expressions import Node
+from ..expressions import intern_shape
+from ..expressions import key_of
+from ..expressions import to_node
+from ..fields import Field
+from ..states import State, transition
+from ._query import Query
+
+
+JOIN_KINDS = {
+    'inner': 'INNER JOIN',
+    'left': 'LEFT JOIN',
+    'right': 'RIGHT JOIN',
+    'full': 'FULL JOIN',
+    'cross': 'CROSS JOIN',
+}
+
+
+def _reference(model):
+    # pylint: disable=protected-access
+    if model._alias is None:
+        return model._name, model._schema
+
+    return model._alias, None
+
+
+def _references(nodes, prefixes):
+    """
+    Finds tables referenced by node trees
+
+    Args:
+        nodes (iterable): Nodes or raw SQL strings (**required**)
+        prefixes (dict): Quoted column prefix of each table reference
+            (**required**)
+
+    Returns:
+        set: Table references
+    """
+    found = set()
+    stack = list(nodes)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            # raw SQL can not be parsed, it keeps tables it mentions
+            found.update(
+                reference for reference, prefix in prefixes.items()
+                if prefix in item
+            )
+        elif isinstance(item, Column):
+            found.add((item.table, item.schema))
+        elif not isinstance(item, (From, Literal)):
+            stack.extend(item._tokens())  # pylint: disable=protected-access
+
+    return found
+
+
+class From(Node):
+    """
+    ``FROM`` list node of joined tables
+
+    Args:
+        table (str): Quoted first table with alias if any (**required**)
+        joins (tuple): Quoted ``JOIN`` SQL and ``ON`` node (or ``None``)
+            pairs (**required**)
+    """
+    __slots__ = ('table', 'joins')
+
+    def __init__(self, table, joins):
+        self.table = table
+        self.joins = joins
+        self._key = intern_shape((
+            'from',
+            table,
+            tuple(
+                (sql, None if on is None else key_of(on))
+                for sql, on in joins
+            ),
+        ))
+
+    @property
+    def _children(self):
+        return tuple(on for _, on in self.joins if on is not None)
+
+    def _tokens(self):
+        tokens = [self.table]
+        for sql, on in self.joins:
+            tokens.append(' ')
+            tokens.append(sql)
+            if on is not None:
+                tokens.append(' ON ')
+                tokens.append(on)
+
+        return tokens
+
+
+class Join:
+    """
+    Models joined together, builds queries over all of them
+
+    Joins marked as prunable are left out of queries neither selecting nor
+    filtering by their tables. Pruning is only correct for joins matching at
+    most one row and not filtering rows out, i.e. ``LEFT JOIN`` of a table
+    unique on the join key, e.g. a lookup table by its primary key. Other
+    joins change row counts and aggregates, so pruning is opt-in.
+
+    Args:
+        model (Model): First model (**required**)
+        joins (tuple): Joined model, kind, ``ON`` node and prunable flag
+            tuples (``()`` - default)
+    """
+    __slots__ = ('_model', '_joins')
+
+    def __init__(self, model, joins=()):
+        self._model = model
+        self._joins = joins
+
+    @property
+    def _cache(self):
+        return self._model._cache  # pylint: disable=protected-access
+
+    @property
+    def _attrs_by_name(self):
+        attrs = {}
+        for model in reversed(self._models):
+            attrs.update(model._attrs_by_name)  # pylint: disable=protected-access
+
+        return attrs
+
+    @property
+    def _models(self):
+        return [self._model] + [join[0] for join in self._joins]
+
+    def join(self, other, on=None, kind='inner', prune=False):
+        """
+        Joins one more model
+
+        Args:
+            other (Model): Joined model, alias it to join a table twice
+                (**required**)
+            on (object): Join condition, :class:`~Clause` or field
+                comparison, required unless ``kind`` is ``'cross'``
+                (``None`` - default)
+            kind (str): ``'inner'``, ``'left'``, ``'right'``, ``'full'`` or
+                ``'cross'`` (``'inner'`` - default)
+            prune (bool): Drop join from queries not referencing the model,
+                only set it for left joins of a model unique on the join key
+                (``False`` - default)
+
+        Raises:
+            ValueError: in case of unknown kind, missing condition or table
+                reference clash
+
+        Returns:
+            Join: Joined models
+        """
+        if kind not in JOIN_KINDS:
+            raise ValueError('unknown join kind: {}'.format(kind))
+        if (on is None) != (kind == 'cross'):
+            raise ValueError('{} join {} condition'.format(
+                kind,
+                'takes no' if kind == 'cross' else 'requires',
+            ))
+        if _reference(other) in map(_reference, self._models):
+            raise ValueError('table {} is already joined, alias it'.format(
+                '.'.join(filter(None, reversed(_reference(other)))),
+            ))
+
+        return self.__class__(self._model, self._joins + ((
+            other,
+            kind,
+            None if on is None else to_node(on),
+            prune,
+        ),))
+
+    def select(self, *fields):
+        """
+        Selects fields of joined models
+
+        Class level fields are bound to the first joined model declaring
+        them, bind fields of models joined twice through their instances.
+
+        Args:
+            *fields (object): Selected fields, all if missing
+
+        Returns:
+            Query: Query node
+        """
+        if fields:
+            fields = [self._set_field_alias(field) for field in fields]
+        else:
+            # pylint: disable=protected-access
+            fields = [model._set_field_alias('*') for model in self._models]
+
+        return Query(
+            self,
+            transition(State.JOIN, State.SELECT),
+            Expression(
+                'SELECT {fields} FROM {{}}'.format(
+                    fields=', '.join(['{}'] * len(fields)),
+                ),
+                *fields,
+                self._from(self._joins),
+            ),
+        )
+
+    def _columns(self, _):
+        raise ValueError(
+            'keyset pagination of joined models is not supported',
+        )
+
+    def _set_field_alias(self, field):
+        # pylint: disable=protected-access
+        if isinstance(field, Field):
+            for model in self._models:
+                if any(own is field for own in model._fields.values()):
+                    return model._set_field_alias(field)
+
+        return self._model._set_field_alias(field)
+
+    def _from(self, joins):
+        # pylint: disable=protected-access
+        return From(self._model._table_name, tuple(
+            ('{} {}'.format(JOIN_KINDS[kind], model._table_name), on)
+            for model, kind, on, _ in joins
+        ))
+
+    def _plan(self, clauses):
+        """
+        Prunes joins not referenced by query
+
+        Args:
+            clauses (list): Query clauses, the first one selects from joined
+                models (**required**)
+
+        Returns:
+            list: Query clauses
+        """
+        if not any(prune for _, _, _, prune in self._joins):
+            return clauses
+
+        prefixes = {
+            _reference(model): helpers.quote_identifier(
+                *reversed(_reference(model)),
+            ) + '.'
+            for model in self._models
+        }
+        needed = _references(clauses, prefixes)
+
+        joins = []
+        for join in reversed(self._joins):
+            model, _, on, prune = join
+            if prune and _reference(model) not in needed:
+                continue
+
+            joins.append(join)
+            if on is not None:
+                needed |= _references((on,), prefixes)
+        joins.reverse()
+
+        if len(joins) == len(self._joins):
+            return clauses
+
+        # pylint: disable=protected-access
+        select = clauses[0]
+        return [
+            Expression(select._expression, *select._parts[:-1], self._from(joins)),
+            *clauses[1:],
+        ]
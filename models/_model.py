@@ -1,107 +1,511 @@
+import itertools
+import sys
+
 from .. import helpers
+from ..expressions import Expression
 from ..fields import Field
-from ..states import (
-    GroupBy, Select, Initial, Limit, Offset, OrderBy, Where, state_aware,
-)
+from ..states import State, transition
+from ._cache import QueryCache
+from ._columns import column_values
+from ._columns import columns_payload
+from ._columns import columns_statements
+from ._copy import copy_payload
+from ._copy import copy_statement
+from ._insert import insert_statements
+from ._join import Join
+from ._query import Query
+from ._update import update_statements
+
+
+class _FieldDescriptor:
+    """Binds class-level field to model instance on first access"""
+    __slots__ = ('_attr', '_field')
+
+    def __init__(self, attr, field):
+        self._attr = attr
+        self._field = field
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._field
+
+        # pylint: disable=protected-access
+        field = instance._bind(self._field)
+        instance.__dict__[self._attr] = field
+
+        return field
 
 
 class Model:
+    _cache = QueryCache()
+    _fields = {}
+    _attrs_by_name = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super(Model, cls).__init_subclass__(**kwargs)
+
+        fields = dict(cls._fields)
+        for attr, value in list(vars(cls).items()):
+            if isinstance(value, Field):
+                fields[attr] = value
+                setattr(cls, attr, _FieldDescriptor(attr, value))
+
+        cls._fields = fields
+        cls._attrs_by_name = {
+            field.name: attr for attr, field in fields.items()
+        }
+
     def __init__(self, name, alias=None, schema=None):
         self._name = name
         self._alias = alias
         self._schema = schema
 
-        self._state = Initial()
-        self._storage = []
+        # names are rendered into every query of the model
+        self._qualified_name = helpers.quote_identifier(schema, name)
+        if alias is None:
+            self._table_name = self._qualified_name
+        else:
+            self._table_name = sys.intern('{} AS {}'.format(
+                self._qualified_name,
+                helpers.quote_identifier(alias),
+            ))
+
+    def _bind(self, field):
+        if self._alias is None:
+            return field.set_table_prefix(self._name, self._schema)
+
+        return field.set_table_prefix(self._alias, None)
+
+    def select(self, *fields):
+        if fields:
+            fields = list(map(self._set_field_alias, fields))
+        else:
+            fields = [self._set_field_alias('*')]
+
+        return Query(
+            self,
+            transition(State.INITIAL, State.SELECT),
+            Expression(
+                'SELECT {fields} FROM {{}}'.format(
+                    fields=', '.join(['{}'] * len(fields)),
+                ),
+                *fields,
+                self._table_name,
+            ),
+        )
 
-        self._set_name()
+    def join(self, other, on=None, kind='inner', prune=False):
+        """
+        Joins other model. Look at :meth:`~Join.join`
 
-    def _set_name(self):
-        for attr in dir(self):
-            if isinstance(getattr(self, attr), Field):
-                name = self._alias or self._name
-                getattr(self, attr).set_table_prefix(name, self._schema)
+        Args:
+            other (Model): Joined model, alias it to join a table twice
+                (**required**)
+            on (object): Join condition, required unless ``kind`` is
+                ``'cross'`` (``None`` - default)
+            kind (str): ``'inner'``, ``'left'``, ``'right'``, ``'full'`` or
+                ``'cross'`` (``'inner'`` - default)
+            prune (bool): Drop join from queries not referencing the model,
+                only set it for left joins of a model unique on the join key
+                (``False`` - default)
 
-    def __str__(self):
-        result = ' '.join(self._storage)
+        Returns:
+            Join: Joined models
+        """
+        return Join(self).join(other, on, kind, prune)
 
-        self.reset()
+    def _plan(self, clauses):
+        return clauses
 
-        return result
+    def compile(self, query, params=False, paramstyle='dollar'):
+        """
+        Freezes query of the model into template. Look at
+        :meth:`~Query.compile`
 
-    def reset(self):
-        self._state = Initial()
-        self._storage.clear()
+        Args:
+            query (Query): Query built by the model (**required**)
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style (``'dollar'`` - default)
 
-    def evaluate(self):
-        return self.__str__()
+        Returns:
+            Template: Compiled query
+        """
+        return query.compile(params, paramstyle)
 
-    @state_aware(Select)
-    def select(self, *fields):
-        if fields:
-            fields = list(map(self._set_field_alias, fields))
+    def stream(self, connection, batch_size=1000, fields=(), dialect=None):
+        """
+        Selects rows yielding them lazily. Look at :meth:`~Query.stream`
+
+        Args:
+            connection (object): DB-API connection or :class:`~Pool`
+                (**required**)
+            batch_size (int): Rows per round trip (``1000`` - default)
+            fields (tuple): Selected fields, all if empty (``()`` - default)
+            dialect (Dialect): Driver dialect, picked by connection if missing
+                (``None`` - default)
+
+        Returns:
+            generator: Rows as dicts keyed by field attribute names
+        """
+        return self.select(*fields).stream(connection, batch_size, dialect)
+
+    def paginate_after(
+            self,
+            cursor,
+            order_fields,
+            page_size,
+            fields=(),
+            descending=False,
+    ):
+        """
+        Selects page of rows following the cursor. Look at
+        :meth:`~Query.paginate_after`
+
+        Args:
+            cursor (str): Cursor of the previous page, ``None`` for the first
+                page (**required**)
+            order_fields (list): Fields or their attribute names (**required**)
+            page_size (int): Max rows per page (**required**)
+            fields (tuple): Selected fields, all if empty (``()`` - default)
+            descending (bool): Sort all order fields in descending order
+                (``False`` - default)
+
+        Returns:
+            tuple: Query of the page and :class:`~Cursor` building cursor
+                from the last row of the page
+        """
+        return self.select(*fields).paginate_after(
+            cursor,
+            order_fields,
+            page_size,
+            descending,
+        )
+
+    def insert_many(
+            self,
+            rows,
+            fields=None,
+            batch_size=1000,
+            max_bytes=1 << 20,
+            on_conflict=None,
+            update=None,
+            params=False,
+            paramstyle='dollar',
+    ):
+        """
+        Generates multi-row INSERT statements for rows
+
+        Args:
+            rows (iterable): Dicts keyed by field attribute names or tuples
+                of values in ``fields`` order (**required**)
+            fields (list): Inserted fields, defaults to keys of the first
+                dict row or to all model fields (``None`` - default)
+            batch_size (int): Max rows per statement (``1000`` - default)
+            max_bytes (int): Max UTF-8 size of inlined statement
+                (``1048576`` - default)
+            on_conflict (list): Conflict target fields (``None`` - default)
+            update (list): Fields updated on conflict, ``DO NOTHING`` if
+                empty (``None`` - default)
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style (``'dollar'`` - default)
+
+        Raises:
+            ValueError: in case of unknown fields or values not conforming
+                field constraints
+
+        Returns:
+            generator: SQL statements or SQL statements with parameters
+        """
+        columns, rows = self._row_columns(rows, fields)
+        if columns is None:
+            return iter(())
+
+        return insert_statements(
+            self._qualified_name,
+            columns,
+            rows,
+            batch_size=batch_size,
+            max_bytes=max_bytes,
+            on_conflict=None if on_conflict is None else self._columns(on_conflict),
+            update=self._columns(update or ()),
+            paramstyle=paramstyle if params else None,
+        )
+
+    def update_many(
+            self,
+            rows,
+            key,
+            fields=None,
+            batch_size=1000,
+            max_bytes=1 << 20,
+            params=False,
+            paramstyle='dollar',
+    ):
+        """
+        Generates ``UPDATE ... FROM (VALUES ...)`` statements setting rows
+        matched by key
+
+        Args:
+            rows (iterable): Dicts keyed by field attribute names or tuples
+                of values in ``fields`` order (**required**)
+            key (object): Key field, its attribute name or list of them
+                (**required**)
+            fields (list): Row fields including key ones, defaults to keys
+                of the first dict row or to all model fields
+                (``None`` - default)
+            batch_size (int): Max rows per statement (``1000`` - default)
+            max_bytes (int): Max UTF-8 size of inlined statement
+                (``1048576`` - default)
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style (``'dollar'`` - default)
+
+        Raises:
+            ValueError: in case of unknown fields, rows missing values or
+                no fields to set
+
+        Returns:
+            generator: SQL statements or SQL statements with parameters
+        """
+        if isinstance(key, (list, tuple)):
+            keys = [attr for attr, _ in self._columns(key)]
         else:
-            fields = [self._set_field_alias('*')]
+            keys = [attr for attr, _ in self._columns([key])]
+
+        columns, rows = self._row_columns(rows, fields)
+        if columns is None:
+            return iter(())
+
+        attrs = [attr for attr, _ in columns]
+        if not set(keys) <= set(attrs):
+            raise ValueError('rows miss key fields')
+        if set(attrs) <= set(keys):
+            raise ValueError('rows have no fields to update')
+
+        return update_statements(
+            self._table_name,
+            [(attr, getattr(self, attr)) for attr in attrs],
+            keys,
+            rows,
+            batch_size=batch_size,
+            max_bytes=max_bytes,
+            paramstyle=paramstyle if params else None,
+        )
+
+    def delete_where(
+            self,
+            field,
+            keys,
+            batch_size=10000,
+            params=False,
+            paramstyle='dollar',
+    ):
+        """
+        Generates ``DELETE`` statements removing rows with field in keys
+
+        Keys are consumed lazily by ``batch_size`` chunks, each one bound as
+        a single array, so all statements share one query template.
+
+        Args:
+            field (object): Key field or its attribute name (**required**)
+            keys (iterable): Key values (**required**)
+            batch_size (int): Max keys per statement (``10000`` - default)
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style (``'dollar'`` - default)
+
+        Raises:
+            ValueError: in case of unknown field
+
+        Returns:
+            generator: SQL statements or SQL statements with parameters
+        """
+        (attr, _), = self._columns([field])
+
+        return self._delete_statements(
+            getattr(self, attr),
+            iter(keys),
+            batch_size,
+            paramstyle if params else None,
+        )
 
-        self._storage.append(
-            'SELECT {fields} FROM {table}'.format(
-                fields=', '.join(map(str, fields)),
-                table=self._table_name,
+    def _delete_statements(self, field, keys, batch_size, paramstyle):
+        while True:
+            chunk = list(itertools.islice(keys, batch_size))
+            if not chunk:
+                return
+
+            yield self._cache.render(
+                Expression(
+                    'DELETE FROM {} WHERE {}',
+                    self._table_name,
+                    field.in_(chunk, strategy='any'),
+                ),
+                paramstyle,
             )
+
+    def copy_from(  # pylint: disable=redefined-builtin
+            self,
+            rows,
+            fields=None,
+            format='text',
+            chunk_size=1 << 16,
+    ):
+        """
+        Prepares ``COPY ... FROM STDIN`` bulk load of rows
+
+        Args:
+            rows (iterable): Dicts keyed by field attribute names or tuples
+                of values in ``fields`` order (**required**)
+            fields (list): Loaded fields, defaults to keys of the first
+                dict row or to all model fields (``None`` - default)
+            format (str): ``'text'``, ``'csv'`` or ``'binary'``
+                (``'text'`` - default)
+            chunk_size (int): Min size of yielded data chunk
+                (``65536`` - default)
+
+        Raises:
+            ValueError: in case of unknown format or fields
+            TypeError: in case binary format does not support field type
+
+        Returns:
+            tuple: COPY statement and generator of data chunks
+        """
+        columns, rows = self._row_columns(rows, fields)
+        if columns is None:
+            columns = self._columns(self._fields)
+
+        return (
+            copy_statement(self._qualified_name, columns, format),
+            copy_payload(columns, rows, format, chunk_size),
         )
 
-        return self
+    def insert_columns(
+            self,
+            data,
+            batch_size=1000,
+            max_bytes=1 << 20,
+            on_conflict=None,
+            update=None,
+            params=False,
+            paramstyle='dollar',
+    ):
+        """
+        Generates multi-row INSERT statements for columns of values
+
+        Columns are validated and encoded as a whole, NumPy arrays are
+        handled by array operations without building rows of Python objects
+        first. Look at :meth:`~Model.insert_many`
 
-    @state_aware(Where)
-    def where(self, clause):
-        self._storage.append('WHERE {clause}'.format(clause=clause))
+        Args:
+            data (dict): NumPy arrays or sequences of values keyed by fields
+                or their attribute names (**required**)
+            batch_size (int): Max rows per statement (``1000`` - default)
+            max_bytes (int): Max UTF-8 size of inlined statement
+                (``1048576`` - default)
+            on_conflict (list): Conflict target fields (``None`` - default)
+            update (list): Fields updated on conflict, ``DO NOTHING`` if
+                empty (``None`` - default)
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style (``'dollar'`` - default)
 
-        return self
+        Raises:
+            ValueError: in case of unknown fields, columns of different
+                length or values not conforming field constraints
 
-    @state_aware(GroupBy)
-    def group_by(self, field, *fields):
-        grouping_fields = [field]
-        grouping_fields.extend(list(fields))
+        Returns:
+            generator: SQL statements or SQL statements with parameters
+        """
+        columns = self._data_columns(data)
 
-        self._storage.append('GROUP BY {fields}'.format(
-            fields=', '.join(map(str, grouping_fields)),
-        ))
+        return columns_statements(
+            self._qualified_name,
+            columns,
+            column_values(columns, data.values()),
+            paramstyle=paramstyle if params else None,
+            batch_size=batch_size,
+            max_bytes=max_bytes,
+            on_conflict=None if on_conflict is None else self._columns(on_conflict),
+            update=self._columns(update or ()),
+        )
 
-        return self
+    def copy_columns(  # pylint: disable=redefined-builtin
+            self,
+            data,
+            format='text',
+            chunk_size=1 << 16,
+    ):
+        """
+        Prepares ``COPY ... FROM STDIN`` bulk load of columns of values.
+        Look at :meth:`~Model.copy_from`
 
-    @state_aware(OrderBy)
-    def order_by(self, field, *fields):
-        ordering_fields = [field]
-        ordering_fields.extend(list(fields))
+        Args:
+            data (dict): NumPy arrays or sequences of values keyed by fields
+                or their attribute names (**required**)
+            format (str): ``'text'``, ``'csv'`` or ``'binary'``
+                (``'text'`` - default)
+            chunk_size (int): Min size of yielded data chunk
+                (``65536`` - default)
 
-        self._storage.append('ORDER BY {fields}'.format(
-            fields=', '.join(map(str, ordering_fields)),
-        ))
+        Raises:
+            ValueError: in case of unknown format or fields, columns of
+                different length or values not conforming field constraints
+            TypeError: in case binary format does not support field type
 
-        return self
+        Returns:
+            tuple: COPY statement and generator of data chunks
+        """
+        columns = self._data_columns(data)
 
-    @state_aware(Limit)
-    def limit(self, limit):
-        self._storage.append('LIMIT {limit}'.format(limit=limit))
+        return (
+            copy_statement(self._qualified_name, columns, format),
+            columns_payload(
+                columns,
+                column_values(columns, data.values()),
+                format,
+                chunk_size,
+            ),
+        )
 
-        return self
+    def _data_columns(self, data):
+        if not data:
+            raise ValueError('no columns')
 
-    @state_aware(Offset)
-    def offset(self, offset):
-        self._storage.append('OFFSET {offset}'.format(offset=offset))
+        return self._columns(data)
 
-        return self
+    def _row_columns(self, rows, fields):
+        rows = iter(rows)
+        if fields is None:
+            first = next(rows, None)
+            if first is None:
+                return None, rows
+            rows = itertools.chain((first,), rows)
+            fields = list(first) if isinstance(first, dict) else list(self._fields)
+
+        return self._columns(fields), rows
+
+    def _columns(self, fields):
+        columns = []
+        for field in fields:
+            if isinstance(field, Field):
+                attr = self._attrs_by_name.get(field.name)
+            else:
+                attr = field
+
+            if attr not in self._fields:
+                raise ValueError('unknown field: {}'.format(
+                    getattr(field, 'name', field),
+                ))
+            columns.append((attr, self._fields[attr]))
+
+        return columns
 
     def _set_field_alias(self, field):
         if isinstance(field, Field):
-            field.set_table_prefix(self._name, self._schema)
-        else:
+            if getattr(field, '_table') is None and \
+                    getattr(field, '_node') is None:
+                field = self._bind(field)
+        elif self._alias is None:
             field = '{}.{}'.format(self._table_name, str(field))
+        else:
+            field = '{}.{}'.format(helpers.quote_identifier(self._alias), field)
 
         return field
-
-    @property
-    def _table_name(self):
-        return helpers.quote_literal(
-            '.'.join(filter(None, [self._schema, self._name]))
-        )
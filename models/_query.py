@@ -0,0 +1,277 @@
+"""Query module"""
+from .. import executors
+from ..expressions import Expression
+from ..expressions import Literal
+from ..states import State, state_aware
+from ._cursor import Cursor
+from ._template import Template
+
+
+def _literal(value):
+    return value if isinstance(value, Literal) else Literal(value)
+
+
+class Query:
+    """
+    Immutable query node
+
+    Every chained call returns a new node pointing to its parent, so partial
+    queries can be shared between threads and reused as bases.
+
+    Args:
+        model (Model): Queried model (**required**)
+        state (State): State reached by the clause (**required**)
+        clause (Expression): Query clause (**required**)
+        parent (Query): Preceding query node (``None`` - default)
+    """
+    __slots__ = ('_model', '_state', '_clause', '_parent')
+
+    def __init__(self, model, state, clause, parent=None):
+        self._model = model
+        self._state = state
+        self._clause = clause
+        self._parent = parent
+
+    def __repr__(self):
+        return "<Query '{}'>".format(self)
+
+    def __str__(self):
+        return self.evaluate()
+
+    @property
+    def _root(self):
+        clauses = []
+        node = self
+        while node is not None:
+            clauses.append(node._clause)
+            node = node._parent
+        clauses.reverse()
+        clauses = self._model._plan(clauses)  # pylint: disable=protected-access
+
+        return Expression(' '.join(['{}'] * len(clauses)), *clauses)
+
+    def _chain(self, state, template, *parts):
+        return self.__class__(
+            self._model,
+            state,
+            Expression(template, *parts),
+            self,
+        )
+
+    def evaluate(self, params=False, paramstyle='dollar'):
+        """
+        Renders query
+
+        Args:
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style: ``'dollar'`` ($1),
+                ``'numeric'`` (:1), ``'format'`` (%s) or ``'qmark'`` (?)
+                (``'dollar'`` - default)
+
+        Returns:
+            str|tuple: SQL query or SQL query with parameters tuple
+        """
+        # pylint: disable=protected-access
+        return self._model._cache.render(
+            self._root,
+            paramstyle if params else None,
+        )
+
+    def compile(self, params=False, paramstyle='dollar'):
+        """
+        Freezes query into template rendered with :class:`~Placeholder`
+        values
+
+        Args:
+            params (bool): Emit values as bind parameters (``False`` - default)
+            paramstyle (str): Placeholders style, look at :meth:`~Query.evaluate`
+                (``'dollar'`` - default)
+
+        Returns:
+            Template: Compiled query
+        """
+        paramstyle = paramstyle if params else None
+        # pylint: disable=protected-access
+        segments, literals = self._model._cache.compile(self._root, paramstyle)
+
+        return Template(segments, literals, paramstyle)
+
+    def stream(self, connection, batch_size=1000, dialect=None):
+        """
+        Runs query yielding rows lazily
+
+        Args:
+            connection (object): DB-API connection or :class:`~Pool`, the
+                latter gives asynchronous generator (**required**)
+            batch_size (int): Rows per round trip (``1000`` - default)
+            dialect (Dialect): Driver dialect, picked by connection if missing
+                (``None`` - default)
+
+        Returns:
+            generator: Rows as dicts keyed by field attribute names
+        """
+        if isinstance(connection, executors.Pool):
+            return connection.stream(self, batch_size)
+
+        return executors.stream(connection, self, batch_size, dialect)
+
+    async def fetch(self, pool):
+        """
+        Runs query through asyncio connections pool
+
+        Args:
+            pool (Pool): Connections pool (**required**)
+
+        Returns:
+            list: Rows as dicts keyed by field attribute names
+        """
+        return await pool.fetch(self)
+
+    @state_aware(State.WHERE)
+    def where(self, clause):
+        """
+        Filters rows by the clause
+
+        Args:
+            clause (object): Condition, e.g. field comparison or
+                :class:`~Clause` (**required**)
+
+        Raises:
+            ValueError: in case of impossible query state
+
+        Returns:
+            Query: New query node
+        """
+        return self._chain(State.WHERE, 'WHERE {}', clause)
+
+    @state_aware(State.GROUP_BY)
+    def group_by(self, field, *fields):
+        """
+        Groups rows by the fields
+
+        Args:
+            field (Field): Grouping field (**required**)
+            *fields: More grouping fields
+
+        Raises:
+            ValueError: in case of impossible query state
+
+        Returns:
+            Query: New query node
+        """
+        return self._chain(
+            State.GROUP_BY,
+            'GROUP BY {}'.format(', '.join(['{}'] * (len(fields) + 1))),
+            field,
+            *fields,
+        )
+
+    @state_aware(State.ORDER_BY)
+    def order_by(self, field, *fields):
+        """
+        Sorts rows by the fields
+
+        Args:
+            field (Field): Sorting field (**required**)
+            *fields: More sorting fields
+
+        Raises:
+            ValueError: in case of impossible query state
+
+        Returns:
+            Query: New query node
+        """
+        return self._chain(
+            State.ORDER_BY,
+            'ORDER BY {}'.format(', '.join(['{}'] * (len(fields) + 1))),
+            field,
+            *fields,
+        )
+
+    @state_aware(State.LIMIT)
+    def limit(self, limit):
+        """
+        Limits amount of rows
+
+        Args:
+            limit (int): Max amount of rows (**required**)
+
+        Raises:
+            ValueError: in case of impossible query state
+
+        Returns:
+            Query: New query node
+        """
+        return self._chain(State.LIMIT, 'LIMIT {}', _literal(limit))
+
+    @state_aware(State.OFFSET)
+    def offset(self, offset):
+        """
+        Skips rows
+
+        Args:
+            offset (int): Amount of skipped rows (**required**)
+
+        Raises:
+            ValueError: in case of impossible query state
+
+        Returns:
+            Query: New query node
+        """
+        return self._chain(State.OFFSET, 'OFFSET {}', _literal(offset))
+
+    def paginate_after(self, cursor, order_fields, page_size, descending=False):
+        """
+        Fetches page of rows following the cursor (keyset pagination)
+
+        Rows are sought with a row value comparison like
+        ``("a", "b") > ($1, $2)`` instead of skipping them with ``OFFSET``,
+        so with an index on order fields every page costs the same. Order
+        fields have to be not null and unique together, e.g. end with the
+        primary key.
+
+        Args:
+            cursor (str): Cursor of the previous page, ``None`` for the first
+                page (**required**)
+            order_fields (list): Fields or their attribute names (**required**)
+            page_size (int): Max rows per page (**required**)
+            descending (bool): Sort all order fields in descending order
+                (``False`` - default)
+
+        Raises:
+            ValueError: in case of unknown order fields, malformed cursor or
+                impossible query state
+
+        Returns:
+            tuple: Query of the page and :class:`~Cursor` building cursor
+                from the last row of the page
+        """
+        # pylint: disable=protected-access
+        codec = Cursor(self._model._columns(order_fields))
+        columns = [getattr(self._model, attr) for attr, _ in codec.fields]
+
+        query = self
+        if cursor is not None:
+            values = codec.decode(cursor)
+            seek = Expression(
+                '({columns}) {operator} ({columns})'.format(
+                    columns=', '.join(['{}'] * len(columns)),
+                    operator='<' if descending else '>',
+                ),
+                *columns,
+                *map(Literal, values),
+            )
+            if self._state == State.WHERE:
+                query = self._parent._chain(
+                    self._state,
+                    'WHERE ({}) AND {}',
+                    self._clause._children[0],
+                    seek,
+                )
+            else:
+                query = self.where(seek)
+
+        if descending:
+            columns = [Expression('{} DESC', column) for column in columns]
+
+        return query.order_by(*columns).limit(page_size), codec
@@ -0,0 +1,97 @@
+"""Compiled query template module"""
+from ..expressions import Literal
+from ..expressions import Placeholder
+from ._cache import splice
+
+
+class Template:
+    """
+    Query frozen into SQL text segments around named placeholders
+
+    Constant values are quoted once while compiling, so rendering only
+    splices quoted placeholder values into the precomputed segments.
+    Values of placeholders compared with fields are adapted and checked by
+    the fields as comparisons with values are.
+
+    Args:
+        segments (tuple): Template segments of the query (**required**)
+        literals (list): Literals in slots order (**required**)
+        paramstyle (str): Bind parameters style, ``None`` inlines values
+            (``None`` - default)
+    """
+    __slots__ = ('paramstyle', 'names', '_segments', '_params')
+
+    def __init__(self, segments, literals, paramstyle=None):
+        self.paramstyle = paramstyle
+        self.names = frozenset(
+            literal.name for literal in literals
+            if isinstance(literal, Placeholder)
+        )
+
+        if paramstyle is not None:
+            self._segments = segments
+            self._params = tuple(
+                literal if isinstance(literal, Placeholder) else literal.param
+                for literal in literals
+            )
+            return
+
+        folded = [segments[0]]
+        slots = []
+        for literal, segment in zip(literals, segments[1:]):
+            if isinstance(literal, Placeholder):
+                slots.append(literal)
+                folded.append(segment)
+            else:
+                folded[-1] += literal.sql + segment
+
+        self._segments = tuple(folded)
+        self._params = tuple(slots)
+
+    def __repr__(self):
+        return "<Template '{}'>".format(':?'.join(self._segments))
+
+    def render(self, **values):
+        """
+        Renders query with placeholder values
+
+        Args:
+            **values: Values of placeholders by their names
+
+        Raises:
+            ValueError: in case values do not match placeholders or do not
+                conform constraints of compared fields
+
+        Returns:
+            str|tuple: SQL query or SQL query with parameters tuple
+        """
+        if values.keys() != self.names:
+            raise ValueError('expected values of: {}, got: {}'.format(
+                ', '.join(sorted(self.names)),
+                ', '.join(sorted(values)),
+            ))
+
+        if self.paramstyle is None:
+            return splice(
+                self._segments,
+                [Literal.quote(_checked(slot, values)) for slot in self._params],
+            )
+
+        return self._segments[0], tuple(
+            Literal.adapt(_checked(param, values))
+            if isinstance(param, Placeholder) else param
+            for param in self._params
+        )
+
+
+def _checked(placeholder, values):
+    value = values[placeholder.name]
+    field = placeholder.field
+    if field is None or value is None:
+        return value
+
+    # pylint: disable=protected-access
+    value = field._adapt(value)
+    field._check_constraints(value)
+
+    return value
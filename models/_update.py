@@ -0,0 +1,79 @@
+"""Bulk update module"""
+from .. import helpers
+from ._insert import values_statements
+
+
+def update_statements(
+        table,
+        columns,
+        keys,
+        rows,
+        batch_size=1000,
+        max_bytes=1 << 20,
+        paramstyle=None,
+):
+    """
+    Generates ``UPDATE ... FROM (VALUES ...)`` statements updating many rows
+    per round trip. Look at :func:`values_statements`
+
+    Values are aliased ``v``, or ``v1``, ``v2``... if the updated table is
+    referenced as ``v``.
+
+    Args:
+        table (str): Quoted table name with alias if any (**required**)
+        columns (list): Pairs of field attribute name and field in rows
+            order, fields are bound to the table (**required**)
+        keys (list): Attribute names of key fields among ``columns``
+            (**required**)
+        rows (iterable): Dicts or tuples of values (**required**)
+        batch_size (int): Max rows per statement (``1000`` - default)
+        max_bytes (int): Max UTF-8 size of inlined statement
+            (``1048576`` - default)
+        paramstyle (str): Bind parameters style, ``None`` inlines values
+            (``None`` - default)
+
+    Returns:
+        generator: SQL statements or SQL statements with parameters tuples
+    """
+    # pylint: disable=protected-access
+    taken = {field._table for _, field in columns}
+    alias = 'v'
+    suffix = 0
+    while alias in taken:
+        suffix += 1
+        alias = 'v{}'.format(suffix)
+
+    def value(field):
+        return '{}.{}'.format(alias, helpers.quote_identifier(field.name))
+
+    names = [helpers.quote_identifier(field.name) for _, field in columns]
+
+    return values_statements(
+        'UPDATE {} SET {} FROM (VALUES '.format(
+            table,
+            ', '.join(
+                '{} = {}'.format(name, value(field))
+                for name, (attr, field) in zip(names, columns)
+                if attr not in keys
+            ),
+        ),
+        ') AS {}({}) WHERE {}'.format(
+            alias,
+            ', '.join(names),
+            ' AND '.join(
+                '{} = {}'.format(field, value(field))
+                for attr, field in columns if attr in keys
+            ),
+        ),
+        columns,
+        rows,
+        batch_size,
+        max_bytes,
+        paramstyle,
+        # VALUES columns take types of the first row
+        casts=[
+            '' if field._sql_type is None else '::' + field._sql_type
+            for _, field in columns
+        ],
+        defaults=False,
+    )
@@ -1,8 +1,5 @@
-from ._group_by import GroupBy
-from ._initial import Initial
-from ._limit import Limit
-from ._offset import Offset
-from ._order_by import OrderBy
-from ._select import Select
+from ._state import State
+from ._state import TRANSITIONS
+from ._state import possible_states
 from ._state import state_aware
-from ._where import Where
+from ._state import transition
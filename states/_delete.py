@@ -1,5 +0,0 @@
-from ._state import State
-
-
-class Delele(State):
-    pass
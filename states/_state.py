@@ -1,45 +1,157 @@
 """State module"""
+import enum
 import functools
 
 
-def state_aware(state):
+class State(enum.IntEnum):
+    """
+    Query building state, the last clause added to the query
+    """
+    INITIAL = 0
+    WITH = 1
+    SELECT = 2
+    INSERT = 3
+    UPDATE = 4
+    DELETE = 5
+    JOIN = 6
+    WHERE = 7
+    GROUP_BY = 8
+    HAVING = 9
+    ORDER_BY = 10
+    LIMIT = 11
+    OFFSET = 12
+    FINITE = 13
 
-    def _state_aware(decorated):
+    def __str__(self):
+        return self.name
 
-        @functools.wraps(decorated)
-        def wrapper(*args, **kwargs):
 
-            if args:
-                current_state = getattr(args[0], '_state')
-                if isinstance(current_state, state):
-                    return args[0]
+_TRANSITIONS = {
+    State.INITIAL: (
+        State.WITH,
+        State.SELECT,
+        State.INSERT,
+        State.UPDATE,
+        State.DELETE,
+        State.JOIN,
+    ),
+    State.WITH: (
+        State.WITH,
+        State.SELECT,
+        State.INSERT,
+        State.UPDATE,
+        State.DELETE,
+        State.JOIN,
+    ),
+    State.SELECT: (
+        State.WHERE,
+        State.GROUP_BY,
+        State.ORDER_BY,
+        State.LIMIT,
+        State.OFFSET,
+        State.FINITE,
+    ),
+    State.INSERT: (State.FINITE,),
+    State.UPDATE: (State.FINITE,),
+    State.DELETE: (State.FINITE,),
+    State.JOIN: (State.JOIN, State.SELECT),
+    State.WHERE: (
+        State.GROUP_BY,
+        State.ORDER_BY,
+        State.LIMIT,
+        State.OFFSET,
+        State.FINITE,
+    ),
+    State.GROUP_BY: (
+        State.HAVING,
+        State.ORDER_BY,
+        State.LIMIT,
+        State.OFFSET,
+        State.FINITE,
+    ),
+    State.HAVING: (State.ORDER_BY, State.LIMIT, State.OFFSET, State.FINITE),
+    State.ORDER_BY: (State.LIMIT, State.OFFSET, State.FINITE),
+    State.LIMIT: (State.OFFSET, State.FINITE),
+    State.OFFSET: (State.FINITE,),
+    State.FINITE: (),
+}
 
-                try:
-                    setattr(args[0], '_state', current_state.set_state(state))
-                except ValueError:
-                    args[0].reset()
-                    raise
+# bitmask of states reachable from each state, indexed by state
+TRANSITIONS = tuple(
+    functools.reduce(
+        lambda mask, state: mask | 1 << state,
+        _TRANSITIONS[state],
+        0,
+    )
+    for state in State
+)
 
-            return decorated(*args, **kwargs)
 
-        return wrapper
+def possible_states(state):
+    """
+    Lists states reachable from the state
 
-    return _state_aware
+    Args:
+        state (State): Current state (**required**)
 
+    Returns:
+        tuple: Reachable states
+    """
+    return _TRANSITIONS[state]
 
-class State:
-    def __str__(self):
-        return self.__class__.__name__
 
-    @property
-    def possible_states(self):
-        raise NotImplementedError
+def transition(state, next_state):
+    """
+    Validates transition between states
+
+    Args:
+        state (State): Current state (**required**)
+        next_state (State): Reached state (**required**)
+
+    Raises:
+        ValueError: in case next state is not reachable from the current one
+
+    Returns:
+        State: Reached state
+    """
+    if not TRANSITIONS[state] >> next_state & 1:
+        raise ValueError('Impossible action: {} -> {}'.format(
+            State(state),
+            State(next_state),
+        ))
+
+    return next_state
+
 
-    def set_state(self, state):
-        if state not in self.possible_states:
-            raise ValueError('Impossible action: {} -> {}'.format(
-                str(self),
-                str(state()),
-            ))
+def state_aware(state):
+    """
+    Guards transition of immutable node into ``state``
+
+    Decorated method keeps its signature and returns a new node in
+    ``state``, the node itself is left untouched. Repeated transition into
+    the same state returns the node without calling the method.
+
+    Args:
+        state (State): State reached by decorated method (**required**)
+    """
+    mask = 1 << state
+
+    def _state_aware(decorated):
+
+        @functools.wraps(decorated)
+        def wrapper(node, *args, **kwargs):
+            current_state = getattr(node, '_state')
+            if current_state == state:
+                return node
+
+            if not TRANSITIONS[current_state] & mask:
+                raise ValueError('Impossible action: {} -> {}'.format(
+                    State(current_state),
+                    state,
+                ))
+
+            return decorated(node, *args, **kwargs)
 
-        return state()
+        return wrapper
+
+    return _state_aware
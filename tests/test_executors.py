@@ -0,0 +1,232 @@
+import asyncio
+import datetime
+import decimal
+import sqlite3
+
+import pytest
+
+from .. import fields
+from ..executors import Dialect
+from ..executors import Pool
+from ..executors import PreparedStatements
+from ..executors import SqliteConnection
+from ..executors import SqliteDialect
+from ..executors import dialect_for
+from ..executors import statement_name
+from ..models import Model
+
+
+class Payment(Model):
+    id_ = fields.Integer('id')
+    amount = fields.Decimal('amount')
+    paid = fields.Timestamp('paid')
+
+
+@pytest.fixture()
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE payments (id INTEGER, amount TEXT, paid TEXT)')
+    connection.executemany('INSERT INTO payments VALUES (?, ?, ?)', [
+        (number, str(number * 10), '2024-01-{:02} 00:00:00'.format(number))
+        for number in range(1, 11)
+    ])
+
+    yield connection
+
+    connection.close()
+
+
+class _Cursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.fetches = []
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchmany(self, size):
+        rows = self._cursor.fetchmany(size)
+        self.fetches.append(len(rows))
+
+        return rows
+
+
+class _Dialect(SqliteDialect):
+    __slots__ = ('cursors',)
+
+    def __init__(self):
+        super(_Dialect, self).__init__()
+        self.cursors = []
+
+    def cursor(self, connection, batch_size):
+        self.cursors.append(_Cursor(
+            super(_Dialect, self).cursor(connection, batch_size),
+        ))
+
+        return self.cursors[-1]
+
+
+def test_stream(connection):
+    payments = Payment('payments')
+    dialect = _Dialect()
+
+    rows = payments.stream(connection, batch_size=4, dialect=dialect)
+    assert not dialect.cursors
+    assert next(rows) == {
+        'id_': 1,
+        'amount': '10',
+        'paid': '2024-01-01 00:00:00',
+    }
+    assert len(list(rows)) == 9
+    assert dialect.cursors[0].fetches == [4, 4, 2, 0]
+
+    assert list(payments.select(payments.id_, payments.id_.count()).where(
+        payments.paid >= datetime.datetime(2024, 1, 9),
+    ).group_by(payments.id_).stream(connection)) == [
+        {'id_': 9, 'count("payments"."id")': 1},
+        {'id_': 10, 'count("payments"."id")': 1},
+    ]
+
+
+def test_dialects(connection):
+    assert isinstance(dialect_for(connection), SqliteDialect)
+    assert SqliteDialect().adapt((
+        decimal.Decimal('1.5'),
+        datetime.date(2024, 1, 2),
+        3,
+    )) == ('1.5', '2024-01-02', 3)
+
+    named = Dialect('server', 'format', named_cursors=True)
+    with pytest.raises(TypeError):
+        # sqlite3 keeps results on the client only
+        named.cursor(connection, 100)
+
+
+def test_async_pool(connection):
+    database = 'file:test_async_pool?mode=memory&cache=shared'
+    keeper = sqlite3.connect(database, uri=True)
+    keeper.executescript(''.join(connection.iterdump()))
+
+    payments = Payment('payments')
+
+    async def run():
+        pool = Pool(
+            lambda: SqliteConnection.connect(database, uri=True),
+            max_size=2,
+            acquire_timeout=0.05,
+        )
+        async with pool:
+            rows = await payments.select(payments.id_).where(
+                payments.id_ > 8,
+            ).fetch(pool)
+            assert rows == [{'id_': 9}, {'id_': 10}]
+
+            streamed = [
+                row['id_'] async for row in payments.stream(pool, batch_size=3)
+            ]
+            assert streamed == list(range(1, 11))
+
+            results = await asyncio.gather(*(
+                payments.select(payments.id_).where(
+                    payments.id_ == number,
+                ).fetch(pool)
+                for number in range(1, 21)
+            ))
+            assert [len(result) for result in results] == [1] * 10 + [0] * 10
+            assert pool.size == 2
+
+            assert await pool.pipeline(
+                payments.select(payments.amount).where(payments.id_ == number)
+                for number in (1, 2)
+            ) == [[{'amount': '10'}], [{'amount': '20'}]]
+
+            async with pool.acquire(), pool.acquire():
+                with pytest.raises(asyncio.TimeoutError):
+                    await pool.fetch(payments.select())
+
+            with pytest.raises(sqlite3.OperationalError):
+                await Payment('missing').select().fetch(pool)
+            assert pool.size == 2
+
+            with pytest.raises(ConnectionError):
+                async with pool.acquire():
+                    raise ConnectionError
+            assert pool.size == 1
+
+            async with pool.acquire():
+                await pool.close()
+                assert pool.size == 1
+
+        assert pool.size == 0
+
+        with pytest.raises(ValueError):
+            await pool.fetch(payments.select())
+
+    try:
+        asyncio.run(run())
+    finally:
+        keeper.close()
+
+
+class _Recorder:
+    """DB-API connection recording statements, sqlite3 can not PREPARE"""
+
+    def __init__(self, fail_on=None):
+        self.executed = []
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=None):
+        if self.fail_on is not None and sql.startswith(self.fail_on):
+            raise RuntimeError(sql)
+        self.executed.append((sql, params))
+
+    def close(self):
+        pass
+
+
+def test_prepared_statements():
+    payments = Payment('payments')
+    registry = PreparedStatements(maxsize=2)
+    connection = _Recorder()
+
+    def lookup(number):
+        return payments.select(payments.amount).where(payments.id_ == number)
+
+    name = statement_name(
+        'SELECT "payments"."amount" FROM "payments" WHERE "payments"."id" = $1',
+    )
+    assert registry.statements(connection, lookup(1)) == [
+        ('PREPARE {} AS SELECT "payments"."amount" FROM "payments" '
+         'WHERE "payments"."id" = $1'.format(name), None),
+        ('EXECUTE {}(1)'.format(name), None),
+    ]
+    assert registry.statements(connection, lookup(2), 'format') == [
+        ('EXECUTE {}(%s)'.format(name), (2,)),
+    ]
+
+    registry.statements(connection, payments.select())
+    statements = registry.statements(connection, payments.select(payments.id_))
+    assert statements[0] == ('DEALLOCATE {}'.format(name), None)
+    assert name not in registry.prepared(connection)
+    assert len(registry.prepared(connection)) == 2
+
+    other = _Recorder(fail_on='PREPARE')
+    dialect = Dialect('recorder', 'format')
+    with pytest.raises(RuntimeError):
+        registry.execute(other, lookup(3), dialect)
+    assert registry.prepared(other) == []
+
+    other.fail_on = None
+    registry.execute(other, lookup(3), dialect)
+    registry.execute(other, lookup(4), dialect)
+    assert [sql.split(' ')[0] for sql, _ in other.executed] == \
+        ['PREPARE', 'EXECUTE', 'EXECUTE']
+    assert other.executed[-1] == ('EXECUTE {}(%s)'.format(name), (4,))
+
+    batch = payments.select().where(payments.id_.in_([1, 2], strategy='any'))
+    assert PreparedStatements().statements(connection, batch)[-1][0].endswith(
+        '(ARRAY[1, 2])',
+    )
@@ -0,0 +1,46 @@
+import functools
+import operator
+
+from .. import fields
+from ..expressions import Clause
+
+
+def test_clause_junctions():
+    age = fields.Integer('age')
+    name = fields.Varchar('name', max_length=32)
+
+    adult = Clause(age >= 18)
+    john = Clause(name == 'John')
+    jane = Clause(name == 'Jane')
+
+    assert str(adult & john) == '"age" >= 18 AND "name" = \'John\''
+    assert str(adult & (john | jane)) == \
+        '"age" >= 18 AND ("name" = \'John\' OR "name" = \'Jane\')'
+    assert str(adult | john | jane) == \
+        '("age" >= 18 OR "name" = \'John\' OR "name" = \'Jane\')'
+    assert str((adult & john) & (adult & jane)) == \
+        '"age" >= 18 AND "name" = \'John\' AND "age" >= 18 AND "name" = \'Jane\''
+
+
+def test_shared_clause_prefix():
+    age = fields.Integer('age')
+    base = Clause(age > 1) & Clause(age < 10)
+
+    left = base & Clause(age == 5)
+    right = base & Clause(age == 7)
+
+    assert str(left) == '"age" > 1 AND "age" < 10 AND "age" = 5'
+    assert str(right) == '"age" > 1 AND "age" < 10 AND "age" = 7'
+    assert str(base) == '"age" > 1 AND "age" < 10'
+
+
+def test_long_clause_chain():
+    age = fields.Integer('age')
+    clause = functools.reduce(
+        operator.or_,
+        (Clause(age == number) for number in range(5000)),
+    )
+
+    sql = str(clause)
+    assert sql.startswith('("age" = 0 OR "age" = 1 OR ')
+    assert sql.endswith(' OR "age" = 4999)')
@@ -0,0 +1,150 @@
+import decimal
+import uuid
+
+import pytest
+
+from .. import fields
+from ..expressions import Expression
+
+
+def test_unsupported_operand():
+    with pytest.raises(TypeError) as error:
+        fields.Integer('age') > object()
+
+    assert str(error.value) == \
+        "unsupported operand type(s) for >: 'Integer' and 'object'"
+
+
+def test_operand_dispatch():
+    age = fields.Integer('age')
+
+    assert str(age + Expression('now()')) == '"age" + now()'
+    assert str(age > True) == '"age" > \'true\''
+
+
+def test_register_adapter():
+    class Uuid(fields.Text):
+        _type = 'uuid'
+
+    value = uuid.UUID(int=1)
+    with pytest.raises(TypeError):
+        Uuid('id') == value
+
+    Uuid.register_adapter(uuid.UUID, str)
+    assert str(Uuid('id') == value) == \
+        '"id" = \'00000000-0000-0000-0000-000000000001\''
+
+    with pytest.raises(TypeError):
+        fields.Text('id') == value
+
+    class Code(fields.Varchar):
+        pass
+
+    Code.register_adapter(uuid.UUID, str)
+    code = Code('code', max_length=36)
+    assert str(code == value) == \
+        '"code" = \'00000000-0000-0000-0000-000000000001\''
+    assert str(code.in_([value])) == \
+        '"code" IN (\'00000000-0000-0000-0000-000000000001\')'
+
+    with pytest.raises(ValueError):
+        Code('code', max_length=8) == value
+
+
+def test_expression_nodes():
+    balance = fields.Decimal('balance', table='users')
+
+    assert str((balance + 1) * 2) == '("users"."balance" + 1) * 2'
+    assert str(balance * 2 + 1) == '"users"."balance" * 2 + 1'
+    assert str(balance.cast('int') + 1) == 'cast("users"."balance" as int) + 1'
+    assert str((balance + 1).sqrt().set_alias('root')) == \
+        'sqrt("users"."balance" + 1) AS "root"'
+    assert not hasattr(balance * 2, '__dict__')
+
+
+def test_deep_expression():
+    value = fields.Integer('value')
+    for number in range(10000):
+        value = value + number
+
+    sql = str(value)
+    assert sql.startswith('"value" + 0 + 1 + 2')
+    assert sql.endswith('+ 9998 + 9999')
+
+
+def test_in_list():
+    age = fields.Integer('age')
+    name = fields.Varchar('name', max_length=8)
+
+    assert str(age.in_([3, 1, 2, 3])) == '"age" IN (1, 2, 3)'
+    assert str(name.not_in(['b', 'a'], strategy='values')) == \
+        '"name" NOT IN (VALUES (\'a\'), (\'b\'))'
+    assert str(age.in_(range(101))).startswith(
+        '"age" = ANY(cast(ARRAY[0, 1, 2, ',
+    )
+    assert str(age.not_in([1], strategy='any')) == \
+        '"age" <> ALL(cast(ARRAY[1] as integer[]))'
+    assert str(age.in_([])) == 'false'
+    assert str(age.in_(value for value in [None, 2, 1])) == '"age" IN (1, 2)'
+    assert str(age.not_in([None, 1])) == '"age" NOT IN (1)'
+    assert str(fields.Char('code', max_length=3).in_(['abc'], strategy='any')) == \
+        '"code" = ANY(cast(ARRAY[\'abc\'] as char(3)[]))'
+    assert str(fields.Serial('id').in_([1], strategy='any')) == \
+        '"id" = ANY(cast(ARRAY[1] as integer[]))'
+    assert str(age.not_in(set())) == 'true'
+
+    assert age.in_(range(101))._as_node()._key == \
+        age.in_(range(5000, 0, -1))._as_node()._key
+
+    with pytest.raises(ValueError):
+        age.in_([1], strategy='join')
+
+    with pytest.raises(ValueError):
+        name.in_(['too long name'])
+
+    with pytest.raises(ValueError):
+        age.in_(iter([[2], [1]]))
+
+
+def test_function_wrapping():
+    price = fields.Decimal('price', table='goods').set_alias('p')
+    wrapped = price.sqrt().avg().round(2)
+
+    assert str(wrapped) == 'round(avg(sqrt("goods"."price")), 2) AS "p"'
+    assert str(price) == '"goods"."price" AS "p"'
+    assert str(price.cast('text').count()) == \
+        'count(cast("goods"."price" as text)) AS "p"'
+
+    nested = fields.Decimal('x')
+    for _ in range(5000):
+        nested = abs(nested)
+    assert str(nested).count('abs(') == 5000
+
+
+def test_validate_many():
+    amount = fields.Double('amount')
+    values = [
+        1.5,
+        None,
+        decimal.Decimal('123456789012345.5'),
+        decimal.Decimal('1E+16'),
+        0.1 ** 15,
+        float('nan'),
+        '12.25',
+        'twelve',
+        -2 ** 60,
+    ]
+
+    assert amount.validate_many(values).tolist() == [3, 4, 5, 7, 8]
+    assert amount.validate_many(iter([1, 2, None])).tolist() == []
+
+    count = fields.Integer('count')
+    assert count.validate_many([-2 ** 31, None, 2 ** 31 - 1]).tolist() == []
+    assert count.validate_many([0, 2 ** 31, -2 ** 31 - 1]).tolist() == [1, 2]
+    assert count.validate_many([1, 2.5, 3.0]).tolist() == [1]
+
+    name = fields.Varchar('name', max_length=3)
+    assert name.validate_many(['abc', None, 'abcd', 7, '']).tolist() == [2, 3]
+
+    with pytest.raises(ValueError):
+        count == 2 ** 31
@@ -1,9 +1,19 @@
+import datetime
+import decimal
+import inspect
+import struct
+
 import pytest
 
 from .. import fields
-# from ..expressions import Clause
+from ..expressions import Clause
 # from ..expressions import Expression
+from ..expressions import Interval
+from ..expressions import Placeholder
 from ..models import Model
+from ..models import QueryCache
+from ..states import State
+from ..states import transition
 
 
 @pytest.fixture()
@@ -38,3 +48,583 @@ def test_simple_select(user_model):
     #     (17 - user_model.age + 15).set_alias('new_age'),
     # ).evaluate() == 'SELECT "users"."name" || \' <- NAME\' AS "new_name", ' + \
     #     '17 - "users"."age" + 15 AS "new_age" FROM "users"'
+
+
+def test_query_cache(user_model):
+    cache = QueryCache(maxsize=2)
+    user_model._cache = cache
+
+    for age in (18, 21):
+        assert user_model.select(user_model.name).where(
+            user_model.age > age,
+        ).limit(age).evaluate() == 'SELECT "users"."name" FROM "users" ' + \
+            'WHERE "users"."age" > {age} LIMIT {age}'.format(age=age)
+
+    assert cache.info() == (1, 1, 0, 2, 1)
+
+    assert user_model.select(
+        user_model.name + "'; --",
+    ).evaluate() == 'SELECT "users"."name" || \'\'\'; --\' FROM "users"'
+    assert user_model.select().evaluate() == 'SELECT "users".* FROM "users"'
+
+    assert cache.info() == (1, 3, 1, 2, 2)
+
+
+def test_parameterized_select(user_model):
+    assert user_model.select(user_model.name).where(
+        Clause(user_model.age > 18) & Clause(user_model.name == 'John'),
+    ).limit(10).evaluate(params=True) == (
+        'SELECT "users"."name" FROM "users" '
+        'WHERE "users"."age" > $1 AND "users"."name" = $2 LIMIT $3',
+        (18, 'John', 10),
+    )
+
+    assert user_model.select(
+        user_model.age.count(),
+    ).where(
+        user_model.age > Interval(years=3),
+    ).evaluate(params=True, paramstyle='format') == (
+        'SELECT count("users"."age") FROM "users" '
+        'WHERE "users"."age" > %s::interval',
+        ('3 years',),
+    )
+
+    with pytest.raises(ValueError):
+        user_model.select().evaluate(params=True, paramstyle='unknown')
+
+
+def test_query_reuse(user_model):
+    base = user_model.select(user_model.name).where(user_model.age > 18)
+
+    assert base.limit(5).evaluate() == 'SELECT "users"."name" FROM "users" ' + \
+        'WHERE "users"."age" > 18 LIMIT 5'
+    assert base.order_by(user_model.name).evaluate() == \
+        'SELECT "users"."name" FROM "users" WHERE "users"."age" > 18 ' + \
+        'ORDER BY "users"."name"'
+    assert base.evaluate() == \
+        'SELECT "users"."name" FROM "users" WHERE "users"."age" > 18'
+
+    assert base.where(user_model.age > 21) is base
+
+    with pytest.raises(ValueError):
+        base.limit(5).where(user_model.age > 21)
+
+    with pytest.raises(ValueError, match='INSERT -> WHERE'):
+        transition(State.INSERT, State.WHERE)
+
+    assert list(inspect.signature(type(base).where).parameters) == \
+        ['self', 'clause']
+    assert type(base).limit.__doc__
+
+
+def test_aliased_models(user_model):
+    model = type(user_model)
+    left = model('users', alias='l')
+    right = model('users', alias='r')
+
+    assert left.select(left.name, right.name).evaluate() == \
+        'SELECT "l"."name", "r"."name" FROM "users" AS "l"'
+    assert right.select().evaluate() == 'SELECT "r".* FROM "users" AS "r"'
+    assert user_model.select(model.name).evaluate() == \
+        'SELECT "users"."name" FROM "users"'
+    assert str(model.name) == '"name"'
+    assert list(model._fields) == ['id_', 'name', 'surname', 'age']
+
+
+def test_quoted_identifiers():
+    class Event(Model):
+        kind = fields.Integer('kind."v2"')
+
+    events = Event('event.log', alias='e"1', schema='app')
+
+    assert events.select(events.kind).evaluate() == \
+        'SELECT "e""1"."kind.""v2""" FROM "app"."event.log" AS "e""1"'
+    assert events.kind._as_node() is events.kind._as_node()
+
+    kind = events.kind.set_table_prefix('other', None).set_alias('k.1')
+    assert str(kind) == '"other"."kind.""v2""" AS "k.1"'
+    assert str(events.kind) == '"e""1"."kind.""v2"""'
+
+
+def test_shared_model_fields(user_model):
+    assert user_model.select(user_model.name.set_alias('n')).evaluate() == \
+        'SELECT "users"."name" AS "n" FROM "users"'
+    assert user_model.select(user_model.name).evaluate() == \
+        'SELECT "users"."name" FROM "users"'
+    assert str(user_model.name.upper()) == 'upper("users"."name")'
+
+
+def test_insert_many(user_model):
+    rows = ((index, 'John', 'Doe', 20 + index) for index in range(5))
+
+    assert list(user_model.insert_many(rows, batch_size=2)) == [
+        'INSERT INTO "users" ("id", "name", "surname", "age") VALUES '
+        "(0, 'John', 'Doe', 20), (1, 'John', 'Doe', 21)",
+        'INSERT INTO "users" ("id", "name", "surname", "age") VALUES '
+        "(2, 'John', 'Doe', 22), (3, 'John', 'Doe', 23)",
+        'INSERT INTO "users" ("id", "name", "surname", "age") VALUES '
+        "(4, 'John', 'Doe', 24)",
+    ]
+
+    statements = list(user_model.insert_many(
+        ({'id_': index, 'name': 'x' * 30} for index in range(100)),
+        max_bytes=256,
+    ))
+    assert len(statements) > 1
+    assert all(len(statement.encode()) <= 256 for statement in statements)
+    assert sum(statement.count('(') - 1 for statement in statements) == 100
+
+    assert list(user_model.insert_many(
+        [{'id_': 1, 'name': 'John'}, {'age': 30}],
+        fields=['id_', 'name', 'age'],
+        params=True,
+        on_conflict=['id_'],
+        update=['name', 'age'],
+    )) == [(
+        'INSERT INTO "users" ("id", "name", "age") VALUES '
+        '($1, $2, DEFAULT), (DEFAULT, DEFAULT, $3) '
+        'ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name", '
+        '"age" = EXCLUDED."age"',
+        (1, 'John', 30),
+    )]
+
+    assert list(user_model.insert_many(
+        [(1, None)],
+        fields=['id_', type(user_model).name],
+        on_conflict=['id_'],
+    )) == [
+        'INSERT INTO "users" ("id", "name") VALUES (1, NULL) '
+        'ON CONFLICT ("id") DO NOTHING',
+    ]
+
+    with pytest.raises(ValueError):
+        list(user_model.insert_many([(1, 'x' * 33)], fields=['id_', 'name']))
+
+    with pytest.raises(ValueError):
+        user_model.insert_many([(1,)], fields=['unknown'])
+
+
+def _decode_binary_copy(payload):
+    assert payload[:11] == b'PGCOPY\n\xff\r\n\x00'
+    offset = 19
+    rows = []
+    while True:
+        count, = struct.unpack_from('!h', payload, offset)
+        offset += 2
+        if count == -1:
+            assert offset == len(payload)
+            return rows
+
+        row = []
+        for _ in range(count):
+            size, = struct.unpack_from('!i', payload, offset)
+            offset += 4
+            if size == -1:
+                row.append(None)
+                continue
+            row.append(payload[offset:offset + size])
+            offset += size
+        rows.append(row)
+
+
+def test_copy_from():
+    class Payment(Model):
+        id_ = fields.BigInt('id')
+        note = fields.Text('note')
+        amount = fields.Decimal('amount')
+        paid = fields.Timestamp('paid')
+        raw = fields.Bytea('raw')
+
+    payments = Payment('payments', schema='billing')
+    rows = [
+        (1, 'tab\there', decimal.Decimal('-12345.0067'), None, b'\x00\xff'),
+        (2, 'a, "b"', 0, datetime.datetime(2000, 1, 2), b''),
+    ]
+
+    statement, payload = payments.copy_from(rows)
+    assert statement == 'COPY "billing"."payments" ' + \
+        '("id", "note", "amount", "paid", "raw") FROM STDIN'
+    assert b''.join(payload) == (
+        b'1\ttab\\there\t-12345.0067\t\\N\t\\\\x00ff\n'
+        b'2\ta, "b"\t0\t2000-01-02 00:00:00\t\\\\x\n'
+    )
+
+    statement, payload = payments.copy_from(rows, format='csv')
+    assert statement.endswith('FROM STDIN WITH (FORMAT csv)')
+    assert b''.join(payload) == (
+        b'1,tab\there,-12345.0067,,\\x00ff\n'
+        b'2,"a, ""b""",0,2000-01-02 00:00:00,\\x\n'
+    )
+
+    statement, payload = payments.copy_from(
+        iter(rows * 1000),
+        format='binary',
+        chunk_size=1024,
+    )
+    assert statement.endswith('FROM STDIN WITH (FORMAT binary)')
+    chunks = list(payload)
+    assert len(chunks) > 1
+    decoded = _decode_binary_copy(b''.join(chunks))
+    assert len(decoded) == 2000
+    assert decoded[0] == [
+        struct.pack('!q', 1),
+        b'tab\there',
+        # 1 2345 . 0067 base 10000 digits, weight 1, negative, scale 4
+        struct.pack('!hhHHHHH', 3, 1, 0x4000, 4, 1, 2345, 67),
+        None,
+        b'\x00\xff',
+    ]
+    assert decoded[1] == [
+        struct.pack('!q', 2),
+        b'a, "b"',
+        struct.pack('!hhHH', 0, 0, 0, 0),
+        struct.pack('!q', 86400 * 1000000),
+        b'',
+    ]
+
+    _, payload = payments.copy_from(
+        [{'amount': decimal.Decimal('0.00012')}, {'amount': -0.5}],
+        format='binary',
+    )
+    assert _decode_binary_copy(b''.join(payload)) == [
+        [struct.pack('!hhHHHH', 2, -1, 0, 5, 1, 2000)],
+        [struct.pack('!hhHHH', 1, -1, 0x4000, 1, 5000)],
+    ]
+
+    with pytest.raises(ValueError):
+        payments.copy_from(rows, format='xml')
+
+    with pytest.raises(ValueError):
+        list(payments.copy_from([{'id_': 1}], fields=['id_', 'note'])[1])
+
+    with pytest.raises(TypeError):
+        type('Custom', (Model,), {'value': fields.Field('value')})(
+            'custom',
+        ).copy_from([(1,)], format='binary')
+
+
+def test_copy_from_binary_coercion():
+    class Reading(Model):
+        count = fields.Integer('count')
+        value = fields.Decimal('value')
+        day = fields.Date('day')
+        taken = fields.Timestamp('taken')
+
+    readings = Reading('readings')
+
+    def binary(rows):
+        return b''.join(readings.copy_from(rows, format='binary')[1])
+
+    assert binary([('5', '1.5', '2020-01-01', '2020-01-01 10:00:00')]) == \
+        binary([(5, decimal.Decimal('1.5'), datetime.date(2020, 1, 1),
+                 datetime.datetime(2020, 1, 1, 10))])
+    assert binary([(5.0, None, None, None)]) == binary([(5, None, None, None)])
+
+    with pytest.raises(ValueError, match='day'):
+        binary([(None, None, '01/01/2020', None)])
+
+    with pytest.raises(ValueError, match='value'):
+        binary([(None, [1], None, None)])
+
+
+def test_keyset_pagination(user_model):
+    query, cursor = user_model.paginate_after(None, ['age', 'id_'], 20)
+    assert query.evaluate() == 'SELECT "users".* FROM "users" ' + \
+        'ORDER BY "users"."age", "users"."id" LIMIT 20'
+
+    token = cursor.encode({'id': 7, 'age': 30, 'name': 'John'})
+    assert cursor.decode(token) == (30, 7)
+    assert cursor.encode((30, 7)) == token
+
+    query, _ = user_model.select(user_model.name).where(
+        Clause(user_model.age > 18) | Clause(user_model.name == 'John'),
+    ).paginate_after(token, [user_model.age, 'id_'], 20, descending=True)
+    assert query.evaluate(params=True) == (
+        'SELECT "users"."name" FROM "users" WHERE '
+        '(("users"."age" > $1 OR "users"."name" = $2)) AND '
+        '("users"."age", "users"."id") < ($3, $4) '
+        'ORDER BY "users"."age" DESC, "users"."id" DESC LIMIT $5',
+        (18, 'John', 30, 7, 20),
+    )
+
+    moment = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    values = (moment, decimal.Decimal('1.50'), b'\x00')
+    codec = type(cursor)(cursor.fields + cursor.fields[:1])
+    assert codec.decode(codec.encode(values)) == values
+
+    with pytest.raises(ValueError):
+        cursor.decode('not a cursor')
+
+    with pytest.raises(ValueError):
+        cursor.decode(codec.encode(values))
+
+    with pytest.raises(ValueError):
+        user_model.paginate_after(None, ['unknown'], 20)
+
+
+def test_query_template(user_model):
+    query = user_model.select(user_model.name).where(
+        Clause(user_model.id_ == Placeholder('id')) &
+        Clause(user_model.surname == "O'Neil"),
+    ).limit(Placeholder('limit'))
+
+    template = user_model.compile(query)
+    assert template.render(id=5, limit=1) == \
+        'SELECT "users"."name" FROM "users" WHERE "users"."id" = 5 ' + \
+        'AND "users"."surname" = \'O\'\'Neil\' LIMIT 1'
+    assert template.render(id='5', limit=2).endswith(
+        '"users"."id" = \'5\' AND "users"."surname" = \'O\'\'Neil\' LIMIT 2',
+    )
+
+    with pytest.raises(ValueError):
+        template.render(id='1; --', limit=2)
+
+    named = user_model.compile(
+        user_model.select().where(user_model.name == Placeholder('name')),
+    )
+    assert named.render(name="'; --").endswith(
+        '"users"."name" = \'\'\'; --\'',
+    )
+
+    with pytest.raises(ValueError):
+        named.render(name='x' * 33)
+
+    template = query.compile(params=True, paramstyle='qmark')
+    assert template.render(limit=10, id=7) == (
+        'SELECT "users"."name" FROM "users" WHERE "users"."id" = ? '
+        'AND "users"."surname" = ? LIMIT ?',
+        (7, "O'Neil", 10),
+    )
+
+    with pytest.raises(ValueError):
+        template.render(id=7)
+
+    with pytest.raises(ValueError):
+        template.render(id='x', limit=10)
+
+    with pytest.raises(ValueError):
+        query.evaluate(params=True)
+
+
+def test_update_many(user_model):
+    rows = ({'id_': index, 'name': 'n{}'.format(index)} for index in range(3))
+
+    assert list(user_model.update_many(rows, key='id_', batch_size=2)) == [
+        'UPDATE "users" SET "name" = v."name" FROM (VALUES '
+        "(0::integer, 'n0'::char(32)), (1, 'n1')) AS v(\"id\", \"name\") "
+        'WHERE "users"."id" = v."id"',
+        'UPDATE "users" SET "name" = v."name" FROM (VALUES '
+        "(2::integer, 'n2'::char(32))) AS v(\"id\", \"name\") "
+        'WHERE "users"."id" = v."id"',
+    ]
+
+    assert list(type(user_model)('users', alias='u').update_many(
+        [(1, 'Doe', 30)],
+        key=['id_', 'surname'],
+        fields=['id_', 'surname', 'age'],
+        params=True,
+    )) == [(
+        'UPDATE "users" AS "u" SET "age" = v."age" FROM (VALUES '
+        '($1::integer, $2::char(32), $3::integer)) AS v("id", "surname", "age") '
+        'WHERE "u"."id" = v."id" AND "u"."surname" = v."surname"',
+        (1, 'Doe', 30),
+    )]
+
+    with pytest.raises(ValueError):
+        list(user_model.update_many([{'id_': 1}, {'name': 'x'}], key='id_'))
+
+    with pytest.raises(ValueError):
+        user_model.update_many([{'id_': 1}], key='id_')
+
+    with pytest.raises(ValueError):
+        user_model.update_many([{'name': 'x'}], key='id_')
+
+    class Account(Model):
+        id_ = fields.Serial('id')
+        balance = fields.Monetary('balance')
+
+    assert list(Account('accounts').update_many(
+        [(1, 10)],
+        key='id_',
+        fields=['id_', 'balance'],
+    )) == [
+        'UPDATE "accounts" SET "balance" = v."balance" FROM (VALUES '
+        '(1::integer, 10::money)) AS v("id", "balance") '
+        'WHERE "accounts"."id" = v."id"',
+    ]
+
+    for accounts in (Account('v'), Account('accounts', alias='v')):
+        assert list(accounts.update_many(
+            [(1, 10)],
+            key='id_',
+            fields=['id_', 'balance'],
+        ))[0].endswith(
+            '(1::integer, 10::money)) AS v1("id", "balance") '
+            'WHERE "v"."id" = v1."id"',
+        )
+
+
+def test_delete_where(user_model):
+    statements = user_model.delete_where(
+        'id_',
+        (key % 5 for key in range(7)),
+        batch_size=4,
+    )
+    assert next(statements) == 'DELETE FROM "users" WHERE ' + \
+        '"users"."id" = ANY(cast(ARRAY[0, 1, 2, 3] as integer[]))'
+    assert list(statements) == ['DELETE FROM "users" WHERE ' + \
+        '"users"."id" = ANY(cast(ARRAY[0, 1, 4] as integer[]))']
+
+    cache = QueryCache()
+    user_model._cache = cache
+    assert list(user_model.delete_where(
+        type(user_model).id_,
+        range(5),
+        batch_size=3,
+        params=True,
+        paramstyle='format',
+    )) == [
+        ('DELETE FROM "users" WHERE "users"."id" = ANY(cast(%s as integer[]))',
+         ([0, 1, 2],)),
+        ('DELETE FROM "users" WHERE "users"."id" = ANY(cast(%s as integer[]))',
+         ([3, 4],)),
+    ]
+    assert cache.info().misses == 1
+
+
+def test_joins(user_model):
+    class Order(Model):
+        id_ = fields.Integer('id')
+        user_id = fields.Integer('user_id')
+        total = fields.Decimal('total')
+
+    orders = Order('orders', schema='shop')
+    managers = type(user_model)('users', alias='m')
+    joined = user_model.join(
+        orders,
+        on=Clause(user_model.id_ == orders.user_id),
+    ).join(
+        managers,
+        on=Clause(managers.id_ == user_model.age),
+        kind='left',
+        prune=True,
+    )
+
+    inner = 'SELECT {} FROM "users" INNER JOIN "shop"."orders" ' + \
+        'ON "users"."id" = "shop"."orders"."user_id"'
+    left = ' LEFT JOIN "users" AS "m" ON "m"."id" = "users"."age"'
+
+    assert joined.select(Order.total).where(
+        user_model.name == 'John',
+    ).evaluate(params=True) == (
+        inner.format('"shop"."orders"."total"') + ' WHERE "users"."name" = $1',
+        ('John',),
+    )
+    assert joined.select(user_model.name, managers.name).evaluate() == \
+        inner.format('"users"."name", "m"."name"') + left
+    assert joined.select(user_model.id_).where(
+        managers.name == 'Jane',
+    ).evaluate() == inner.format('"users"."id"') + left + \
+        ' WHERE "m"."name" = \'Jane\''
+    assert joined.select().evaluate() == \
+        inner.format('"users".*, "shop"."orders".*, "m".*') + left
+    assert user_model.join(
+        managers,
+        on=Clause(managers.id_ == user_model.age),
+        kind='left',
+    ).select(user_model.name).evaluate() == \
+        'SELECT "users"."name" FROM "users"' + left
+
+    with pytest.raises(ValueError):
+        joined.select().paginate_after(None, ['id_'], 10)
+
+    with pytest.raises(ValueError):
+        user_model.join(orders, on=Clause(user_model.id_ == orders.user_id), kind='outer')
+
+    with pytest.raises(ValueError):
+        user_model.join(orders)
+
+    with pytest.raises(ValueError):
+        joined.join(Order('orders', schema='shop'), kind='cross')
+
+
+def test_insert_columns(user_model):
+    data = {'id_': [1, 2, None], type(user_model).name: ['a', "b'c", 'd']}
+
+    assert list(user_model.insert_columns(data, batch_size=2)) == [
+        'INSERT INTO "users" ("id", "name") VALUES (1, \'a\'), (2, \'b\'\'c\')',
+        'INSERT INTO "users" ("id", "name") VALUES (NULL, \'d\')',
+    ]
+    assert list(user_model.insert_columns(data, params=True)) == \
+        list(user_model.insert_many(
+            [dict(zip(['id_', 'name'], row)) for row in zip(*data.values())],
+            params=True,
+        ))
+
+    statement, payload = user_model.copy_columns(data)
+    assert statement == 'COPY "users" ("id", "name") FROM STDIN'
+    assert b''.join(payload) == b"1\ta\n2\tb'c\n\\N\td\n"
+
+    with pytest.raises(ValueError, match='id_ values .* rows: 0, 2'):
+        user_model.insert_columns({'id_': [2 ** 40, 1, -2 ** 40]})
+
+    with pytest.raises(ValueError, match='differ in length'):
+        user_model.insert_columns({'id_': [1], 'name': []})
+
+    with pytest.raises(ValueError):
+        user_model.copy_columns({'weight': [1]})
+
+
+def test_insert_columns_numpy(user_model):
+    numpy = pytest.importorskip('numpy')
+
+    class Point(Model):
+        x = fields.Integer('x')
+        y = fields.SmallInt('y')
+        weight = fields.Double('weight')
+
+    points = Point('points')
+    data = {
+        'x': numpy.arange(3, dtype=numpy.int64),
+        'y': numpy.array([5, 6, 7], dtype=numpy.int16),
+        'weight': numpy.array([0.5, 1.0, 2.25]),
+    }
+
+    _, payload = points.copy_columns(data, format='binary', chunk_size=1)
+    _, expected = points.copy_from(
+        [dict(zip(data, row)) for row in zip(*(c.tolist() for c in data.values()))],
+        format='binary',
+    )
+    assert b''.join(payload) == b''.join(expected)
+
+    assert list(user_model.insert_columns({
+        'id_': numpy.array([1, 2]),
+        'name': numpy.array(['a', 'b']),
+    })) == ['INSERT INTO "users" ("id", "name") VALUES (1, \'a\'), (2, \'b\')']
+
+    with pytest.raises(ValueError, match='rows: 1'):
+        user_model.insert_columns({'name': numpy.array(['a', 'b' * 40])})
+
+    with pytest.raises(ValueError, match='rows: 0'):
+        points.insert_columns({'y': numpy.array([40000, 1])})
+
+    class Event(Model):
+        day = fields.Date('day')
+        happened = fields.Timestamp('happened')
+
+    events = Event('events')
+    moments = numpy.array(['2020-01-01T10:00:00.000001', 'NaT'],
+                          dtype='datetime64[ns]')
+    assert list(events.insert_columns({
+        'day': moments.astype('datetime64[D]'),
+        'happened': moments,
+    })) == [
+        'INSERT INTO "events" ("day", "happened") VALUES '
+        "('2020-01-01', '2020-01-01 10:00:00.000001'), (NULL, NULL)",
+    ]
+    assert _decode_binary_copy(b''.join(
+        events.copy_columns({'happened': moments[:1]}, format='binary')[1],
+    )) == [[struct.pack('!q', 7305 * 86400 * 1000000 + 36000000001)]]
+
+    with pytest.raises(TypeError):
+        points.insert_columns({'x': moments})